@@ -6,6 +6,8 @@ import time
 from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from typing import Any, Union, Optional, Dict
 
+from humanfriendly import InvalidSize, parse_size
+
 from credsweeper import __version__
 from credsweeper.app import APP_PATH, CredSweeper
 from credsweeper.common.constants import ThresholdPreset, Severity, RuleType, DiffRowType
@@ -18,6 +20,14 @@ from credsweeper.utils import Util
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 
+# levels of --ml_optimization and names of onnxruntime.GraphOptimizationLevel members
+ML_OPTIMIZATION_LEVELS = {
+    "disable": "ORT_DISABLE_ALL",
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,6 +40,39 @@ def positive_int(value: Any) -> int:
     return int_value
 
 
+def positive_int_or_auto(value: str) -> Optional[int]:
+    """Returns None for "auto" to choose the value at runtime or checks a positive number"""
+    if "auto" == value.lower():
+        return None
+    return positive_int(value)
+
+
+def positive_size(value: str) -> int:
+    """Parses positive size in bytes from integer or human-readable format"""
+    try:
+        size = parse_size(value)
+    except InvalidSize as exc:
+        raise ArgumentTypeError(str(exc))
+    if size <= 0:
+        raise ArgumentTypeError(f"{value} should be greater than 0")
+    return size
+
+
+def ml_optimization_level(level: str) -> str:
+    """Level of --ml_optimization correctness verification and transformation
+
+    Args:
+        level: string with level
+
+    Returns name of onnxruntime.GraphOptimizationLevel member for the level
+    """
+    val = level.lower()
+    if val in ML_OPTIMIZATION_LEVELS:
+        return ML_OPTIMIZATION_LEVELS[val]
+    raise ArgumentTypeError(f"ML optimization level provided: {level} -- must be one of:"
+                            f" {' | '.join(ML_OPTIMIZATION_LEVELS.keys())}")
+
+
 def threshold_or_float(arg: str) -> Union[float, ThresholdPreset]:
     """Return ThresholdPreset or a float from the input string
 
@@ -159,6 +202,10 @@ def get_arguments() -> Namespace:
                         required=False,
                         metavar="POSITIVE_INT")
     parser.add_argument("--doc", help="document-specific scanning", dest="doc", action="store_true")
+    parser.add_argument("--buffer_scan",
+                        help="search rules in whole text of a file and analyze only lines with hits",
+                        dest="buffer_scan",
+                        action="store_true")
     parser.add_argument("--ml_threshold",
                         help="setup threshold for the ml model. "
                         "The lower the threshold - the more credentials will be reported. "
@@ -171,11 +218,79 @@ def get_arguments() -> Namespace:
                         metavar="FLOAT_OR_STR")
     parser.add_argument("--ml_batch_size",
                         "-b",
-                        help="batch size for model inference (default: 16)",
-                        type=positive_int,
+                        help="batch size for model inference, 'auto' chooses the fastest size on first candidates"
+                        " (default: 16)",
+                        type=positive_int_or_auto,
                         dest="ml_batch_size",
                         default=16,
                         required=False,
+                        metavar="POSITIVE_INT_OR_AUTO")
+    parser.add_argument("--ml_threads",
+                        help="number of threads of ONNX runtime to compute an operator of the model"
+                        " (default: chosen by ONNX runtime)",
+                        type=positive_int,
+                        dest="ml_threads",
+                        default=None,
+                        required=False,
+                        metavar="POSITIVE_INT")
+    parser.add_argument("--ml_inter_threads",
+                        help="number of threads of ONNX runtime to run operators of the model with --ml_parallel"
+                        " (default: chosen by ONNX runtime)",
+                        type=positive_int,
+                        dest="ml_inter_threads",
+                        default=None,
+                        required=False,
+                        metavar="POSITIVE_INT")
+    parser.add_argument("--ml_optimization",
+                        help=f"graph optimization level of ONNX runtime {list(ML_OPTIMIZATION_LEVELS.keys())}"
+                        " (default: all)",
+                        type=ml_optimization_level,
+                        dest="ml_optimization",
+                        default=None,
+                        required=False,
+                        metavar="LEVEL")
+    parser.add_argument("--ml_parallel",
+                        help="run independent operators of the model in parallel with ONNX runtime",
+                        dest="ml_parallel",
+                        action="store_true")
+    parser.add_argument("--ml_quantized",
+                        help="use ML model with int8 weights generated by experiment/quantize.py, it is lossy: it may"
+                        " be faster, but it changes decisions near the threshold and may drop true findings, --ml_cache"
+                        " and --ml_pipeline are not used",
+                        dest="ml_quantized",
+                        action="store_true")
+    parser.add_argument("--ml_cascade",
+                        help="experimental: decide obvious candidates with logistic regression and run ML model only"
+                        " for uncertain, weights of model config are distilled from tests/samples and may change"
+                        " decisions of ML model",
+                        dest="ml_cascade",
+                        action="store_true")
+    parser.add_argument("--ml_cascade_band",
+                        help="probabilities of the regression of --ml_cascade which require ML model"
+                        " (default: band of model config)",
+                        nargs=2,
+                        type=float,
+                        dest="ml_cascade_band",
+                        default=None,
+                        required=False,
+                        metavar=("LOWER", "UPPER"))
+    parser.add_argument("--ml_pipeline",
+                        help="run ML validation of candidates in a worker thread during the scan",
+                        dest="ml_pipeline",
+                        action="store_true")
+    parser.add_argument("--ml_cache",
+                        nargs="?",
+                        help="keep predictions of ML model between runs in SQLite file (default: ml_cache.sqlite)",
+                        const="ml_cache.sqlite",
+                        dest="ml_cache",
+                        metavar="PATH")
+    parser.add_argument("--ml_cache_size",
+                        help="maximal number of predictions in the file of --ml_cache,"
+                        " the least recently used are evicted (default: 1048576)",
+                        type=positive_int,
+                        dest="ml_cache_size",
+                        default=None,
+                        required=False,
                         metavar="POSITIVE_INT")
     parser.add_argument("--api_validation",
                         help="add credential api validation option to credsweeper pipeline. "
@@ -205,6 +320,17 @@ def get_arguments() -> Namespace:
                         const="output.xlsx",
                         dest="xlsx_filename",
                         metavar="PATH")
+    parser.add_argument("--filter-stats",
+                        nargs="?",
+                        help="save runtime statistics of filters to json file (default: filter_stats.json)",
+                        const="filter_stats.json",
+                        dest="filter_stats_filename",
+                        metavar="PATH")
+    parser.add_argument("--filter-profile",
+                        help="order filters of rules with statistics from a report of --filter-stats",
+                        default=None,
+                        dest="filter_profile",
+                        metavar="PATH")
     parser.add_argument("--log",
                         "-l",
                         help=f"provide logging level of {list(Logger.LEVELS.keys())}"
@@ -217,6 +343,13 @@ def get_arguments() -> Namespace:
                         help="set size limit of files that for scanning (eg. 1GB / 10MiB / 1000)",
                         dest="size_limit",
                         default=None)
+    parser.add_argument("--chunk_size",
+                        help="split text files larger than the size to chunks which are scanned in parallel with --jobs"
+                        " (eg. 64MiB / 1000000)",
+                        type=positive_size,
+                        dest="chunk_size",
+                        default=None,
+                        metavar="SIZE")
     parser.add_argument("--banner",
                         help="show version and crc32 sum of CredSweeper files at start",
                         action="store_const",
@@ -266,6 +399,16 @@ def scan(args: Namespace, content_provider: FilesProvider, json_filename: Option
         else:
             denylist = []
 
+        ml_session_options: Dict[str, Any] = {}
+        if args.ml_threads:
+            ml_session_options["intra_op_num_threads"] = args.ml_threads
+        if args.ml_inter_threads:
+            ml_session_options["inter_op_num_threads"] = args.ml_inter_threads
+        if args.ml_optimization:
+            ml_session_options["graph_optimization_level"] = args.ml_optimization
+        if args.ml_parallel:
+            ml_session_options["execution_mode"] = "ORT_PARALLEL"
+
         credsweeper = CredSweeper(rule_path=args.rule_path,
                                   config_path=args.config_path,
                                   api_validation=args.api_validation,
@@ -274,13 +417,24 @@ def scan(args: Namespace, content_provider: FilesProvider, json_filename: Option
                                   pool_count=args.jobs,
                                   ml_batch_size=args.ml_batch_size,
                                   ml_threshold=args.ml_threshold,
+                                  ml_pipeline=args.ml_pipeline,
+                                  ml_cache=args.ml_cache,
+                                  ml_cache_size=args.ml_cache_size,
+                                  ml_session_options=ml_session_options,
+                                  ml_quantized=args.ml_quantized,
+                                  ml_cascade=args.ml_cascade,
+                                  ml_cascade_band=args.ml_cascade_band,
                                   find_by_ext=args.find_by_ext,
                                   depth=args.depth,
                                   doc=args.doc,
+                                  buffer_scan=args.buffer_scan,
                                   severity=args.severity,
                                   size_limit=args.size_limit,
+                                  chunk_size=args.chunk_size,
                                   exclude_lines=denylist,
-                                  exclude_values=denylist)
+                                  exclude_values=denylist,
+                                  filter_stats_filename=args.filter_stats_filename,
+                                  filter_profile=args.filter_profile)
         return credsweeper.run(content_provider=content_provider)
     except Exception as exc:
         logger.critical(exc, exc_info=True)
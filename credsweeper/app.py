@@ -1,10 +1,8 @@
-import itertools
 import logging
-import multiprocessing
 import signal
 import sys
 from pathlib import Path
-from typing import Any, List, Optional, Union, Dict
+from typing import Any, List, Optional, Union, Dict, Tuple
 
 import pandas as pd
 
@@ -19,6 +17,7 @@ from credsweeper.file_handler.diff_content_provider import DiffContentProvider
 from credsweeper.file_handler.file_path_extractor import FilePathExtractor
 from credsweeper.file_handler.files_provider import FilesProvider
 from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.scan_pool import ScanPool, get_rule_table
 from credsweeper.scanner import Scanner
 from credsweeper.utils import Util
 from credsweeper.validations.apply_validation import ApplyValidation
@@ -35,6 +34,7 @@ class CredSweeper:
         pool_count: number of pools used to run multiprocessing scanning
         config: dictionary variable, stores analyzer features
         json_filename: string variable, credential candidates export filename
+        filter_stats_filename: string variable, filter statistics report filename
 
     """
 
@@ -48,13 +48,24 @@ class CredSweeper:
                  pool_count: int = 1,
                  ml_batch_size: Optional[int] = 16,
                  ml_threshold: Union[float, ThresholdPreset] = ThresholdPreset.medium,
+                 ml_pipeline: bool = False,
+                 ml_cache: Union[None, str, Path] = None,
+                 ml_cache_size: Optional[int] = None,
+                 ml_session_options: Optional[Dict[str, Any]] = None,
+                 ml_quantized: bool = False,
+                 ml_cascade: bool = False,
+                 ml_cascade_band: Optional[Tuple[float, float]] = None,
                  find_by_ext: bool = False,
                  depth: int = 0,
                  doc: bool = False,
+                 buffer_scan: bool = False,
                  severity: Optional[Severity] = None,
                  size_limit: Optional[str] = None,
+                 chunk_size: Optional[int] = None,
                  exclude_lines: Optional[List[str]] = None,
-                 exclude_values: Optional[List[str]] = None) -> None:
+                 exclude_values: Optional[List[str]] = None,
+                 filter_stats_filename: Union[None, str, Path] = None,
+                 filter_profile: Union[None, str, Path] = None) -> None:
         """Initialize Advanced credential scanner.
 
         Args:
@@ -70,39 +81,89 @@ class CredSweeper:
                 to xlsx
             use_filters: boolean variable, specifying the need of rule filters
             pool_count: int value, number of parallel processes to use
-            ml_batch_size: int value, size of the batch for model inference
+            ml_batch_size: int value, size of the batch for model inference, None - the fastest size is chosen
             ml_threshold: float or string value to specify threshold for the ml model
+            ml_pipeline: boolean - run ML validation of candidates in a worker thread during the scan
+            ml_cache: optional path of SQLite file to keep predictions of ML model between runs
+            ml_cache_size: optional int - maximal number of predictions in ml_cache file
+            ml_session_options: optional dictionary of onnxruntime.SessionOptions attributes for the model
+            ml_quantized: use the model with int8 weights which is generated with experiment/quantize.py, it is lossy:
+              it may be faster but changes decisions near the threshold, ml_cache and ml_pipeline are not used
+            ml_cascade: experimental - decide obvious groups with logistic regression and call the model only for
+              uncertain ones, weights of the regression are distilled from tests/samples
+            ml_cascade_band: optional lower and upper probabilities of the regression which require the model
             find_by_ext: boolean - files will be reported by extension
             depth: int - how deep container files will be scanned
             doc: boolean - document-specific scanning
+            buffer_scan: boolean - search rules in whole text of a file and analyze only lines with hits
             severity: Severity - minimum severity level of rule
             size_limit: optional string integer or human-readable format to skip oversize files
+            chunk_size: optional size in bytes - text files larger than the size are split to chunks of the size which
+              are scanned in parallel when pool_count is greater than 1
             exclude_lines: lines to omit in scan. Will be added to the lines already in config
             exclude_values: values to omit in scan. Will be added to the values already in config
+            filter_stats_filename: optional string variable, path to save runtime statistics of filters to json
+            filter_profile: optional path to a report of --filter-stats to order filters of rules at start
 
         """
         self.pool_count: int = int(pool_count) if int(pool_count) > 1 else 1
+        self.chunk_size = chunk_size
         config_dict = self._get_config_dict(config_path=config_path,
                                             api_validation=api_validation,
                                             use_filters=use_filters,
                                             find_by_ext=find_by_ext,
                                             depth=depth,
                                             doc=doc,
+                                            buffer_scan=buffer_scan,
                                             severity=severity,
                                             size_limit=size_limit,
                                             exclude_lines=exclude_lines,
-                                            exclude_values=exclude_values)
-        self.config = Config(config_dict)
-        self.scanner = Scanner(self.config, rule_path)
-        self.doc_scanner = Scanner(self.config, rule_path, ["doc"])
-        self.deep_scanner = DeepScanner(self.config, self.scanner)
-        self.deep_doc_scanner = DeepScanner(self.config, self.doc_scanner)
+                                            exclude_values=exclude_values,
+                                            filter_profile=filter_profile)
+        self._init_scanners(rule_path, config_dict)
         self.credential_manager = CredentialManager()
         self.json_filename: Union[None, str, Path] = json_filename
         self.xlsx_filename: Union[None, str, Path] = xlsx_filename
+        self.filter_stats_filename: Union[None, str, Path] = filter_stats_filename
         self.ml_batch_size = ml_batch_size
         self.ml_threshold = ml_threshold
+        self.ml_pipeline = ml_pipeline
+        self.ml_cache: Union[None, str, Path] = ml_cache
+        self.ml_cache_size = ml_cache_size
+        self.ml_session_options = ml_session_options
+        self.ml_quantized = ml_quantized
+        self.ml_cascade = ml_cascade
+        self.ml_cascade_band = ml_cascade_band
         self.ml_validator = None
+        self.__finished_ml_pipeline: Optional[CredSweeper.MlPipeline] = None
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def _init_scanners(self, rule_path: Optional[str], config_dict: Dict[str, Any]) -> None:
+        """Creates config and scanners which are required by file_scan"""
+        # scan spec: processes of ScanPool create the same scanners from it
+        self.rule_path = rule_path
+        self.config_dict = config_dict
+        self.config = Config(config_dict)
+        self.scanner = Scanner(self.config, rule_path)
+        self.doc_scanner = Scanner(self.config, rule_path, ["doc"])
+        self.deep_scanner = DeepScanner(self.config, self.scanner)
+        self.deep_doc_scanner = DeepScanner(self.config, self.doc_scanner)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    @classmethod
+    def from_scan_spec(cls, rule_path: Optional[str], config_dict: Dict[str, Any]) -> "CredSweeper":
+        """Creates an instance which is able to run file_scan only - for processes of ScanPool
+
+        Args:
+            rule_path: path of rules file or None for default
+            config_dict: dictionary of Config which is made by a CredSweeper instance
+
+        """
+        cred_sweeper = cls.__new__(cls)
+        cred_sweeper._init_scanners(rule_path, config_dict)
+        return cred_sweeper
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -123,10 +184,12 @@ class CredSweeper:
             find_by_ext: bool,  #
             depth: int,  #
             doc: bool,  #
+            buffer_scan: bool,  #
             severity: Optional[Severity],  #
             size_limit: Optional[str],  #
             exclude_lines: Optional[List[str]],  #
-            exclude_values: Optional[List[str]]) -> Dict[str, Any]:
+            exclude_values: Optional[List[str]],  #
+            filter_profile: Union[None, str, Path] = None) -> Dict[str, Any]:
         config_dict = Util.json_load(self._get_config_path(config_path))
         config_dict["validation"] = {}
         config_dict["validation"]["api_validation"] = api_validation
@@ -135,8 +198,15 @@ class CredSweeper:
         config_dict["size_limit"] = size_limit
         config_dict["depth"] = depth
         config_dict["doc"] = doc
+        config_dict["buffer_scan"] = buffer_scan
         if severity:
             config_dict["severity"] = severity.value
+        if filter_profile:
+            report = Util.json_load(filter_profile)
+            if isinstance(report, dict) and isinstance(report.get("filters"), dict):
+                config_dict["filter_profile"] = report["filters"]
+            else:
+                logger.warning(f"Filter profile was not loaded from {filter_profile}")
 
         if exclude_lines is not None:
             config_dict["exclude"]["lines"] = config_dict["exclude"].get("lines", []) + exclude_lines
@@ -156,7 +226,7 @@ class CredSweeper:
 
     # the import cannot be done on top due
     # TypeError: cannot pickle 'onnxruntime.capi.onnxruntime_pybind11_state.InferenceSession' object
-    from credsweeper.ml_model import MlValidator
+    from credsweeper.ml_model import MlValidator, MlPipeline
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -165,7 +235,13 @@ class CredSweeper:
         """ml_validator getter"""
         from credsweeper.ml_model import MlValidator
         if not self.__ml_validator:
-            self.__ml_validator: MlValidator = MlValidator(threshold=self.ml_threshold)
+            self.__ml_validator: MlValidator = MlValidator(threshold=self.ml_threshold,
+                                                           cache_path=self.ml_cache,
+                                                           cache_size=self.ml_cache_size,
+                                                           session_options=self.ml_session_options,
+                                                           quantized=self.ml_quantized,
+                                                           cascade=self.ml_cascade,
+                                                           cascade_band=self.ml_cascade_band)
         assert self.__ml_validator, "self.__ml_validator was not initialized"
         return self.__ml_validator
 
@@ -213,6 +289,7 @@ class CredSweeper:
         self.scan(file_extractors)
         self.post_processing()
         self.export_results()
+        self.export_filter_stats()
 
         return len(self.credential_manager.get_credentials())
 
@@ -225,19 +302,44 @@ class CredSweeper:
             content_providers: file objects to scan
 
         """
+        ml_pipeline = self.__start_ml_pipeline()
         if 1 < self.pool_count:
-            self.__multi_jobs_scan(content_providers)
+            self.__multi_jobs_scan(content_providers, ml_pipeline)
         else:
-            self.__single_job_scan(content_providers)
+            self.__single_job_scan(content_providers, ml_pipeline)
+        if ml_pipeline:
+            ml_pipeline.join()
+            self.__finished_ml_pipeline = ml_pipeline
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __single_job_scan(self, content_providers: List[Union[DiffContentProvider, TextContentProvider]]) -> None:
+    def __start_ml_pipeline(self) -> Optional[MlPipeline]:
+        """Starts ML validation of candidates during the scan if it is enabled"""
+        from credsweeper.ml_model import MlPipeline
+        self.__finished_ml_pipeline = None
+        if not self.ml_pipeline or not self._use_ml_validation():
+            return None
+        if self.ml_quantized:
+            # inputs of a batch are quantized together, so batches during the scan would give other probabilities
+            logger.warning("ML pipeline is not used with the quantized model")
+            return None
+        return MlPipeline(self.ml_validator, self.ml_batch_size)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def __single_job_scan(self, content_providers: List[Union[DiffContentProvider, TextContentProvider]],
+                          ml_pipeline: Optional[MlPipeline]) -> None:
         """Performs scan in main thread"""
         all_cred: List[Candidate] = []
         for i in content_providers:
             candidates = self.file_scan(i)
             all_cred.extend(candidates)
+            if ml_pipeline:
+                ml_pipeline.put(candidates)
+        if logger.isEnabledFor(logging.DEBUG):
+            for filter_name, cache_info in self.scanner.get_filters_cache_info().items():
+                if cache_info.hits or cache_info.misses:
+                    logger.debug("Filter %s cache: %s", filter_name, cache_info)
         if self.config.api_validation:
             api_validation = ApplyValidation()
             for cred in all_cred:
@@ -249,24 +351,27 @@ class CredSweeper:
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
-    def __multi_jobs_scan(self, content_providers: List[Union[DiffContentProvider, TextContentProvider]]) -> None:
-        """Performs scan with multiple jobs"""
-        with multiprocessing.get_context("spawn").Pool(self.pool_count, initializer=self.pool_initializer) as pool:
-            try:
-                # Get list credentials for each file
-                scan_results_per_file = pool.map(self.file_scan, content_providers)
-                # Join all sublist into a single list
-                scan_results = list(itertools.chain(*scan_results_per_file))
-                for cred in scan_results:
-                    self.credential_manager.add_credential(cred)
-                if self.config.api_validation:
-                    logger.info("Run API Validation")
-                    api_validation = ApplyValidation()
-                    api_validation.validate_credentials(pool, self.credential_manager)
-            except KeyboardInterrupt:
-                pool.terminate()
-                pool.join()
-                sys.exit()
+    def __multi_jobs_scan(self, content_providers: List[Union[DiffContentProvider, TextContentProvider]],
+                          ml_pipeline: Optional[MlPipeline]) -> None:
+        """Performs scan with multiple jobs of the shared pool for the scan spec"""
+        scan_pool = ScanPool.get(self.pool_count, self.rule_path, self.config_dict)
+        try:
+            file_candidates: List[List[Candidate]] = [[] for _ in content_providers]
+            # the processes send compact records which are rehydrated with the rules and config of the instance
+            for index, candidates in scan_pool.scan(content_providers, get_rule_table(self), self.config,
+                                                    self.chunk_size):
+                file_candidates[index] = candidates
+                if ml_pipeline:
+                    ml_pipeline.put(candidates)
+            # candidates are kept in order of the files as a single job scan does
+            self.credential_manager.set_credentials([x for candidates in file_candidates for x in candidates])
+            if self.config.api_validation:
+                logger.info("Run API Validation")
+                api_validation = ApplyValidation()
+                api_validation.validate_credentials(scan_pool.pool, self.credential_manager)
+        except KeyboardInterrupt:
+            scan_pool.terminate()
+            sys.exit()
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -298,9 +403,16 @@ class CredSweeper:
                 candidates = self.deep_doc_scanner.scan(content_provider, 0, self.config.size_limit)
             else:
                 if content_provider.file_type not in self.config.exclude_containers:
-                    # Regular file scanning
-                    analysis_targets = content_provider.get_analysis_target()
-                    candidates = self.scanner.scan(analysis_targets)
+                    text = content_provider.get_text() if self.config.buffer_scan and isinstance(
+                        content_provider, TextContentProvider) else None
+                    if text is not None:
+                        # Whole text scanning
+                        candidates = self.scanner.scan_text(text, content_provider.file_path,
+                                                            content_provider.file_type, content_provider.info)
+                    else:
+                        # Regular file scanning
+                        analysis_targets = content_provider.get_analysis_target()
+                        candidates = self.scanner.scan(analysis_targets)
 
         # finally return result from 'file_scan'
         return candidates
@@ -327,18 +439,38 @@ class CredSweeper:
                     candidate.ml_validation = KeyValidationOption.NOT_AVAILABLE
                 new_cred_list += group_candidates
 
-            is_cred, probability = self.ml_validator.validate_groups(ml_cred_groups, self.ml_batch_size)
+            # probabilities of groups predicted during the scan are used once
+            ml_pipeline, self.__finished_ml_pipeline = self.__finished_ml_pipeline, None
+            ml_validator = ml_pipeline if ml_pipeline else self.ml_validator
+            is_cred, probability = ml_validator.validate_groups(ml_cred_groups, self.ml_batch_size)
             for i, (_, group_candidates) in enumerate(ml_cred_groups):
                 if is_cred[i]:
                     for candidate in group_candidates:
                         candidate.ml_validation = KeyValidationOption.VALIDATED_KEY
                         candidate.ml_probability = probability[i]
                     new_cred_list += group_candidates
+            if self.ml_validator.prediction_cache:
+                logger.info(f"ML prediction cache: {self.ml_validator.prediction_cache.cache_info()}")
+                # the connection is not kept open between runs of the instance
+                self.ml_validator.close()
+            if self.ml_validator.cascade:
+                logger.info(f"ML cascade: {self.ml_validator.cascade.cascade_info()}")
 
             self.credential_manager.set_credentials(new_cred_list)
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def export_filter_stats(self) -> None:
+        """Save runtime statistics of filters and order of filter chains to json file"""
+        if not self.filter_stats_filename:
+            return
+        if 1 < self.pool_count:
+            logger.warning("Filter statistics are gathered in the main process only - use single job to collect them")
+        scanner = self.doc_scanner if self.config.doc else self.scanner
+        Util.json_dump(scanner.get_filters_report(), file_path=self.filter_stats_filename)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def export_results(self) -> None:
         """Save credential candidates to json file or print them to a console."""
         is_exported = False
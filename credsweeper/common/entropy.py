@@ -0,0 +1,151 @@
+import math
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+
+from credsweeper.common.constants import Chars
+
+# values are memoized to compute entropy of each of them once per run
+ENTROPY_CACHE_SIZE = 1 << 16
+# batches are requested by all entropy features of ML model one after another
+BATCH_CACHE_SIZE = 16
+# histograms of fewer values are cheaper than the vectorized count
+BINCOUNT_MIN_VALUES = 8
+FLOAT32_EPS = np.finfo(np.float32).eps
+
+
+class Entropy:
+    """Entropy of strings over alphabets of encodings: character histograms are built with one pass over a string.
+
+    Shannon entropy for validation of values is computed in the same way as before to keep the thresholds exact.
+    Renyi entropy of ML features is evaluated with NumPy for a batch of values at once.
+
+    """
+
+    @staticmethod
+    def _get_shannon_entropy(counts: Dict[str, int], size: int, alphabet: str) -> float:
+        """Shannon entropy of characters of the alphabet in a histogram of a string of the size"""
+        entropy = 0.
+        for x in alphabet:
+            count = counts.get(x)
+            if count:
+                p_x = float(count) / size
+                entropy += -p_x * math.log(p_x, 2)
+        return entropy
+
+    @staticmethod
+    @lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+    def get_shannon_entropy(data: str, alphabet: str) -> float:
+        """Shannon entropy of the data for characters of the alphabet.
+
+        Args:
+            data: string to estimate, all characters are counted in its length
+            alphabet: characters which probabilities are summed
+
+        Return:
+            entropy in bits, 0 for empty data
+
+        """
+        if not data:
+            return 0
+        return Entropy._get_shannon_entropy(Counter(data), len(data), alphabet)
+
+    @staticmethod
+    @lru_cache(maxsize=ENTROPY_CACHE_SIZE)
+    def is_entropy_validate(data: str) -> bool:
+        """Verifies data entropy with base64, base36 and base16(hex) with one histogram of the data"""
+        if not data:
+            return False
+        counts = Counter(data)
+        size = len(data)
+        return 4.5 < Entropy._get_shannon_entropy(counts, size, Chars.BASE64_CHARS.value) \
+            or 3 < Entropy._get_shannon_entropy(counts, size, Chars.BASE36_CHARS.value) \
+            or 3 < Entropy._get_shannon_entropy(counts, size, Chars.HEX_CHARS.value)
+
+    @staticmethod
+    def get_count_matrix(values: Tuple[str, ...], alphabet: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Histograms of characters of the alphabet for a batch of values.
+
+        Small batches are counted with a histogram per value, larger ones are joined and counted with one bincount
+        call to avoid Python work per character. The counts are the same in both cases.
+
+        Args:
+            values: batch of strings
+            alphabet: ASCII characters to count
+
+        Return:
+            matrix of counts with a row per value and a column per character of the alphabet, lengths of the values
+
+        """
+        width = len(alphabet)
+        lengths = np.fromiter((len(x) for x in values), dtype=np.int64, count=len(values))
+        if len(values) < BINCOUNT_MIN_VALUES:
+            counts = np.zeros((len(values), width), dtype=np.int64)
+            for row, value in zip(counts, values):
+                histogram = Counter(value)
+                row[:] = [histogram.get(x, 0) for x in alphabet]
+            return counts, lengths
+        codes = np.frombuffer("".join(values).encode("utf_32_le"), dtype=np.uint32)
+        table = np.full(128, -1, dtype=np.int64)
+        for index, char in enumerate(alphabet):
+            table[ord(char)] = index
+        columns = np.where(codes < 128, table[np.minimum(codes, 127)], -1)
+        rows = np.repeat(np.arange(len(values), dtype=np.int64), lengths)
+        counted = 0 <= columns
+        counts = np.bincount(rows[counted] * width + columns[counted], minlength=len(values) * width)
+        return counts.reshape(len(values), width), lengths
+
+    @staticmethod
+    @lru_cache(maxsize=BATCH_CACHE_SIZE)
+    def get_probability_matrix(values: Tuple[str, ...], alphabet: str, norm: bool = False) -> np.ndarray:
+        """Probabilities of characters of the alphabet for a batch of values.
+
+        The result is read-only because it is shared by all entropy features of the batch.
+
+        Args:
+            values: batch of strings
+            alphabet: ASCII characters to count
+            norm: set True to normalize probabilities of each value to sum of 1
+
+        Return:
+            matrix of probabilities with a row per value, zero for absent characters
+
+        """
+        counts, lengths = Entropy.get_count_matrix(values, alphabet)
+        # counts of an empty value are zeros, so any positive divisor keeps them
+        p_x: np.ndarray = counts / np.maximum(lengths, 1)[:, np.newaxis]
+        if norm:
+            sums = p_x.sum(axis=1, keepdims=True)
+            p_x /= np.where(0 < sums, sums, 1.0)
+        p_x.flags.writeable = False
+        return p_x
+
+    @staticmethod
+    def get_renyi_entropy(values: Tuple[str, ...], alphabet: str, alpha: float, norm: bool = False) -> np.ndarray:
+        """Renyi entropy of characters of the alphabet for a batch of values.
+
+        Args:
+            values: batch of strings
+            alphabet: ASCII characters to count
+            alpha: entropy parameter, 0 - Hartley entropy, 1 - Shannon entropy
+            norm: set True to normalize probabilities of each value
+
+        Return:
+            entropy of each value, 0 for a value without characters of the alphabet
+
+        """
+        p_x = Entropy.get_probability_matrix(values, alphabet, norm)
+        present = 0 < p_x
+        entropy: np.ndarray
+        if np.abs(0.0 - alpha) < FLOAT32_EPS:
+            # corresponds to Hartley or max-entropy, log2(1) is 0 for a value without the characters
+            entropy = np.log2(np.maximum(np.count_nonzero(present, axis=1), 1))
+        elif np.abs(1.0 - alpha) < FLOAT32_EPS:
+            # corresponds to Shannon entropy, absent characters have zero terms
+            entropy = np.sum(-p_x * np.log2(np.where(present, p_x, 1.0)), axis=1)
+        else:
+            sums = (p_x**alpha).sum(axis=1)
+            entropy = np.log2(np.where(0 < sums, sums, 1.0)) / (1.0 - alpha)
+        return entropy
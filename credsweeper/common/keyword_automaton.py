@@ -0,0 +1,118 @@
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton which finds all words of a dictionary in a text with one pass.
+
+    Transitions of the trie are completed lazily with failure links, so each character of the text costs one dict
+    lookup after warm-up. Only characters of the words are memorized, any other character leads to the root state.
+
+    Parameters:
+        words: the dictionary, the text is matched as is, so the words have to be in the same case
+
+    """
+
+    __slots__ = ("__words", "__alphabet", "__trie", "__transitions", "__fail", "__outputs")
+
+    def __init__(self, words: Iterable[str]) -> None:
+        self.__words: Set[str] = set(x for x in words if x)
+        self.__alphabet: Set[str] = set()
+        # children of the trie nodes
+        self.__trie: List[Dict[str, int]] = [{}]
+        # children of the trie nodes extended with memorized transitions via failure links
+        self.__transitions: List[Dict[str, int]] = [{}]
+        self.__fail: List[int] = [0]
+        # all words which end at the state including words of the failure chain
+        self.__outputs: List[Tuple[str, ...]] = [()]
+        for word in sorted(self.__words):
+            self.__add_word(word)
+        self.__set_failure_links()
+
+    def __add_word(self, word: str) -> None:
+        """Adds path of the word to the trie"""
+        state = 0
+        for char in word:
+            self.__alphabet.add(char)
+            next_state = self.__trie[state].get(char)
+            if next_state is None:
+                next_state = len(self.__trie)
+                self.__trie[state][char] = next_state
+                self.__transitions[state][char] = next_state
+                self.__trie.append({})
+                self.__transitions.append({})
+                self.__fail.append(0)
+                self.__outputs.append(())
+            state = next_state
+        self.__outputs[state] = (word, )
+
+    def __set_failure_links(self) -> None:
+        """Breadth-first pass to set failure links and to merge outputs of failure chains"""
+        queue: Deque[int] = deque(self.__trie[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.__trie[state].items():
+                fail = self.__fail[state]
+                while fail and char not in self.__trie[fail]:
+                    fail = self.__fail[fail]
+                fail = self.__trie[fail].get(char, 0)
+                self.__fail[child] = fail
+                self.__outputs[child] += self.__outputs[self.__fail[child]]
+                queue.append(child)
+
+    def __next_state(self, state: int, char: str) -> int:
+        """Follows failure links to find the transition and memorizes it for the state"""
+        if char not in self.__alphabet:
+            return 0
+        fail = state
+        while fail and char not in self.__trie[fail]:
+            fail = self.__fail[fail]
+        next_state = self.__trie[fail].get(char, 0)
+        self.__transitions[state][char] = next_state
+        return next_state
+
+    @property
+    def words(self) -> Set[str]:
+        """words getter"""
+        return self.__words
+
+    @property
+    def size(self) -> int:
+        """Number of states of the automaton"""
+        return len(self.__trie)
+
+    def find_words(self, text: str, limit: int = 0) -> Set[str]:
+        """Finds distinct words of the dictionary which are substrings of the text.
+
+        Args:
+            text: text to search in
+            limit: the search stops when the number of found words reaches the limit, 0 - no limit
+
+        Return:
+            set of found words
+
+        """
+        found: Set[str] = set()
+        transitions = self.__transitions
+        outputs = self.__outputs
+        state = 0
+        for char in text:
+            next_state = transitions[state].get(char)
+            state = self.__next_state(state, char) if next_state is None else next_state
+            if outputs[state]:
+                found.update(outputs[state])
+                if 0 < limit <= len(found):
+                    break
+        return found
+
+    def has_any(self, text: str) -> bool:
+        """Returns True if any word of the dictionary is a substring of the text"""
+        transitions = self.__transitions
+        outputs = self.__outputs
+        state = 0
+        for char in text:
+            next_state = transitions[state].get(char)
+            state = self.__next_state(state, char) if next_state is None else next_state
+            if outputs[state]:
+                return True
+        return False
@@ -2,12 +2,15 @@ from functools import cached_property
 from typing import Set
 
 from credsweeper.app import APP_PATH
+from credsweeper.common.keyword_automaton import KeywordAutomaton
 
 
 class KeywordChecklist:
     """KeywordsChecklist contains words 3 or more letters length"""
     __keyword_set: Set[str]
     __morpheme_set: Set[str]
+    __keyword_automaton: KeywordAutomaton
+    __morpheme_automaton: KeywordAutomaton
     KEYWORD_PATH = APP_PATH / "common" / "keyword_checklist.txt"
     MORPHEME_PATH = APP_PATH / "common" / "morpheme_checklist.txt"
 
@@ -17,6 +20,9 @@ class KeywordChecklist:
         # The list of morphemes can be combined to form words.
         # The value is considered a variable if at least two exist.
         self.__morpheme_set = set(self.MORPHEME_PATH.read_text().split())
+        # the automata are shared by all filters to find all words of a dictionary in one pass over a value
+        self.__keyword_automaton = KeywordAutomaton(self.__keyword_set)
+        self.__morpheme_automaton = KeywordAutomaton(self.__morpheme_set)
 
     @cached_property
     def keyword_set(self) -> Set[str]:
@@ -47,3 +53,23 @@ class KeywordChecklist:
     def morpheme_len(self) -> int:
         """Length of morpheme_set"""
         return len(self.__morpheme_set)
+
+    @cached_property
+    def keyword_automaton(self) -> KeywordAutomaton:
+        """Get automaton to search keywords in a text in lower case.
+
+        Return:
+            Automaton built with keyword_set
+
+        """
+        return self.__keyword_automaton
+
+    @cached_property
+    def morpheme_automaton(self) -> KeywordAutomaton:
+        """Get automaton to search morphemes in a text in lower case.
+
+        Return:
+            Automaton built with morpheme_set
+
+        """
+        return self.__morpheme_automaton
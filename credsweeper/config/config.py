@@ -38,6 +38,8 @@ class Config:
         self.size_limit: Optional[int] = parse_size(config["size_limit"]) if config["size_limit"] is not None else None
         self.depth: int = int(config["depth"])
         self.doc: bool = config["doc"]
+        self.buffer_scan: bool = config.get("buffer_scan", False)
+        self.filter_profile: Optional[Dict[str, Any]] = config.get("filter_profile")
         self.severity: Severity = Severity.get(config.get("severity")) or Severity.INFO
 
         self.min_keyword_value_length: int = int(config["min_keyword_value_length"])
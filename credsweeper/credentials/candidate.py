@@ -1,6 +1,6 @@
 import copy
 from json.encoder import py_encode_basestring_ascii
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from regex import regex
 
@@ -25,6 +25,10 @@ class Candidate:
         use_ml: Should ML work on this credential or not. If not prediction based on regular expression and filter only
     """
 
+    # patterns, validations and config are shared references to objects of the rule and the scanner
+    __slots__ = ("__api_validation", "__ml_validation", "__line_data_list", "__patterns", "ml_probability",
+                 "__rule_name", "__severity", "validations", "use_ml", "config")
+
     def __init__(self,
                  line_data_list: List[LineData],
                  patterns: List[regex.Pattern],
@@ -133,6 +137,16 @@ class Candidate:
         """
         return len(self.validations) > 0
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Compact state for pickling"""
+        return (self.__api_validation, self.__ml_validation, self.__line_data_list, self.__patterns,
+                self.ml_probability, self.__rule_name, self.__severity, self.validations, self.use_ml, self.config)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restores state of unpickled object"""
+        (self.__api_validation, self.__ml_validation, self.__line_data_list, self.__patterns, self.ml_probability,
+         self.__rule_name, self.__severity, self.validations, self.use_ml, self.config) = state
+
     def __str__(self) -> str:
         return f"rule: {self.rule_name} / severity: {self.severity.value} / line_data_list: {self.line_data_list} " \
                f"/ api_validation: {self.api_validation.name} / ml_validation: {self.ml_validation.name}"
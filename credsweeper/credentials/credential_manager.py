@@ -1,5 +1,5 @@
-from multiprocessing import Manager
-from typing import List
+import threading
+from typing import Any, Dict, List
 
 from credsweeper.credentials import Candidate
 from credsweeper.credentials.candidate_group_generator import CandidateGroupGenerator, CandidateKey
@@ -8,13 +8,16 @@ from credsweeper.credentials.candidate_group_generator import CandidateGroupGene
 class CredentialManager:
     """The manager allows you to store, add and delete separate credit candidates.
 
+    Changes of the candidates are made under a lock, so the manager may be shared by scanning threads.
+
     Parameters:
         candidates: list of credential candidates
 
     """
 
     def __init__(self) -> None:
-        self.candidates: List[Candidate] = list(Manager().list())
+        self.candidates: List[Candidate] = []
+        self.__lock = threading.Lock()
 
     def get_credentials(self) -> List[Candidate]:
         """Get all credential candidates stored in the manager.
@@ -32,7 +35,8 @@ class CredentialManager:
             candidates: List with candidates to replace current candidates in the manager
 
         """
-        self.candidates = candidates
+        with self.__lock:
+            self.candidates = candidates
 
     def add_credential(self, candidate: Candidate) -> None:
         """Add credential candidate to the manager.
@@ -41,7 +45,8 @@ class CredentialManager:
             candidate: credential candidate to be added
 
         """
-        self.candidates.append(candidate)
+        with self.__lock:
+            self.candidates.append(candidate)
 
     def remove_credential(self, candidate: Candidate) -> None:
         """Remove credential candidate from the manager.
@@ -50,7 +55,8 @@ class CredentialManager:
             candidate: credential candidate to be removed
 
         """
-        self.candidates.remove(candidate)
+        with self.__lock:
+            self.candidates.remove(candidate)
 
     def group_credentials(self) -> CandidateGroupGenerator:
         """Join candidates that reference same secret value in the same line.
@@ -62,7 +68,9 @@ class CredentialManager:
 
         """
         groups = CandidateGroupGenerator()
-        for credential_candidate in self.get_credentials():
+        with self.__lock:
+            candidates = list(self.candidates)
+        for credential_candidate in candidates:
             for line_data in credential_candidate.line_data_list[:1]:
                 # Match by file path+line num+value. Value required so two different credentials still be
                 #  processed independently
@@ -71,3 +79,12 @@ class CredentialManager:
                     groups[candidate_key] = list()
                 groups[candidate_key].append(credential_candidate)
         return groups
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """State for pickling without the lock"""
+        return {"candidates": self.candidates}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores state of unpickled object with a new lock"""
+        self.candidates = state["candidates"]
+        self.__lock = threading.Lock()
@@ -17,6 +17,7 @@ class LineData:
         file_type: string variable, extension of file '.txt'
         info: additional info about how the data was detected
         pattern: regex pattern, detected pattern in line
+        match_obj: optional match of the pattern in the line to avoid repeated search
         separator: optional string variable, separators between variable and value
         separator_span: optional tuple variable, separator position
         value: optional string variable, detected value in line
@@ -27,6 +28,11 @@ class LineData:
     comment_starts = ["//", "*", "#", "/*", "<!––", "%{", "%", "...", "(*", "--", "--[[", "#="]
     bash_param_split = regex.compile("\\s+(\\-|\\||\\>|\\w+?\\>|\\&)")
 
+    # config and pattern are shared references, derived fields are computed on demand
+    __slots__ = ("config", "__key", "__line", "__line_num", "__path", "__file_type", "__info", "__pattern",
+                 "__separator", "__separator_span", "__value", "__variable", "__value_leftquote", "__value_rightquote",
+                 "__entropy_validation")
+
     def __init__(
             self,  #
             config: Config,  #
@@ -35,8 +41,10 @@ class LineData:
             path: str,  #
             file_type: str,  #
             info: str,  #
-            pattern: regex.Pattern) -> None:
+            pattern: regex.Pattern,  #
+            match_obj: Optional[regex.Match] = None) -> None:
         self.config = config
+        self.__entropy_validation: Optional[bool] = None
         self.key: Optional[str] = None
         self.line: str = line
         self.line_num: int = line_num
@@ -51,7 +59,7 @@ class LineData:
         self.value_leftquote: Optional[str] = None
         self.value_rightquote: Optional[str] = None
 
-        self.initialize()
+        self.initialize(match_obj)
 
     @property
     def key(self) -> str:
@@ -152,6 +160,14 @@ class LineData:
     def value(self, value: str) -> None:
         """value setter"""
         self.__value = value
+        self.__entropy_validation = None
+
+    @property
+    def entropy_validation(self) -> bool:
+        """entropy validation of the value which is computed once on demand"""
+        if self.__entropy_validation is None:
+            self.__entropy_validation = Util.is_entropy_validate(self.value)
+        return self.__entropy_validation
 
     @property
     def variable(self) -> str:
@@ -183,13 +199,19 @@ class LineData:
         """value_rightquote setter"""
         self.__value_rightquote = value_rightquote
 
-    def initialize(self) -> None:
-        """Set all internal fields."""
-        self.set_pattern_match_groups()
+    def initialize(self, match_obj: Optional[regex.Match] = None) -> None:
+        """Set all internal fields.
 
-    def set_pattern_match_groups(self) -> None:
+        Args:
+            match_obj: optional match of the pattern in the line, the pattern is searched if not given
+
+        """
+        self.set_pattern_match_groups(match_obj)
+
+    def set_pattern_match_groups(self, match_obj: Optional[regex.Match] = None) -> None:
         """Apply regex to the candidate line and set internal fields based on match."""
-        match_obj = self.pattern.search(self.line)
+        if match_obj is None:
+            match_obj = self.pattern.search(self.line)
         if match_obj is None:
             return
 
@@ -288,9 +310,22 @@ class LineData:
             return True
         return False
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Compact state for pickling without derived fields"""
+        return (self.config, self.__key, self.__line, self.__line_num, self.__path, self.__file_type, self.__info,
+                self.__pattern, self.__separator, self.__separator_span, self.__value, self.__variable,
+                self.__value_leftquote, self.__value_rightquote)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restores state of unpickled object"""
+        (self.config, self.__key, self.__line, self.__line_num, self.__path, self.__file_type, self.__info,
+         self.__pattern, self.__separator, self.__separator_span, self.__value, self.__variable, self.__value_leftquote,
+         self.__value_rightquote) = state
+        self.__entropy_validation = None
+
     def __repr__(self) -> str:
         return f"line: '{self.line}' / line_num: {self.line_num} / path: {self.path} " \
-               f"/ value: '{self.value}' / entropy_validation: {Util.is_entropy_validate(self.value)}"
+               f"/ value: '{self.value}' / entropy_validation: {self.entropy_validation}"
 
     def to_json(self) -> Dict:
         """Convert line data object to dictionary.
@@ -312,7 +347,7 @@ class LineData:
             "variable": self.variable,
             "value_leftquote": self.value_leftquote,
             "value_rightquote": self.value_rightquote,
-            "entropy_validation": Util.is_entropy_validate(self.value)
+            "entropy_validation": self.entropy_validation
         }
         reported_output = {k: v for k, v in full_output.items() if k in self.config.line_data_output}
         return reported_output
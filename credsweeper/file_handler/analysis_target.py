@@ -1,13 +1,170 @@
-from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union, overload
+
+from regex import regex
+
+from credsweeper.common.constants import MAX_LINE_LENGTH
+
+
+class FileView(Sequence["AnalysisTarget"]):
+    """Shared data of analysis targets of one file.
+
+    Targets are created on demand, so only one lightweight handle per processed line exists at a time.
+
+    Parameters:
+        lines: all lines of the file - list or lazy sequence (e.g. TextLines)
+        line_nums: numbers of the lines, the lines are numbered from 1 if None
+        file_path: path to the file
+        file_type: type of the file in extension format '.txt'
+        info: extended info
+
+    """
+
+    __slots__ = ("lines", "line_nums", "file_path", "file_type", "info", "__matched_positions")
+
+    def __init__(self, lines: Sequence[str], line_nums: Optional[Sequence[int]], file_path: str, file_type: str,
+                 info: str) -> None:
+        self.lines = lines
+        self.line_nums = line_nums
+        self.file_path = file_path
+        self.file_type = file_type
+        self.info = info
+        self.__matched_positions: Dict[regex.Pattern, List[int]] = {}
+
+    def get_matched_positions(self, pattern: regex.Pattern) -> List[int]:
+        """Returns sorted positions of the lines where the pattern is found. The index is built once per pattern"""
+        matched_positions = self.__matched_positions.get(pattern)
+        if matched_positions is None:
+            matched_positions = [
+                i for i, line in enumerate(self.lines) if len(line) <= MAX_LINE_LENGTH and pattern.search(line)
+            ]
+            self.__matched_positions[pattern] = matched_positions
+        return matched_positions
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    @overload
+    def __getitem__(self, index: int) -> "AnalysisTarget":
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence["AnalysisTarget"]:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["AnalysisTarget", Sequence["AnalysisTarget"]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if 0 > index:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"target index {index} out of range")
+        return AnalysisTarget.from_view(self, index)
+
+    def __iter__(self) -> Iterator["AnalysisTarget"]:
+        from_view = AnalysisTarget.from_view
+        # iteration over the lines is faster than access by index for lazy sequences
+        for line_pos, line in enumerate(self.lines):
+            yield from_view(self, line_pos, line)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FileView({self.file_path!r}, {len(self)} lines)"
 
 
-@dataclass
 class AnalysisTarget:
-    """AnalysisTarget"""
-    line: str
-    line_num: int
-    lines: List[str]
-    file_path: str
-    file_type: str
-    info: str
+    """Handle of a line to analyze with lazily computed line forms.
+
+    Constructor with explicit line data is kept for single targets. Targets of a file are created with FileView.
+
+    """
+
+    __slots__ = ("__view", "__line_pos", "__line", "__line_num", "__line_strip", "__line_lower_strip")
+
+    def __init__(self, line: str, line_num: int, lines: Sequence[str], file_path: str, file_type: str,
+                 info: str) -> None:
+        self.__view = FileView(lines, None, file_path, file_type, info)
+        self.__line_pos = line_num - 1
+        self.__line: Optional[str] = line
+        self.__line_num: Optional[int] = line_num
+        self.__line_strip: Optional[str] = None
+        self.__line_lower_strip: Optional[str] = None
+
+    @classmethod
+    def from_view(cls, view: FileView, line_pos: int, line: Optional[str] = None) -> "AnalysisTarget":
+        """Creates handle of the line at line_pos in the file view. The line is obtained from the view if not given"""
+        target = cls.__new__(cls)
+        target.__view = view
+        target.__line_pos = line_pos
+        target.__line = line
+        target.__line_num = None
+        target.__line_strip = None
+        target.__line_lower_strip = None
+        return target
+
+    @property
+    def line(self) -> str:
+        """line getter"""
+        if self.__line is None:
+            self.__line = self.__view.lines[self.__line_pos]
+        return self.__line
+
+    @property
+    def line_num(self) -> int:
+        """line_num getter"""
+        if self.__line_num is None:
+            line_nums = self.__view.line_nums
+            self.__line_num = line_nums[self.__line_pos] if line_nums is not None else self.__line_pos + 1
+        return self.__line_num
+
+    @property
+    def line_strip(self) -> str:
+        """line without outer spaces"""
+        if self.__line_strip is None:
+            self.__line_strip = self.line.strip()
+        return self.__line_strip
+
+    @property
+    def line_lower_strip(self) -> str:
+        """line without outer spaces in lower case"""
+        if self.__line_lower_strip is None:
+            self.__line_lower_strip = self.line_strip.lower()
+        return self.__line_lower_strip
+
+    @property
+    def lines(self) -> Sequence[str]:
+        """all lines of the file"""
+        return self.__view.lines
+
+    @property
+    def file_view(self) -> FileView:
+        """shared view of the file"""
+        return self.__view
+
+    @property
+    def file_path(self) -> str:
+        """file_path getter"""
+        return self.__view.file_path
+
+    @property
+    def file_type(self) -> str:
+        """file_type getter"""
+        return self.__view.file_type
+
+    @property
+    def info(self) -> str:
+        """info getter"""
+        return self.__view.info
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, AnalysisTarget):
+            return self.line == other.line and self.line_num == other.line_num and self.lines == other.lines \
+                and self.file_path == other.file_path and self.file_type == other.file_type and self.info == other.info
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AnalysisTarget(line={self.line!r}, line_num={self.line_num}, file_path={self.file_path!r}, " \
+               f"file_type={self.file_type!r}, info={self.info!r})"
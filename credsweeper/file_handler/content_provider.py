@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Optional, Sequence
 
-from credsweeper.file_handler.analysis_target import AnalysisTarget
+from credsweeper.file_handler.analysis_target import AnalysisTarget, FileView
 from credsweeper.utils import Util
 
 
@@ -25,7 +25,7 @@ class ContentProvider(ABC):
         self.info: str = info
 
     @abstractmethod
-    def get_analysis_target(self) -> List[AnalysisTarget]:
+    def get_analysis_target(self) -> Sequence[AnalysisTarget]:
         """Load and preprocess file diff data to scan.
 
         Return:
@@ -76,15 +76,6 @@ class ContentProvider(ABC):
         """abstract data setter"""
         raise NotImplementedError(__name__)
 
-    def lines_to_targets(self, lines: List[str], line_nums: Optional[List[int]] = None) -> List[AnalysisTarget]:
-        """Creates list of targets with multiline concatenation"""
-        targets = []
-        if line_nums:
-            for line, line_num in zip(lines, line_nums):
-                target = AnalysisTarget(line, line_num, lines, self.file_path, self.file_type, self.info)
-                targets.append(target)
-        else:
-            for i, line in enumerate(lines):
-                target = AnalysisTarget(line, i + 1, lines, self.file_path, self.file_type, self.info)
-                targets.append(target)
-        return targets
+    def lines_to_targets(self, lines: Sequence[str], line_nums: Optional[Sequence[int]] = None) -> FileView:
+        """Creates file view which provides targets of the lines on demand"""
+        return FileView(lines, line_nums if line_nums else None, self.file_path, self.file_type, self.info)
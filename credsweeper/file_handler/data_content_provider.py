@@ -2,7 +2,7 @@ import base64
 import json
 import logging
 import string
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Sequence
 
 import yaml
 from bs4 import BeautifulSoup
@@ -221,7 +221,7 @@ class DataContentProvider(ContentProvider):
             return self.decoded is not None and 0 < len(self.decoded)
         return False
 
-    def get_analysis_target(self) -> List[AnalysisTarget]:
+    def get_analysis_target(self) -> Sequence[AnalysisTarget]:
         """Return nothing. The class provides only data storage.
 
         Raise:
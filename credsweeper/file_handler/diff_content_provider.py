@@ -1,8 +1,8 @@
 import logging
-from typing import List, Tuple
+from typing import List, Tuple, Sequence
 
 from credsweeper.common.constants import DiffRowType
-from credsweeper.file_handler.analysis_target import AnalysisTarget
+from credsweeper.file_handler.analysis_target import AnalysisTarget, FileView
 from credsweeper.file_handler.content_provider import ContentProvider
 from credsweeper.utils import DiffRowData, Util, DiffDict
 
@@ -45,6 +45,11 @@ class DiffContentProvider(ContentProvider):
         """data setter for DiffContentProvider"""
         raise NotImplementedError(__name__)
 
+    @property
+    def size(self) -> int:
+        """Total length of the rows of the diff"""
+        return sum(len(x["line"]) for x in self.diff)
+
     def parse_lines_data(self, lines_data: List[DiffRowData]) -> Tuple[List[int], List[str]]:
         """Parse diff lines data.
 
@@ -71,7 +76,7 @@ class DiffContentProvider(ContentProvider):
                 change_numbs.append(line_data.line_numb)
         return change_numbs, all_lines
 
-    def get_analysis_target(self) -> List[AnalysisTarget]:
+    def get_analysis_target(self) -> Sequence[AnalysisTarget]:
         """Preprocess file diff data to scan.
 
         Return:
@@ -81,16 +86,9 @@ class DiffContentProvider(ContentProvider):
         lines_data = Util.preprocess_file_diff(self.diff)
         try:
             change_numbs, all_lines = self.parse_lines_data(lines_data)
-            return [
-                AnalysisTarget(
-                    all_lines[l_numb - 1],  #
-                    l_numb,  #
-                    all_lines,  #
-                    self.file_path,  #
-                    self.file_type,  #
-                    self.change_type.value)  #
-                for l_numb in change_numbs
-            ]
+            # all targets share the view of the file, only changed lines are analyzed
+            file_view = FileView(all_lines, None, self.file_path, self.file_type, self.change_type.value)
+            return [file_view[l_numb - 1] for l_numb in change_numbs]
         except Exception as exc:
             logger.error(f"Wrong diff {type(exc)} {exc}")
         return []
@@ -1,6 +1,7 @@
 import io
 import logging
 import os
+import threading
 from pathlib import Path
 from typing import List, Dict, Union, Tuple
 
@@ -15,7 +16,9 @@ logger = logging.getLogger(__name__)
 class FilePathExtractor:
     """Util class to browse files in directories"""
 
+    # repositories are shared by all instances and threads, so the cache is accessed under the lock
     located_repos: Dict[Path, Repo] = {}
+    located_repos_lock = threading.Lock()
 
     @staticmethod
     def apply_gitignore(detected_files: List[str]) -> List[str]:
@@ -82,14 +85,15 @@ class FilePathExtractor:
         # Iterate over file path to find nearest ".git" directory
         while True:
             try:
-                if parent_directory in cls.located_repos:
-                    repo = cls.located_repos[parent_directory]
-                else:
+                with cls.located_repos_lock:
+                    repo = cls.located_repos.get(parent_directory)
+                if repo is None:
                     # The directory must have ".git" in it. If not it occurs error.
                     repo = Repo(parent_directory)
 
                     # Cache already located repositories, so we would not need to load it for each new file
-                    cls.located_repos[parent_directory] = repo
+                    with cls.located_repos_lock:
+                        repo = cls.located_repos.setdefault(parent_directory, repo)
 
                 # Return True if there is no ignored file in 'path' and False if any.
                 return len(repo.ignored(path)) == 0
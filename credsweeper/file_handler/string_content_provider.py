@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
@@ -37,14 +37,11 @@ class StringContentProvider(ContentProvider):
         """data setter for StringContentProvider"""
         raise NotImplementedError(__name__)
 
-    def get_analysis_target(self) -> List[AnalysisTarget]:
+    def get_analysis_target(self) -> Sequence[AnalysisTarget]:
         """Return lines to scan.
 
         Return:
             list of analysis targets based on every row in file
 
         """
-        return [
-            AnalysisTarget(line, line_number, self.lines, self.file_path, self.file_type, self.info)
-            for line_number, line in zip(self.line_numbers, self.lines)
-        ]
+        return self.lines_to_targets(self.lines, self.line_numbers)
@@ -1,10 +1,12 @@
 import io
 import logging
+import os
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import List, Optional, Union, Tuple, Sequence
 
 from credsweeper.file_handler.analysis_target import AnalysisTarget
 from credsweeper.file_handler.content_provider import ContentProvider
+from credsweeper.file_handler.text_lines import TextLines
 from credsweeper.utils import Util
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,18 @@ class TextContentProvider(ContentProvider):
         """data setter for TextContentProvider"""
         self.__data = data
 
+    @property
+    def size(self) -> int:
+        """Size of the data in bytes which is obtained without reading of the file, 0 if the file is not available"""
+        if self.__data is not None:
+            return len(self.__data)
+        if isinstance(self.__io, io.BytesIO):
+            return self.__io.getbuffer().nbytes
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+
     @property
     def lines(self) -> Optional[List[str]]:
         """lines getter for TextContentProvider"""
@@ -55,14 +69,32 @@ class TextContentProvider(ContentProvider):
         """lines setter for TextContentProvider"""
         self.__lines = lines
 
-    def get_analysis_target(self) -> List[AnalysisTarget]:
+    def get_text(self) -> Optional[str]:
+        """Returns whole text of the file when analysis targets are the lines of the text as is.
+
+        Return:
+            text with LF line endings or None if the file cannot be scanned as text entirely
+
+        """
+        if Util.get_extension(self.file_path) == ".xml":
+            # xml data are converted in get_analysis_target
+            return None
+        if self.__lines is not None:
+            return '\n'.join(self.__lines)
+        text = Util.decode_text(self.data)
+        if text is None:
+            # avoid decoding attempts again
+            self.__lines = []
+        return text
+
+    def get_analysis_target(self) -> Sequence[AnalysisTarget]:
         """Load and preprocess file content to scan.
 
         Return:
-            list of analysis targets based on every row in file
+            file view with analysis targets based on every row in file
 
         """
-        lines: Optional[List[str]] = None
+        lines: Optional[Sequence[str]] = None
         line_nums: List[int] = []
 
         if Util.get_extension(self.file_path) == ".xml":
@@ -74,6 +106,8 @@ class TextContentProvider(ContentProvider):
                 logger.error(f"Cannot parse to xml {exc}")
 
         if lines is None:
-            lines = self.lines
+            text = self.get_text() if self.__lines is None else None
+            # the lines are sliced from the text on demand, so memory usage is about the size of the text
+            lines = TextLines(text) if text is not None else self.lines
 
         return self.lines_to_targets(lines, line_nums)
@@ -0,0 +1,91 @@
+from array import array
+from bisect import bisect_left
+from typing import Any, Iterator, List, Sequence, Union, overload
+
+import numpy as np
+
+
+class TextLines(Sequence[str]):
+    """Read-only sequence of lines of a text which are sliced on demand with precomputed newline offsets.
+
+    The sequence is equal to `text.split("\\n")`, but the strings are created only for accessed lines, so memory
+    usage is about the size of the text plus 8 bytes per line.
+
+    Parameters:
+        text: whole text with LF line endings
+        newlines: sorted positions of LF characters in the text
+
+    """
+
+    # the text is encoded by chunks to keep temporary memory small
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        # plain array is used for the offsets because access to numpy scalars is slow
+        self.newlines = array('q')
+        for chunk_start in range(0, len(text), self.CHUNK_SIZE):
+            chunk = text[chunk_start:chunk_start + self.CHUNK_SIZE]
+            if chunk.isascii():
+                codes = np.frombuffer(chunk.encode("ascii"), dtype=np.uint8)
+            else:
+                # fixed width encoding keeps positions of characters
+                codes = np.frombuffer(chunk.encode("utf-32-le"), dtype=np.uint32)
+            self.newlines.frombytes((np.flatnonzero(ord('\n') == codes) + chunk_start).astype(np.int64).tobytes())
+
+    def __len__(self) -> int:
+        return len(self.newlines) + 1
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...  # pragma: no cover
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if 1 == step and start < stop:
+                # contiguous lines are split at once
+                return self.text[self.get_line_start(start):self.get_line_end(stop - 1)].split('\n')
+            return [self[i] for i in range(start, stop, step)]
+        if 0 > index:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"line index {index} out of range")
+        return self.text[self.get_line_start(index):self.get_line_end(index)]
+
+    def __iter__(self) -> Iterator[str]:
+        text = self.text
+        start = 0
+        for end in self.newlines:
+            yield text[start:end]
+            start = end + 1
+        yield text[start:]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, TextLines):
+            return self.text == other.text
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    def get_line_start(self, index: int) -> int:
+        """Returns position of the first character of the line"""
+        return self.newlines[index - 1] + 1 if 0 < index else 0
+
+    def get_line_end(self, index: int) -> int:
+        """Returns position after the last character of the line (position of LF or length of the text)"""
+        return self.newlines[index] if index < len(self.newlines) else len(self.text)
+
+    def get_line_index(self, position: int) -> int:
+        """Returns index of the line which contains the character at the position"""
+        return bisect_left(self.newlines, position)
+
+    def get_oversize_lines(self, max_length: int) -> List[int]:
+        """Returns indexes of lines which are longer than max_length"""
+        bounds = np.concatenate(([-1], np.frombuffer(self.newlines, dtype=np.int64), [len(self.text)]))
+        oversize_lines: List[int] = np.flatnonzero(max_length < np.diff(bounds) - 1).tolist()
+        return oversize_lines
@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
 
@@ -5,6 +7,10 @@ from credsweeper.filters import Filter
 class CreditCardNumberCheck(Filter):
     """Check that value is a credit card number."""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
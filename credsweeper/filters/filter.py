@@ -1,10 +1,44 @@
+import time
 from abc import abstractmethod
+from typing import Hashable, NamedTuple, Optional, OrderedDict
 
 from credsweeper.credentials import LineData
 
 
+class FilterCacheInfo(NamedTuple):
+    """Counters of verdict cache of a filter, the same as functools.lru_cache provides"""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class FilterStats(NamedTuple):
+    """Runtime counters of a filter: calls of check(), rejected candidates and total time of the calls in seconds"""
+    calls: int
+    rejections: int
+    elapsed: float
+
+
 class Filter:
-    """Base class for all filters that operates on 'line_data' objects."""
+    """Base class for all filters that operates on 'line_data' objects.
+
+    Verdicts of a filter which defines get_cache_key are memoized in a bounded LRU cache of the filter instance.
+    The instances are shared by rules with the same filter group, so a repeated value is checked once per scan.
+    Calls of check() are counted with the time to order filters of the chains by FilterPlanner.
+
+    """
+
+    # maximal number of memoized verdicts per filter instance
+    CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        self.__cache: OrderedDict[Hashable, bool] = OrderedDict()
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__calls = 0
+        self.__rejections = 0
+        self.__elapsed = 0.0
 
     @abstractmethod
     def run(self, line_data: LineData) -> bool:
@@ -18,3 +52,63 @@ class Filter:
 
         """
         raise NotImplementedError()
+
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """Returns all inputs of run() which determine the verdict.
+
+        Filters which are cheaper than a cache lookup or depend on the whole line data return None.
+
+        Args:
+            line_data: credential candidate data
+
+        Return:
+            hashable key of the verdict or None when the verdict is not memoized
+
+        """
+        return None
+
+    def check(self, line_data: LineData) -> bool:
+        """Returns verdict of run() for the line data. The verdict is memoized for the key of the inputs if any.
+
+        Args:
+            line_data: credential candidate data
+
+        Return:
+            True, if need to filter candidate and False if left
+
+        """
+        start_time = time.perf_counter()
+        key = self.get_cache_key(line_data)  # pylint: disable=assignment-from-none
+        if key is None:
+            verdict = self.run(line_data)
+        else:
+            cached_verdict = self.__cache.get(key)
+            if cached_verdict is None:
+                self.__cache_misses += 1
+                verdict = self.run(line_data)
+                self.__cache[key] = verdict
+                if self.CACHE_SIZE < len(self.__cache):
+                    self.__cache.popitem(last=False)
+            else:
+                self.__cache_hits += 1
+                self.__cache.move_to_end(key)
+                verdict = cached_verdict
+        self.__elapsed += time.perf_counter() - start_time
+        self.__calls += 1
+        if verdict:
+            self.__rejections += 1
+        return verdict
+
+    def stats(self) -> FilterStats:
+        """Returns runtime counters of check() calls"""
+        return FilterStats(self.__calls, self.__rejections, self.__elapsed)
+
+    def cache_info(self) -> FilterCacheInfo:
+        """Returns counters of the verdict cache"""
+        return FilterCacheInfo(self.__cache_hits, self.__cache_misses, self.CACHE_SIZE, len(self.__cache))
+
+    def cache_clear(self) -> None:
+        """Clears the verdict cache and its counters"""
+        self.__cache.clear()
+        self.__cache_hits = 0
+        self.__cache_misses = 0
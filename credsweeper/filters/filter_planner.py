@@ -0,0 +1,60 @@
+from typing import Any, Dict, List, Optional
+
+from credsweeper.filters.filter import Filter, FilterStats
+
+
+class FilterPlanner:
+    """Orders filters of chains to reduce expected cost of filtering.
+
+    A chain removes a candidate when any of its filters rejects it, so the verdict does not depend on the order.
+    For independent filters the expected cost of the chain is minimal when the filters are sorted by ascending ratio
+    of average cost of a call to rejection rate. The estimations are gathered at runtime with Filter.stats() and may
+    be seeded with a profile - the filters part of a report which is saved with --filter-stats.
+
+    Parameters:
+        profile: counters of filters by class name: calls, rejections and elapsed time in seconds
+
+    """
+
+    # chains are reordered on each PLAN_INTERVAL update
+    PLAN_INTERVAL = 64
+
+    def __init__(self, profile: Optional[Dict[str, Any]] = None) -> None:
+        self.__profile: Dict[str, FilterStats] = {}
+        if profile:
+            for filter_name, stats in profile.items():
+                self.__profile[filter_name] = FilterStats(int(stats["calls"]), int(stats["rejections"]),
+                                                          float(stats["elapsed"]))
+        self.__updates = 0
+
+    def get_rank(self, filter_: Filter) -> float:
+        """Returns expected cost of the filter per rejected candidate. Lower rank means earlier place in a chain.
+
+        Args:
+            filter_: filter with runtime counters
+
+        Return:
+            rank of the filter, 0 for filters without statistics to gather them at first
+
+        """
+        calls, rejections, elapsed = filter_.stats()
+        if prior := self.__profile.get(type(filter_).__name__):
+            calls += prior.calls
+            rejections += prior.rejections
+            elapsed += prior.elapsed
+        if 0 == calls:
+            return 0.0
+        # Laplace smoothing of the rejection rate keeps rank of a filter without rejections finite
+        return elapsed / calls * (calls + 2) / (rejections + 1)
+
+    def plan(self, chain: List[Filter]) -> None:
+        """Reorders filters of the chain in place. Sort is stable, so filters with equal ranks keep their order"""
+        ranks = {id(x): self.get_rank(x) for x in chain}
+        chain.sort(key=lambda x: ranks[id(x)])
+
+    def update(self, chains: List[List[Filter]]) -> None:
+        """Reorders the chains on the first update and on each PLAN_INTERVAL update after"""
+        if 0 == self.__updates % self.PLAN_INTERVAL:
+            for chain in chains:
+                self.plan(chain)
+        self.__updates += 1
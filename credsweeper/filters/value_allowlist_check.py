@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from regex import regex
 
 from credsweeper.credentials import LineData
@@ -16,6 +18,10 @@ class ValueAllowlistCheck(Filter):
         Util.get_regex_combine_or(ALLOWED),  #
         flags=regex.IGNORECASE)  # pylint: disable=no-member
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -1,7 +1,6 @@
-from regex import regex
-
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueArrayDictionaryCheck(Filter):
@@ -12,8 +11,6 @@ class ValueArrayDictionaryCheck(Filter):
         `token = {'root'}` would be kept
     """
 
-    PATTERN = regex.compile("\\[('|\")?.+('|\")?\\]")
-
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -26,8 +23,4 @@ class ValueArrayDictionaryCheck(Filter):
         """
         if not line_data.value:
             return True
-
-        if self.PATTERN.search(line_data.value):
-            return True
-
-        return False
+        return get_value_kernel(line_data.value).array_dictionary
@@ -1,16 +1,11 @@
-from regex import regex
-
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
-from credsweeper.utils import Util
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueCamelCaseCheck(Filter):
     """Check that candidate is not written in camel case."""
 
-    CAMEL_CASE = ["^([a-z]+([A-Z][a-z]+)+)$", "^([A-Z][a-z]+([A-Z][a-z]+)+)$"]
-    CAMEL_CASE_PATTERN = regex.compile(Util.get_regex_combine_or(CAMEL_CASE))
-
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -23,8 +18,4 @@ class ValueCamelCaseCheck(Filter):
         """
         if not line_data.value:
             return True
-
-        if self.CAMEL_CASE_PATTERN.match(line_data.value):
-            return True
-
-        return False
+        return get_value_kernel(line_data.value).camel_case
@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from credsweeper.common import static_keyword_checklist
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
@@ -6,6 +8,10 @@ from credsweeper.filters import Filter
 class ValueCoupleKeywordCheck(Filter):
     """Check value if TWO words from morphemes checklist exists in value"""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -18,11 +24,5 @@ class ValueCoupleKeywordCheck(Filter):
         """
         if not line_data.value:
             return True
-        value = line_data.value.lower()
-        matches = 0
-        for keyword in static_keyword_checklist.morpheme_set:
-            if keyword in value:
-                matches += 1
-                if 1 < matches:
-                    return True
-        return False
+        morphemes = static_keyword_checklist.morpheme_automaton.find_words(line_data.value.lower(), limit=2)
+        return 1 < len(morphemes)
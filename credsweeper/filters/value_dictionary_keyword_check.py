@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from credsweeper.common import static_keyword_checklist
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
@@ -6,6 +8,10 @@ from credsweeper.filters import Filter
 class ValueDictionaryKeywordCheck(Filter):
     """Check that no word from dictionary present in the candidate value."""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -18,8 +24,4 @@ class ValueDictionaryKeywordCheck(Filter):
         """
         if not line_data.value:
             return True
-        line_data_value_lower = line_data.value.lower()
-        for keyword in static_keyword_checklist.keyword_set:
-            if keyword in line_data_value_lower:
-                return True
-        return False
+        return static_keyword_checklist.keyword_automaton.has_any(line_data.value.lower())
@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
 from credsweeper.utils import Util
@@ -6,6 +8,10 @@ from credsweeper.utils import Util
 class ValueEntropyCheck(Filter):
     """Check that candidate have Shanon Entropy > 3 (for HEX_CHARS or BASE36_CHARS) or > 4.5 (for BASE64_CHARS)."""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -1,5 +1,6 @@
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueFilePathCheck(Filter):
@@ -21,13 +22,5 @@ class ValueFilePathCheck(Filter):
         """
         if not line_data.value:
             return True
-        contains_unix_separator = '/' in line_data.value
-        contains_windows_separator = ':\\' in line_data.value
-        contains_special_characters = False
-        for i in " !$`&*()+":
-            if i in line_data.value:
-                contains_special_characters = True
-                break
-        if (contains_unix_separator ^ contains_windows_separator) and not contains_special_characters:
-            return True
-        return False
+        value_kernel = get_value_kernel(line_data.value)
+        return (value_kernel.unix_separator ^ value_kernel.windows_separator) and not value_kernel.special_character
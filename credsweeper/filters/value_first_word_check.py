@@ -1,20 +1,11 @@
-from regex import regex
-
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
-from credsweeper.utils import Util
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueFirstWordCheck(Filter):
     """Check that secret doesn't starts with special character."""
 
-    NOT_ALLOWED = [
-        "\\=", "\\{", "\\)", "\\<", "\\>", "\\#", "\\:", "\\\\", "\\/\\/", "\\_", "\\\\[u]", "\\/\\*", "\\%[deflspuvxz]"
-    ]
-    NOT_ALLOWED_PATTERN = regex.compile(  #
-        f"^{Util.get_regex_combine_or(NOT_ALLOWED)}",  #
-        flags=regex.IGNORECASE)  # pylint: disable=no-member
-
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -27,6 +18,4 @@ class ValueFirstWordCheck(Filter):
         """
         if not line_data.value:
             return True
-        if self.NOT_ALLOWED_PATTERN.match(line_data.value):
-            return True
-        return False
+        return get_value_kernel(line_data.value).first_word
@@ -1,6 +1,7 @@
 import base64
 import contextlib
 import json
+from typing import Hashable, Optional
 
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
@@ -13,6 +14,10 @@ class ValueJsonWebTokenCheck(Filter):
     https://datatracker.ietf.org/doc/html/rfc7519
     """
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received token which might be structured.
 
@@ -0,0 +1,124 @@
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+from regex import regex
+
+from credsweeper.utils import Util
+
+# verdicts of the same value are requested by several filters of a chain one after another
+KERNEL_CACHE_SIZE = 256
+
+FIRST_WORD_PATTERN = regex.compile(  #
+    "^" + Util.get_regex_combine_or([
+        "\\=", "\\{", "\\)", "\\<", "\\>", "\\#", "\\:", "\\\\", "\\/\\/", "\\_", "\\\\[u]", "\\/\\*", "\\%[deflspuvxz]"
+    ]),  #
+    flags=regex.IGNORECASE)  # pylint: disable=no-member
+CAMEL_CASE_PATTERN = regex.compile(
+    Util.get_regex_combine_or(["^([a-z]+([A-Z][a-z]+)+)$", "^([A-Z][a-z]+([A-Z][a-z]+)+)$"]))
+ARRAY_DICTIONARY_PATTERN = regex.compile("\\[('|\")?.+('|\")?\\]")
+METHOD_PATTERN = regex.compile(".*\\(.*\\).*")
+NOT_ALLOWED_PATTERN = regex.compile(  #
+    Util.get_regex_combine_or(["[,<>{};\\]\\[](\\s)*", "(\\s)+[\\\\]", "(\\\\n)(\\s)*"]) + "$",  #
+    flags=regex.IGNORECASE)  # pylint: disable=no-member
+TOKEN_SEPARATOR_PATTERN = regex.compile("[ ;)({}<>\\[\\]`]")
+
+# first characters of FIRST_WORD_PATTERN
+FIRST_WORD_CHARACTERS = frozenset("={)<>#:\\/_%")
+# each branch of NOT_ALLOWED_PATTERN contains one of the characters
+NOT_ALLOWED_CHARACTERS = frozenset(",<>{};[]\\")
+TOKEN_SEPARATORS = frozenset(" ;)({}<>[]`")
+SPECIAL_CHARACTERS = frozenset(" !$`&*()+")
+# all characters which are checked by the predicates, the value is scanned for them once
+SIGNIFICANT_CHARACTERS = NOT_ALLOWED_CHARACTERS | TOKEN_SEPARATORS | SPECIAL_CHARACTERS | frozenset("/")
+
+# ASCII tables of the next and previous characters, the out of range neighbours never match an ASCII byte
+ASCENDING_TABLE = bytes(range(1, 129)) + bytes(128)
+DESCENDING_TABLE = b"\x80" + bytes(range(0, 127)) + bytes(128)
+
+
+class ValueKernel(NamedTuple):
+    """Fused predicates of a credential value which are used by value filters.
+
+    The value is scanned once for significant characters, so regular expressions run only for values which may match.
+    Steps of sequences of the same, ascending and descending characters are found with one pass for all of them.
+    The filters are views of the result.
+
+    """
+    first_word: bool
+    last_colon: bool
+    camel_case: bool
+    array_dictionary: bool
+    method: bool
+    not_allowed: bool
+    token_separator: int
+    unix_separator: bool
+    windows_separator: bool
+    special_character: bool
+    equal_steps: bytes
+    ascending_steps: bytes
+    descending_steps: bytes
+
+
+def _get_steps(value: bytes, neighbours: bytes) -> bytes:
+    """Returns XOR of the value and the neighbours shifted by one: zero byte marks the same bytes"""
+    diff = int.from_bytes(value[1:], "big") ^ int.from_bytes(neighbours[:-1], "big")
+    return diff.to_bytes(len(value) - 1, "big")
+
+
+def get_sequence_steps(value: str) -> Tuple[bytes, bytes, bytes]:
+    """Returns steps of sequences of the same, ascending and descending characters in the value.
+
+    Byte i of a result is zero when characters i and i+1 continue the sequence, so N-1 zero bytes in a row mean
+    a sequence of N characters. ASCII values are compared with the shifted copies at once, other values are processed
+    char by char. A line break is not a part of a sequence of the same characters as '(.)\\1' does not match it.
+
+    Args:
+        value: string to check
+
+    Return:
+        tuple of the steps of the same, ascending and descending characters
+
+    """
+    if len(value) < 2:
+        return b"", b"", b""
+    if value.isascii() and '\n' not in value:
+        data = value.encode("ascii")
+        return (_get_steps(data, data), _get_steps(data, data.translate(ASCENDING_TABLE)),
+                _get_steps(data, data.translate(DESCENDING_TABLE)))
+    codes = [ord(x) for x in value]
+    differences = [y - x for x, y in zip(codes, codes[1:])]
+    return (bytes(0 if 0 == x and 10 != y else 1 for x, y in zip(differences, codes[1:])),
+            bytes(0 if 1 == x else 1 for x in differences), bytes(0 if -1 == x else 1 for x in differences))
+
+
+@lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def get_value_kernel(value: str) -> ValueKernel:
+    """Evaluates all predicates of the value at once.
+
+    Args:
+        value: credential candidate value
+
+    Return:
+        ValueKernel of the value
+
+    """
+    characters = SIGNIFICANT_CHARACTERS.intersection(value)
+    token_separator = -1
+    if not characters.isdisjoint(TOKEN_SEPARATORS):
+        token_separator = TOKEN_SEPARATOR_PATTERN.search(value).start()
+    equal_steps, ascending_steps, descending_steps = get_sequence_steps(value)
+    return ValueKernel(
+        first_word=value[:1] in FIRST_WORD_CHARACTERS and bool(FIRST_WORD_PATTERN.match(value)),
+        # '.*:$' is found at the colon, '$' matches before the last line break too
+        last_colon=value.endswith(':') or value.endswith(":\n"),
+        camel_case=value.isalpha() and bool(CAMEL_CASE_PATTERN.match(value)),
+        array_dictionary='[' in characters and ']' in characters and bool(ARRAY_DICTIONARY_PATTERN.search(value)),
+        method="function" in value or '(' in characters and ')' in characters and bool(METHOD_PATTERN.search(value)),
+        not_allowed=not characters.isdisjoint(NOT_ALLOWED_CHARACTERS) and bool(NOT_ALLOWED_PATTERN.search(value)),
+        token_separator=token_separator,
+        unix_separator='/' in characters,
+        windows_separator='\\' in characters and ":\\" in value,
+        special_character=not characters.isdisjoint(SPECIAL_CHARACTERS),
+        equal_steps=equal_steps,
+        ascending_steps=ascending_steps,
+        descending_steps=descending_steps)
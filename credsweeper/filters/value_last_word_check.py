@@ -1,14 +1,11 @@
-from regex import regex
-
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueLastWordCheck(Filter):
     """Check that secret is not short value that ends with `:`."""
 
-    NOT_ALLOWED_COLON_PATTERN = regex.compile(".*:$", flags=regex.IGNORECASE)  # pylint: disable=no-member
-
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -21,6 +18,4 @@ class ValueLastWordCheck(Filter):
         """
         if not line_data.value:
             return True
-        if len(line_data.value) < 16 and self.NOT_ALLOWED_COLON_PATTERN.search(line_data.value):
-            return True
-        return False
+        return len(line_data.value) < 16 and get_value_kernel(line_data.value).last_colon
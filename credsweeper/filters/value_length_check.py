@@ -6,6 +6,7 @@ class ValueLengthCheck(Filter):
     """Check if potential candidate value is not too short (longer or equal to `min_len`)."""
 
     def __init__(self, min_len) -> None:
+        super().__init__()
         self.min_len = min_len
 
     def run(self, line_data: LineData) -> bool:
@@ -1,7 +1,6 @@
-from regex import regex
-
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueMethodCheck(Filter):
@@ -10,8 +9,6 @@ class ValueMethodCheck(Filter):
     Check if potential candidate value is a function by looking for '(', ')' or 'function' sub-strings in it
     """
 
-    PATTERN = regex.compile(".*\\(.*\\).*")
-
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -24,6 +21,4 @@ class ValueMethodCheck(Filter):
         """
         if not line_data.value:
             return True
-        if "function" in line_data.value or self.PATTERN.search(line_data.value):
-            return True
-        return False
+        return get_value_kernel(line_data.value).method
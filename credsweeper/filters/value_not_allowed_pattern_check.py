@@ -1,17 +1,16 @@
-from regex import regex
+from typing import Hashable, Optional
 
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
-from credsweeper.utils import Util
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueNotAllowedPatternCheck(Filter):
     """Check that secret doesn't open or closes brackets or a new line."""
 
-    NOT_ALLOWED = ["[,<>{};\\]\\[](\\s)*", "(\\s)+[\\\\]", "(\\\\n)(\\s)*"]
-    NOT_ALLOWED_PATTERN = regex.compile(  #
-        f"{Util.get_regex_combine_or(NOT_ALLOWED)}$",  #
-        flags=regex.IGNORECASE)  # pylint: disable=no-member
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
 
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
@@ -25,6 +24,4 @@ class ValueNotAllowedPatternCheck(Filter):
         """
         if not line_data.value:
             return True
-        if self.NOT_ALLOWED_PATTERN.search(line_data.value):
-            return True
-        return False
+        return get_value_kernel(line_data.value).not_allowed
@@ -1,7 +1,8 @@
-from regex import regex
+from typing import Hashable, Optional
 
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_sequence_steps, get_value_kernel
 
 DEFAULT_PATTERN_LEN = 4
 
@@ -28,6 +29,7 @@ class ValuePatternCheck(Filter):
             pattern_len: pattern len to use during check. DEFAULT_PATTERN_LEN by default
 
         """
+        super().__init__()
         self.pattern_len = pattern_len
 
     def equal_pattern_check(self, line_data_value: str) -> bool:
@@ -40,10 +42,7 @@ class ValuePatternCheck(Filter):
             True if contain and False if not
 
         """
-        pattern_string = "(.)\\1{" + str(self.pattern_len - 1) + ",}"
-        if regex.findall(pattern_string, line_data_value):
-            return True
-        return False
+        return bytes(self.pattern_len - 1) in get_sequence_steps(line_data_value)[0]
 
     def ascending_pattern_check(self, line_data_value: str) -> bool:
         """Check if candidate value contain 4 and more ascending chars or numbers sequences.
@@ -55,19 +54,7 @@ class ValuePatternCheck(Filter):
             True if contain and False if not
 
         """
-        if not line_data_value:
-            return False
-
-        count = 1
-        for key in range(len(line_data_value) - 1):
-            if ord(line_data_value[key + 1]) - ord(line_data_value[key]) == 1:
-                count += 1
-            else:
-                count = 1
-                continue
-            if count == self.pattern_len:
-                return True
-        return False
+        return bytes(self.pattern_len - 1) in get_sequence_steps(line_data_value)[1]
 
     def descending_pattern_check(self, line_data_value: str) -> bool:
         """Check if candidate value contain 4 and more descending chars or numbers sequences.
@@ -79,19 +66,11 @@ class ValuePatternCheck(Filter):
             boolean variable. True if contain and False if not
 
         """
-        if not line_data_value:
-            return False
-
-        count = 1
-        for key in range(len(line_data_value) - 1):
-            if ord(line_data_value[key]) - ord(line_data_value[key + 1]) == 1:
-                count += 1
-            else:
-                count = 1
-                continue
-            if count == self.pattern_len:
-                return True
-        return False
+        return bytes(self.pattern_len - 1) in get_sequence_steps(line_data_value)[2]
+
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
 
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
@@ -106,13 +85,8 @@ class ValuePatternCheck(Filter):
         if not line_data.value or len(line_data.value) < self.pattern_len:
             return True
 
-        if self.equal_pattern_check(line_data.value):
-            return True
-
-        if self.ascending_pattern_check(line_data.value):
-            return True
-
-        if self.descending_pattern_check(line_data.value):
-            return True
-
-        return False
+        # pattern_len - 1 steps in a row make a sequence of pattern_len characters
+        steps = bytes(self.pattern_len - 1)
+        value_kernel = get_value_kernel(line_data.value)
+        return steps in value_kernel.equal_steps or steps in value_kernel.ascending_steps \
+            or steps in value_kernel.descending_steps
@@ -18,6 +18,8 @@ class ValueSimilarityCheck(Filter):
         # Cannot evaluate if key is None
         if line_data.key is None:
             return False
+        if not line_data.value:
+            return True
         if line_data.key.lower() in line_data.value.lower() and \
                 len(line_data.key) / len(line_data.value) >= 0.7:
             return True
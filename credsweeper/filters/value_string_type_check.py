@@ -20,6 +20,7 @@ class ValueStringTypeCheck(Filter):
     """
 
     def __init__(self, config: Config) -> None:
+        super().__init__()
         self.config = config
 
     def run(self, line_data: LineData) -> bool:
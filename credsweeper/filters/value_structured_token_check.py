@@ -1,5 +1,6 @@
 import base64
 import contextlib
+from typing import Hashable, Optional
 
 from credsweeper.common.constants import LATIN_1
 from credsweeper.credentials import LineData
@@ -9,6 +10,10 @@ from credsweeper.filters import Filter
 class ValueStructuredTokenCheck(Filter):
     """Check that candidate have a known structure"""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received token which might be structured.
 
@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from password_strength import PasswordStats
 
 from credsweeper.common.constants import TOKEN_BASE32_COMPLEXITY
@@ -8,6 +10,10 @@ from credsweeper.filters import Filter
 class ValueTokenBase32Check(Filter):
     """Check that candidate have good randomization"""
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -1,7 +1,8 @@
-from regex import regex
+from typing import Hashable, Optional
 
 from credsweeper.credentials import LineData
 from credsweeper.filters import Filter
+from credsweeper.filters.value_kernel import get_value_kernel
 
 
 class ValueTokenCheck(Filter):
@@ -15,7 +16,9 @@ class ValueTokenCheck(Filter):
 
     """
 
-    SPLIT_PATTERN = " |;|\\)|\\(|{|}|<|>|\\[|\\]|`"
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the value only"""
+        return line_data.value
 
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
@@ -29,14 +32,5 @@ class ValueTokenCheck(Filter):
         """
         if not line_data.value:
             return True
-
-        tokens = regex.split(self.SPLIT_PATTERN, line_data.value, maxsplit=1)
-        # If tokens have length of 1 - pattern is not present in the value and original value returned from `.split(`
-        if len(tokens) < 2:
-            return False
-
-        token = tokens[0]
-        if len(token) < 5:
-            return True
-
-        return False
+        # the first token is shorter than 5 when a separator is present in the value
+        return 0 <= get_value_kernel(line_data.value).token_separator < 5
@@ -1,3 +1,5 @@
+from typing import Hashable, Optional
+
 from regex import regex
 
 from credsweeper.credentials import LineData
@@ -13,6 +15,10 @@ class VariableNotAllowedPatternCheck(Filter):
         Util.get_regex_combine_or(NOT_ALLOWED),  #
         flags=regex.IGNORECASE)  # pylint: disable=no-member
 
+    def get_cache_key(self, line_data: LineData) -> Optional[Hashable]:
+        """The verdict depends on the variable only"""
+        return line_data.variable
+
     def run(self, line_data: LineData) -> bool:
         """Run filter checks on received credential candidate data 'line_data'.
 
@@ -1 +1,2 @@
 from credsweeper.ml_model.ml_validator import MlValidator
+from credsweeper.ml_model.ml_pipeline import MlPipeline
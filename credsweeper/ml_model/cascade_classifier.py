@@ -0,0 +1,68 @@
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+
+class CascadeInfo(NamedTuple):
+    """Counters of cascade classifier"""
+    resolved: int
+    uncertain: int
+    lower: float
+    upper: float
+
+
+class CascadeClassifier:
+    """Logistic regression over the features of ML model which runs before the model.
+
+    A group with the probability of the regression below the lower limit or above the upper limit of the band is decided
+    by the probability. Only the groups in the band are sent to the model. The weights are distilled from the model,
+    so the probability is compared with the threshold as the probability of the model.
+
+    """
+
+    def __init__(self, coef: Any, intercept: float, band: Tuple[float, float]) -> None:
+        """Init
+
+        Args:
+            coef: weights of the features
+            intercept: bias of the regression
+            band: lower and upper limits of probability which requires the model
+
+        """
+        self.coef = np.array(coef, dtype=np.float32)
+        self.intercept = float(intercept)
+        self.lower, self.upper = float(band[0]), float(band[1])
+        if not 0.0 <= self.lower <= self.upper <= 1.0:
+            raise ValueError(f"Wrong band of cascade classifier {band}")
+        self.__resolved = 0
+        self.__uncertain = 0
+
+    @classmethod
+    def from_config(cls,
+                    cascade_details: Dict[str, Any],
+                    band: Optional[Tuple[float, float]] = None) -> "CascadeClassifier":
+        """Creates the classifier from cascade section of model config
+
+        Args:
+            cascade_details: dictionary with coef, intercept and band
+            band: lower and upper limits instead of the band of the config
+
+        """
+        return cls(cascade_details["coef"], cascade_details["intercept"], band or cascade_details["band"])
+
+    def predict(self, feature_input: np.ndarray) -> np.ndarray:
+        """Probabilities of the regression for features of a batch of groups"""
+        probability: np.ndarray = 1.0 / (1.0 + np.exp(-(feature_input @ self.coef + self.intercept)))
+        return probability
+
+    def get_uncertain(self, probability: np.ndarray) -> np.ndarray:
+        """Mask of groups which probabilities are in the band and counts them"""
+        uncertain: np.ndarray = (self.lower <= probability) & (probability <= self.upper)
+        number = int(np.count_nonzero(uncertain))
+        self.__uncertain += number
+        self.__resolved += len(probability) - number
+        return uncertain
+
+    def cascade_info(self) -> CascadeInfo:
+        """Returns counters of the cascade"""
+        return CascadeInfo(self.__resolved, self.__uncertain, self.lower, self.upper)
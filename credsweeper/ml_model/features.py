@@ -1,21 +1,28 @@
 """Most rules are described in 'Secrets in Source Code: Reducing False Positives Using Machine Learning'."""
 
 from abc import ABC, abstractmethod
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 
 import numpy as np
-from scipy.sparse import csr_matrix
 from sklearn.preprocessing import LabelBinarizer
 
 from credsweeper.common.constants import Base, Chars
+from credsweeper.common.entropy import Entropy
+from credsweeper.common.keyword_automaton import KeywordAutomaton
 from credsweeper.credentials import Candidate
 
 
 class Feature(ABC):
     """Base class for features."""
 
+    # Substring checks of few words run in C and are faster than a pass of the automaton implemented in Python
+    AUTOMATON_MIN_WORDS = 128
+
     def __init__(self):
         self.__words: List[str] = []  # type: ignore
+        self.__automaton: Optional[KeywordAutomaton] = None  # type: ignore
+        # number of columns of the feature in input of the model
+        self.width = 1
 
     def __call__(self, candidates: List[Candidate]) -> List[bool]:
         """Call base class for features.
@@ -31,6 +38,10 @@ class Feature(ABC):
         """Abstract method of base class"""
         raise NotImplementedError
 
+    def get_columns(self, candidates: List[Candidate]) -> np.ndarray:
+        """Returns values of the feature for a batch of candidates as a matrix of shape (candidates, width)"""
+        return np.asarray(self(candidates)).reshape(len(candidates), self.width)
+
     @property
     def words(self) -> List[str]:
         """getter"""
@@ -40,9 +51,12 @@ class Feature(ABC):
     def words(self, words: List[str]) -> None:
         """setter - MUST BE IN LOWER CASE"""
         self.__words = words
+        self.__automaton = KeywordAutomaton(words) if self.AUTOMATON_MIN_WORDS <= len(words) else None
 
     def any_word_in_(self, lower_case_line: str) -> bool:
         """Returns true if any words in first line"""
+        if self.__automaton is not None:
+            return self.__automaton.has_any(lower_case_line)
         for i in self.words:
             if i in lower_case_line:
                 return True
@@ -176,24 +190,20 @@ class RenyiEntropy(Feature):
         self.alpha = alpha
         self.norm = norm
 
+    def __call__(self, candidates: List[Candidate]) -> List[np.ndarray]:  # type: ignore
+        """Entropy of values of the candidates is evaluated at once for the batch"""
+        values = tuple(candidate.line_data_list[0].value for candidate in candidates)
+        entropy = Entropy.get_renyi_entropy(values, RenyiEntropy.CHARS[self.base].value, self.alpha, self.norm)
+        return [np.array([x]) for x in entropy]
+
     def extract(self, candidate: Candidate) -> np.ndarray:
-        p_x = self.get_probabilities(candidate.line_data_list[0].value)
-        return np.array([self.estimate_entropy(p_x)])
+        return self([candidate])[0]
 
     def get_probabilities(self, data: str) -> np.ndarray:
         """Get list of alphabet's characters presented in inputted string."""
-        unique_elements = [x for x in RenyiEntropy.CHARS[self.base].value if data.count(x) > 0]
-
-        # perform estimation of probability of characters
-        p_x = np.array([float(data.count(x)) / len(data) for x in unique_elements])
+        p_x: np.ndarray = Entropy.get_probability_matrix((data, ), RenyiEntropy.CHARS[self.base].value, self.norm)[0]
         # get probabilities for alphabet's characters presented in data
-        p_x = p_x[p_x > 0]
-
-        # linear weighting of probabilities for theirs normalization
-        if self.norm:
-            p_x /= p_x.sum()
-
-        return p_x
+        return p_x[p_x > 0]
 
     def estimate_entropy(self, p_x: np.ndarray) -> float:
         """Calculate Renyi entropy of 'p_x' sequence.
@@ -230,29 +240,54 @@ class HartleyEntropy(RenyiEntropy):
         super().__init__(base, 0.0, norm)
 
 
-class FileExtension(Feature):
-    """Categorical feature of file type.
+class LabelFeature(Feature):
+    """Base class of categorical features which are encoded like sklearn LabelBinarizer does.
+
+    The binarizer is fitted once and its rows are looked up with a precomputed index of labels.
+    An unknown label has a row of zeros.
 
     Parameters:
-        extensions: extension labels
+        labels: labels of the classes
 
     """
 
-    def __init__(self, extensions: List[str]) -> None:
+    def __init__(self, labels: List[str]) -> None:
         super().__init__()
-        self.extensions = extensions
-
-    def __call__(self, candidates: List[Candidate]) -> csr_matrix:
         enc = LabelBinarizer()
-        enc.fit(self.extensions)
-        extensions = [candidate.line_data_list[0].file_type for candidate in candidates]
-        return enc.transform(extensions)
+        enc.fit(labels)
+        self.__index: Dict[str, int] = {label: index for index, label in enumerate(enc.classes_)}
+        rows = enc.transform(enc.classes_)
+        self.__rows: np.ndarray = np.vstack([rows, np.zeros((1, rows.shape[1]), dtype=rows.dtype)])
+        self.width = rows.shape[1]
+
+    def transform(self, labels: List[str]) -> np.ndarray:
+        """Returns binarized labels, the same as fitted LabelBinarizer.transform()"""
+        unknown = len(self.__index)
+        indexes = np.fromiter((self.__index.get(x, unknown) for x in labels), dtype=np.intp, count=len(labels))
+        rows: np.ndarray = self.__rows[indexes]
+        return rows
 
     def extract(self, candidate: Candidate) -> Any:
         raise NotImplementedError
 
 
-class RuleName(Feature):
+class FileExtension(LabelFeature):
+    """Categorical feature of file type.
+
+    Parameters:
+        extensions: extension labels
+
+    """
+
+    def __init__(self, extensions: List[str]) -> None:
+        super().__init__(extensions)
+        self.extensions = extensions
+
+    def __call__(self, candidates: List[Candidate]) -> np.ndarray:  # type: ignore
+        return self.transform([candidate.line_data_list[0].file_type for candidate in candidates])
+
+
+class RuleName(LabelFeature):
     """Categorical feature that corresponds to rule name.
 
     Parameters:
@@ -261,14 +296,8 @@ class RuleName(Feature):
     """
 
     def __init__(self, rule_names: List[str]) -> None:
-        super().__init__()
+        super().__init__(rule_names)
         self.rule_names = rule_names
 
-    def __call__(self, candidates: List[Candidate]) -> csr_matrix:
-        enc = LabelBinarizer()
-        enc.fit(self.rule_names)
-        rule_names = [candidate.rule_name for candidate in candidates]
-        return enc.transform(rule_names)
-
-    def extract(self, candidate: Candidate) -> Any:
-        raise NotImplementedError
+    def __call__(self, candidates: List[Candidate]) -> np.ndarray:  # type: ignore
+        return self.transform([candidate.rule_name for candidate in candidates])
@@ -0,0 +1,168 @@
+import logging
+import queue
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from credsweeper.credentials import Candidate, CandidateKey
+from credsweeper.ml_model.ml_validator import MlValidator
+
+logger = logging.getLogger(__name__)
+
+# keys and groups of a batch with encoded values and features
+Batch = Tuple[List[Tuple[CandidateKey, Tuple[Candidate, ...]]], np.ndarray, np.ndarray]
+
+
+class MlPipeline:
+    """ML validation of candidate groups which runs in a worker thread while files are being scanned.
+
+    Candidates of each scanned file are grouped by CandidateKey in the scanning thread. When a batch of groups which
+    require ML is full, the values are encoded and features are extracted in the scanning thread, and the batch is sent
+    over a queue to the worker thread. The worker only calls ONNX InferenceSession which releases GIL, so the model
+    runs in parallel with the scan. A group may get candidates of a file with the same path later, so the group is sent
+    again on join to get the probability of the whole group as ML validation after the scan does.
+
+    The queue keeps a few batches only, so the scan waits for the model when the inference is slower than the scan
+    instead of accumulating encoded batches. An error of the worker stops the scan on next put of candidates.
+
+    """
+
+    # maximal number of encoded batches which wait for the model
+    QUEUE_SIZE = 4
+    # period in seconds to check the worker while the queue is full
+    QUEUE_TIMEOUT = 0.1
+
+    def __init__(self, ml_validator: MlValidator, batch_size: Optional[int]) -> None:
+        """Starts the worker thread
+
+        Args:
+            ml_validator: ML validator with the model
+            batch_size: number of groups for a model call, None - the fastest is chosen on first groups
+
+        """
+        self.ml_validator = ml_validator
+        self.batch_size = batch_size
+        self.__groups: Dict[CandidateKey, List[Candidate]] = {}
+        # size of a group when it was sent to the worker
+        self.__sent: Dict[CandidateKey, int] = {}
+        self.__pending: List[Tuple[CandidateKey, Tuple[Candidate, ...]]] = []
+        self.__predictions: Dict[CandidateKey, Tuple[Tuple[Candidate, ...], float]] = {}
+        self.__queue: queue.Queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.__error: Optional[Exception] = None
+        self.__thread = threading.Thread(target=self.__run, name="ml_pipeline", daemon=True)
+        self.__thread.start()
+
+    def __run(self) -> None:
+        """Worker thread: calls the model for each batch until None is received"""
+        try:
+            while True:
+                batch: Optional[Batch] = self.__queue.get()
+                if batch is None:
+                    break
+                group_list, line_input, feature_input = batch
+                probability = self.ml_validator.predict(line_input, feature_input)
+                # a group sent later replaces previous prediction
+                for (key, group), group_probability in zip(group_list, probability):
+                    self.__predictions[key] = (group, group_probability)
+        except Exception as exc:
+            self.__error = exc
+
+    def __check_worker(self) -> None:
+        """Raises the error of the worker thread if it failed"""
+        if self.__error is not None:
+            raise self.__error
+
+    def __enqueue(self, batch: Optional[Batch]) -> None:
+        """Sends the batch to the worker, waits while the queue is full until the worker takes a batch or fails"""
+        while True:
+            self.__check_worker()
+            try:
+                self.__queue.put(batch, timeout=self.QUEUE_TIMEOUT)
+                return
+            except queue.Full:
+                continue
+
+    def __flush(self, batch_size: int) -> None:
+        """Prepares inputs of the model for full batches of the pending groups and sends them to the worker"""
+        while batch_size <= len(self.__pending):
+            batch, self.__pending = self.__pending[:batch_size], self.__pending[batch_size:]
+            group_list = [(key.value, list(group)) for key, group in batch]
+            line_input = self.ml_validator.encode_batch([x[0] for x in group_list])
+            feature_input = self.ml_validator.extract_features(group_list)
+            self.__enqueue((batch, line_input, feature_input))
+
+    def __send(self, key: CandidateKey, group: List[Candidate]) -> None:
+        """Adds a copy of the group to the pending batch if all candidates of the group require ML"""
+        if all(candidate.use_ml for candidate in group):
+            self.__pending.append((key, tuple(group)))
+            self.__sent[key] = len(group)
+            if self.batch_size is None and self.ml_validator.TUNE_GROUPS <= len(self.__pending):
+                self.batch_size = self.ml_validator.get_batch_size([(x.value, list(y)) for x, y in self.__pending])
+            if self.batch_size:
+                self.__flush(self.batch_size)
+
+    def put(self, candidates: List[Candidate]) -> None:
+        """Adds candidates of a scanned file and sends their groups to ML validation.
+
+        Args:
+            candidates: candidates in the same order as they are added to CredentialManager
+
+        """
+        self.__check_worker()
+        updated: Dict[CandidateKey, List[Candidate]] = {}
+        for candidate in candidates:
+            for line_data in candidate.line_data_list[:1]:
+                key = CandidateKey(line_data)
+                group = self.__groups.setdefault(key, [])
+                group.append(candidate)
+                updated[key] = group
+        for key, group in updated.items():
+            self.__send(key, group)
+
+    def join(self) -> None:
+        """Sends groups which were updated after sending and waits until the worker processes all of them"""
+        for key, group in self.__groups.items():
+            if self.__sent.get(key) != len(group):
+                self.__send(key, group)
+        if self.batch_size is None:
+            self.batch_size = self.ml_validator.get_batch_size([(x.value, list(y)) for x, y in self.__pending])
+        self.__flush(self.batch_size)
+        # the rest of groups is a smaller batch
+        self.__flush(len(self.__pending) or 1)
+        self.__enqueue(None)
+        self.__thread.join()
+        self.__groups.clear()
+        self.__sent.clear()
+        self.__check_worker()
+
+    def validate_groups(self, group_list: List[Tuple[str, List[Candidate]]],
+                        batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Use predictions of the pipeline and ml model for groups which were not predicted with the same candidates.
+
+        Args:
+            group_list: List of tuples (value, group)
+            batch_size: ML model batch
+
+        Return:
+            Boolean numpy array with decision based on the threshold,
+            and numpy array with probability predicted by the model
+
+        """
+        probability = np.zeros(len(group_list))
+        missed: List[int] = []
+        for i, (value, group) in enumerate(group_list):
+            prediction = self.__predictions.get(CandidateKey(group[0].line_data_list[0]))
+            if prediction and len(prediction[0]) == len(group) and all(x is y for x, y in zip(prediction[0], group)):
+                probability[i] = prediction[1]
+                decision = probability[i] > self.ml_validator.threshold
+                logger.debug("ML decision: %s with prediction: %s for value: %s", decision, round(probability[i], 3),
+                             value)
+            else:
+                missed.append(i)
+        if missed:
+            logger.info(f"Run ML Validation for {len(missed)} groups which were not predicted during the scan")
+            _, missed_probability = self.ml_validator.validate_groups([group_list[i] for i in missed], batch_size)
+            probability[missed] = missed_probability
+        is_cred = probability > self.ml_validator.threshold
+        return is_cred, probability
@@ -1,7 +1,10 @@
+import hashlib
 import logging
 import os
 import string
-from typing import List, Tuple, Union, Any
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 import numpy as np
 import onnxruntime as ort
@@ -9,6 +12,8 @@ import onnxruntime as ort
 from credsweeper.common.constants import ThresholdPreset
 from credsweeper.credentials import Candidate
 from credsweeper.ml_model import features
+from credsweeper.ml_model.cascade_classifier import CascadeClassifier
+from credsweeper.ml_model.prediction_cache import PredictionCache
 from credsweeper.utils import Util
 
 logger = logging.getLogger(__name__)
@@ -17,21 +22,65 @@ logger = logging.getLogger(__name__)
 class MlValidator:
     """ML validation class"""
 
-    def __init__(self, threshold: Union[float, ThresholdPreset]) -> None:
+    # batch size when there are too few groups to choose the fastest one
+    DEFAULT_BATCH_SIZE = 16
+    # batch sizes which are compared on first groups to choose the fastest one
+    TUNE_BATCH_SIZES = (16, 32, 64, 128, 256)
+    TUNE_GROUPS = 256
+
+    def __init__(self,
+                 threshold: Union[float, ThresholdPreset],
+                 cache_path: Union[None, str, Path] = None,
+                 cache_size: Optional[int] = None,
+                 session_options: Optional[Dict[str, Any]] = None,
+                 quantized: bool = False,
+                 cascade: bool = False,
+                 cascade_band: Optional[Tuple[float, float]] = None) -> None:
         """Init
 
         Args:
             threshold: decision threshold
+            cache_path: optional path of SQLite file to keep predictions between runs
+            cache_size: maximal number of predictions in the cache file, default size if None
+            session_options: optional attributes of onnxruntime.SessionOptions for the model session
+            quantized: use the model with int8 weights from quantized_model_file of model config which is generated
+                with experiment/quantize.py, its probabilities depend on other groups of a batch
+            cascade: experimental - decide groups with logistic regression of cascade section of model config before
+                the model
+            cascade_band: lower and upper probabilities of the regression which require the model, band of the config
+                if None
         """
         dir_path = os.path.dirname(os.path.realpath(__file__))
-        model_file_path = os.path.join(dir_path, "ml_model.onnx")
-        self.model_session = ort.InferenceSession(model_file_path)
+        model_details = Util.json_load(os.path.join(dir_path, "model_config.json"))
+        model_file = model_details.get("quantized_model_file") if quantized else model_details.get("model_file")
+        if not model_file:
+            raise ValueError(f"Model file is not defined in model config (quantized: {quantized})")
+        model_file_path = os.path.join(dir_path, model_file)
+        if quantized and not os.path.exists(model_file_path):
+            # the quantized model is not shipped because it is lossy
+            raise ValueError(f"Quantized model {model_file_path} is not found, generate it with experiment/quantize.py")
+        self.model_session = ort.InferenceSession(model_file_path,
+                                                  sess_options=self.get_session_options(session_options))
+        # the fastest batch size which is chosen on first groups of the scan
+        self.tuned_batch_size: Optional[int] = None
+        self.prediction_cache: Optional[PredictionCache] = None
+        if cache_path and quantized:
+            # inputs of a batch are quantized together, so a probability depends on other groups of the batch
+            logger.warning("ML prediction cache is not used with the quantized model")
+        elif cache_path:
+            with open(model_file_path, "rb") as f:
+                model_checksum = hashlib.sha256(f.read()).digest()
+            self.prediction_cache = PredictionCache(cache_path, model_checksum, cache_size)
         char_filtered = string.ascii_lowercase + string.digits + string.punctuation
 
         self.char_to_index = {char: index + 1 for index, char in enumerate(char_filtered)}
         self.char_to_index['NON_ASCII'] = len(self.char_to_index) + 1
+        self.num_classes = len(self.char_to_index) + 1
+        # indexes of classes by code of a character, any code above 255 is not ASCII too
+        self.char_index_table = np.full(256, self.char_to_index['NON_ASCII'], dtype=np.intp)
+        for char in char_filtered:
+            self.char_index_table[ord(char)] = self.char_to_index[char]
 
-        model_details = Util.json_load(os.path.join(dir_path, "model_config.json"))
         if isinstance(threshold, float):
             self.threshold = threshold
         elif isinstance(threshold, ThresholdPreset) and "thresholds" in model_details:
@@ -59,6 +108,47 @@ class MlValidator:
                 self.unique_feature_list.append(feature)
             else:
                 self.common_feature_list.append(feature)
+        self.common_width = sum(x.width for x in self.common_feature_list)
+        self.unique_width = sum(x.width for x in self.unique_feature_list)
+        self.cascade: Optional[CascadeClassifier] = None
+        if cascade:
+            if "cascade" not in model_details:
+                raise ValueError("Cascade classifier is not defined in model config")
+            if model_details["cascade"].get("experimental"):
+                logger.warning("ML cascade classifier is experimental, its decisions may differ from ML model")
+            self.cascade = CascadeClassifier.from_config(model_details["cascade"], cascade_band)
+            if self.cascade.coef.shape != (self.common_width + self.unique_width, ):
+                raise ValueError(f"Cascade classifier has {len(self.cascade.coef)} weights"
+                                 f" for {self.common_width + self.unique_width} features")
+
+    def close(self) -> None:
+        """Closes the prediction cache file, it is opened again on next use"""
+        if self.prediction_cache:
+            self.prediction_cache.close()
+
+    @staticmethod
+    def get_session_options(options: Optional[Dict[str, Any]]) -> ort.SessionOptions:
+        """Creates options of ONNX runtime session.
+
+        Args:
+            options: values of attributes of onnxruntime.SessionOptions e.g. intra_op_num_threads, names of members
+                are accepted for graph_optimization_level (ORT_ENABLE_ALL) and execution_mode (ORT_PARALLEL)
+
+        Return:
+            session options, default ones for empty options
+
+        """
+        session_options = ort.SessionOptions()
+        enums = {"graph_optimization_level": ort.GraphOptimizationLevel, "execution_mode": ort.ExecutionMode}
+        for name, value in (options or {}).items():
+            if name.startswith("_") or not hasattr(session_options, name):
+                raise ValueError(f'Unknown option of ONNX runtime session "{name}"')
+            if name in enums and isinstance(value, str):
+                if not hasattr(enums[name], value):
+                    raise ValueError(f'Unknown value "{value}" of ONNX runtime session option "{name}"')
+                value = getattr(enums[name], value)
+            setattr(session_options, name, value)
+        return session_options
 
     def encode(self, line, char_to_index) -> np.ndarray:
         """Encodes line to array"""
@@ -76,38 +166,80 @@ class MlValidator:
                 result_array[i, 0] = 1
         return result_array
 
+    def encode_batch(self, values: List[str]) -> np.ndarray:
+        """Encodes values to one-hot float32 tensor of shape (batch, maxlen, num_classes) like encode() does.
+
+        Characters of all values are converted to class indexes with the lookup table at once.
+
+        Args:
+            values: list of candidate values
+
+        Return:
+            preallocated tensor with a row of classes for each position of each value
+
+        """
+        lines = [x.strip().lower()[-self.maxlen:] for x in values]
+        lengths = np.fromiter((len(x) for x in lines), dtype=np.intp, count=len(lines))
+        codes = np.frombuffer("".join(lines).encode("utf_32_le", errors="surrogatepass"), dtype=np.uint32)
+        result = np.zeros((len(lines), self.maxlen, self.num_classes), dtype=np.float32)
+        rows = np.repeat(np.arange(len(lines)), lengths)
+        positions = np.arange(len(codes)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        result[rows, positions, self.char_index_table[np.minimum(codes, 255)]] = 1
+        # padding class after the end of each value
+        result[:, :, 0] = lengths[:, np.newaxis] <= np.arange(self.maxlen)
+        return result
+
     def _call_model(self, line_input: np.ndarray, feature_input: np.ndarray) -> Any:
-        line_input = line_input.astype(np.float32)
-        feature_input = feature_input.astype(np.float32)
+        line_input = line_input.astype(np.float32, copy=False)
+        feature_input = feature_input.astype(np.float32, copy=False)
         return self.model_session.run(None, {"line_input": line_input, "feature_input": feature_input})[0]
 
+    @staticmethod
+    def _fill_features(feature_list: List[features.Feature], candidates: List[Candidate], out: np.ndarray) -> None:
+        """Fills columns of the matrix with values of the features for the candidates, a row per candidate"""
+        column = 0
+        for feature in feature_list:
+            out[:, column:column + feature.width] = feature.get_columns(candidates)
+            column += feature.width
+
     def extract_common_features(self, candidates: List[Candidate]) -> np.ndarray:
         """Extract features that are guaranteed to be the same for all candidates on the same line with same value."""
-        feature_array = np.array([], dtype=float)
+        feature_array = np.zeros((1, self.common_width))
         # Extract features from credential candidate
-        default_candidate = candidates[0]
-        for feature in self.common_feature_list:
-            new_feature = feature([default_candidate])[0]
-            if not isinstance(new_feature, np.ndarray):
-                new_feature = np.array([new_feature])
-            feature_array = np.append(feature_array, new_feature)
-        return feature_array
+        self._fill_features(self.common_feature_list, candidates[:1], feature_array)
+        common_features: np.ndarray = feature_array[0]
+        return common_features
 
     def extract_unique_features(self, candidates: List[Candidate]) -> np.ndarray:
         """Extract features that can by different between candidates. Join them with or operator."""
-        feature_array = np.array([], dtype=bool)
-        default_candidate = candidates[0]
-        for feature in self.unique_feature_list:
-            new_feature = feature([default_candidate])[0]
-            if not isinstance(new_feature, np.ndarray):
-                new_feature = np.array([new_feature])
-            feature_array = np.append(feature_array, new_feature)
-        for candidate in candidates[1:]:
-            for feature in self.unique_feature_list:
-                new_feature = feature([candidate])[0]
-                if not isinstance(new_feature, np.ndarray):
-                    new_feature = np.array([new_feature])
-                feature_array = feature_array | new_feature
+        feature_array = np.zeros((len(candidates), self.unique_width))
+        self._fill_features(self.unique_feature_list, candidates, feature_array)
+        unique_features: np.ndarray = np.any(feature_array, axis=0)
+        return unique_features
+
+    def extract_features(self, group_list: List[Tuple[str, List[Candidate]]]) -> np.ndarray:
+        """Extract features of groups of candidates to one matrix with a row per group.
+
+        Each feature is computed for the whole batch at once. Common features are computed for the first candidate of
+        a group, unique features for all candidates and joined with or operator per group.
+
+        Args:
+            group_list: List of tuples (value, group)
+
+        Return:
+            float32 matrix of shape (groups, common and unique features) - input of the model
+
+        """
+        feature_array = np.zeros((len(group_list), self.common_width + self.unique_width), dtype=np.float32)
+        first_candidates = [x[1][0] for x in group_list]
+        self._fill_features(self.common_feature_list, first_candidates, feature_array[:, :self.common_width])
+        if self.unique_feature_list:
+            candidates = [candidate for _, group in group_list for candidate in group]
+            unique_array = np.zeros((len(candidates), self.unique_width), dtype=np.float32)
+            self._fill_features(self.unique_feature_list, candidates, unique_array)
+            # groups are not empty and follow one another, so or operator of 0 and 1 is maximum of each slice
+            offsets = np.cumsum([0] + [len(x[1]) for x in group_list[:-1]])
+            feature_array[:, self.common_width:] = np.maximum.reduceat(unique_array, offsets, axis=0)
         return feature_array
 
     def validate(self, candidate: Candidate) -> Tuple[bool, float]:
@@ -120,50 +252,100 @@ class MlValidator:
         """
         `np.newaxis` used to add new dimension if front, so input will be treated as a batch
         """
-        line_input = self.encode(value, self.char_to_index)[np.newaxis]
-
-        common_features = self.extract_common_features(candidates)
-        unique_features = self.extract_unique_features(candidates)
-        feature_array = np.hstack([common_features, unique_features])
-        feature_array = np.array([feature_array])
+        line_input = self.encode_batch([value])
+        feature_array = self.extract_features([(value, candidates)])
         return line_input, feature_array
 
-    def _batch_call_model(self, line_inputs, feature_array_list):
+    def predict(self, line_input: np.ndarray, feature_input: np.ndarray) -> np.ndarray:
+        """Probabilities of the model for encoded values and features of a batch of groups.
+
+        With the cascade classifier, the model is called only for groups with uncertain probability of the classifier
+        and the rest get the probability of the classifier.
+
+        """
+        if self.cascade is None:
+            return self._predict(line_input, feature_input)
+        probability = self.cascade.predict(feature_input)
+        uncertain = self.cascade.get_uncertain(probability)
+        if uncertain.any():
+            probability[uncertain] = self._predict(line_input[uncertain], feature_input[uncertain])
+        return probability
+
+    def _predict(self, line_input: np.ndarray, feature_input: np.ndarray) -> np.ndarray:
+        """The model is called only for inputs which are missed in the prediction cache if it is used"""
+        if self.prediction_cache is None:
+            probability: np.ndarray = self._call_model(line_input, feature_input)[:, 0]
+            return probability
+        keys = self.prediction_cache.get_keys(line_input, feature_input)
+        cached = self.prediction_cache.get(keys)
+        probability = np.array([0.0 if x is None else x for x in cached], dtype=np.float32)
+        missed = [i for i, x in enumerate(cached) if x is None]
+        if missed:
+            probability[missed] = self._call_model(line_input[missed], feature_input[missed])[:, 0]
+            self.prediction_cache.put([keys[i] for i in missed], probability[missed].tolist())
+        return probability
+
+    def _batch_call_model(self, group_list: List[Tuple[str, List[Candidate]]]) -> np.ndarray:
         """auxiliary method to invoke twice"""
-        line_inputs_stack = np.vstack(line_inputs)
-        feature_array_vstack = np.vstack(feature_array_list)
-        return self._call_model(line_inputs_stack, feature_array_vstack)[:, 0]
+        line_input = self.encode_batch([x[0] for x in group_list])
+        return self.predict(line_input, self.extract_features(group_list))
+
+    def tune_batch_size(self, group_list: List[Tuple[str, List[Candidate]]]) -> int:
+        """Chooses the fastest of TUNE_BATCH_SIZES on first TUNE_GROUPS groups and keeps it for next calls.
+
+        Encoding, feature extraction and the model call are measured because all of them depend on the batch size.
+        The model is called without the prediction cache after a warming up call.
+
+        Args:
+            group_list: List of tuples (value, group)
+
+        Return:
+            the fastest batch size
+
+        """
+        sample = group_list[:self.TUNE_GROUPS]
+        warm_up = sample[:self.DEFAULT_BATCH_SIZE]
+        self._call_model(self.encode_batch([x[0] for x in warm_up]), self.extract_features(warm_up))
+        elapsed: Dict[int, float] = {}
+        for batch_size in self.TUNE_BATCH_SIZES:
+            start_time = time.perf_counter()
+            for head in range(0, len(sample), batch_size):
+                batch = sample[head:head + batch_size]
+                self._call_model(self.encode_batch([x[0] for x in batch]), self.extract_features(batch))
+            elapsed[batch_size] = time.perf_counter() - start_time
+        self.tuned_batch_size = min(elapsed, key=lambda x: elapsed[x])
+        logger.info("ML batch size %d is chosen with time of %d groups for batch sizes: %s", self.tuned_batch_size,
+                    len(sample), elapsed)
+        return self.tuned_batch_size
+
+    def get_batch_size(self, group_list: List[Tuple[str, List[Candidate]]]) -> int:
+        """Returns tuned batch size, tunes it with the groups if there are enough of them or default size"""
+        if self.tuned_batch_size:
+            return self.tuned_batch_size
+        if self.TUNE_GROUPS <= len(group_list):
+            return self.tune_batch_size(group_list)
+        return self.DEFAULT_BATCH_SIZE
 
     def validate_groups(self, group_list: List[Tuple[str, List[Candidate]]],
-                        batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+                        batch_size: Optional[int]) -> Tuple[np.ndarray, np.ndarray]:
         """Use ml model on list of candidate groups.
 
         Args:
             group_list: List of tuples (value, group)
-            batch_size: ML model batch
+            batch_size: ML model batch, None - the fastest batch size is chosen on first groups
 
         Return:
             Boolean numpy array with decision based on the threshold,
             and numpy array with probability predicted by the model
 
         """
-        line_input_list = []
-        features_list = []
+        if batch_size is None:
+            batch_size = self.get_batch_size(group_list)
         probability = np.zeros(len(group_list))
-        head = tail = 0
-        for (value, candidates) in group_list:
-            line_input, feature_array = self.get_group_features(value, candidates)
-            line_input_list.append(line_input)
-            features_list.append(feature_array)
-            tail += 1
-            if 0 == tail % batch_size:
-                # use the approach to reduce memory consumption for huge candidates list
-                probability[head:tail] = self._batch_call_model(line_input_list, features_list)
-                head = tail
-                line_input_list.clear()
-                features_list.clear()
-        if head != tail:
-            probability[head:tail] = self._batch_call_model(line_input_list, features_list)
+        # use the approach to reduce memory consumption for huge candidates list
+        for head in range(0, len(group_list), batch_size):
+            tail = min(head + batch_size, len(group_list))
+            probability[head:tail] = self._batch_call_model(group_list[head:tail])
         is_cred = probability > self.threshold
         for i in range(len(is_cred)):
             logger.debug("ML decision: %s with prediction: %s for value: %s", is_cred[i], round(probability[i], 3),
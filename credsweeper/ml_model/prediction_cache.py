@@ -0,0 +1,134 @@
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionCacheInfo(NamedTuple):
+    """Counters of ML prediction cache"""
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class PredictionCache:
+    """Probabilities of ML model kept in SQLite file between runs.
+
+    A key is a digest of the model file checksum and of the exact inputs of a group for the model: class indexes of
+    the one-hot encoded value and bytes of the feature vector. So a cached probability is the same as the model gives
+    for the inputs in any batch. The least recently used predictions are evicted when the cache exceeds the size.
+    The file is closed after a run and it is opened again on next use.
+
+    """
+
+    # maximal number of predictions in the file by default
+    DEFAULT_SIZE = 1 << 20
+    # SQLite limits number of parameters of a statement
+    QUERY_SIZE = 500
+
+    def __init__(self, path: Union[str, Path], model_checksum: bytes, maxsize: Optional[int] = None) -> None:
+        """Opens or creates the cache file
+
+        Args:
+            path: path of SQLite database file
+            model_checksum: checksum of the model file, predictions of other models are not used
+            maxsize: maximal number of predictions in the file, DEFAULT_SIZE if None
+
+        """
+        self.path = path
+        self.maxsize = maxsize or self.DEFAULT_SIZE
+        self.__model_checksum = model_checksum
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__size = 0
+        self.__used = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__connect()
+
+    def __connect(self) -> sqlite3.Connection:
+        """Opens the cache file if it is closed"""
+        if self.__connection is not None:
+            return self.__connection
+        # the connection is used by one thread at a time: ML pipeline worker during the scan and main thread after it
+        connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        # lost predictions are computed again, so the file is not synchronized on each commit
+        connection.execute("PRAGMA synchronous = OFF")
+        connection.execute("CREATE TABLE IF NOT EXISTS predictions"
+                           " (key BLOB PRIMARY KEY, probability REAL NOT NULL, used INTEGER NOT NULL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS predictions_used ON predictions (used)")
+        connection.commit()
+        size, last_used = connection.execute("SELECT COUNT(*), MAX(used) FROM predictions").fetchone()
+        self.__size = size
+        # predictions used in the run are newer than all previous
+        self.__used = 1 + (last_used or 0)
+        self.__connection = connection
+        logger.info("ML prediction cache %s has %d predictions", self.path, size)
+        return connection
+
+    def get_keys(self, line_input: np.ndarray, feature_input: np.ndarray) -> List[bytes]:
+        """Digests of inputs of the model for each group of a batch.
+
+        Args:
+            line_input: one-hot encoded values of shape (batch, maxlen, num_classes)
+            feature_input: features of shape (batch, features)
+
+        Return:
+            key of the cache for each group
+
+        """
+        classes = np.argmax(line_input, axis=2).astype(np.uint16)
+        features = np.ascontiguousarray(feature_input, dtype=np.float32)
+        return [
+            hashlib.blake2b(self.__model_checksum + x.tobytes() + y.tobytes(), digest_size=16).digest()
+            for x, y in zip(classes, features)
+        ]
+
+    def get(self, keys: List[bytes]) -> List[Optional[float]]:
+        """Cached probabilities for the keys, None for a missed key. Found predictions are marked as used."""
+        connection = self.__connect()
+        found: Dict[bytes, float] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for head in range(0, len(unique_keys), self.QUERY_SIZE):
+            chunk = unique_keys[head:head + self.QUERY_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                connection.execute(f"SELECT key, probability FROM predictions WHERE key IN ({placeholders})", chunk))
+            connection.execute(f"UPDATE predictions SET used = ? WHERE key IN ({placeholders})", [self.__used, *chunk])
+        connection.commit()
+        probabilities = [found.get(x) for x in keys]
+        missed = probabilities.count(None)
+        self.__hits += len(keys) - missed
+        self.__misses += missed
+        return probabilities
+
+    def put(self, keys: List[bytes], probabilities: List[float]) -> None:
+        """Stores predictions and evicts the least recently used ones when the cache is oversize"""
+        connection = self.__connect()
+        rows = [(key, float(probability), self.__used) for key, probability in zip(keys, probabilities)]
+        cursor = connection.executemany("INSERT OR IGNORE INTO predictions VALUES (?, ?, ?)", rows)
+        self.__size += cursor.rowcount
+        if self.maxsize < self.__size:
+            cursor = connection.execute(
+                "DELETE FROM predictions WHERE key IN (SELECT key FROM predictions ORDER BY used LIMIT ?)",
+                (self.__size - self.maxsize, ))
+            self.__size -= cursor.rowcount
+            self.__evictions += cursor.rowcount
+        connection.commit()
+
+    def cache_info(self) -> PredictionCacheInfo:
+        """Returns counters of the cache"""
+        return PredictionCacheInfo(self.__hits, self.__misses, self.__evictions, self.maxsize, self.__size)
+
+    def close(self) -> None:
+        """Closes the cache file, it is opened again on next use"""
+        if self.__connection is not None:
+            self.__connection.close()
+            self.__connection = None
@@ -30,6 +30,8 @@ class Rule:
           one of this substrings
         min_line_len: Optional minimal line length. Scanner would only apply this rule if line is equal or longer
         usage_list: List of analyze types. There are 2 different analyze type now ("src", "doc")
+        shared_filters: Optional dictionary of filters by filter_type. Rules with the same filter_type use the same
+          filter instances from the dictionary, so memoized verdicts of the filters are shared
 
     """
 
@@ -37,8 +39,12 @@ class Rule:
     MULTI_PATTERN = "multi_pattern"
     PEM_KEY_PATTERN = "pem_key_pattern"
 
-    def __init__(self, config: Config, rule_template: Dict) -> None:
+    def __init__(self,
+                 config: Config,
+                 rule_template: Dict,
+                 shared_filters: Optional[Dict[str, List[Filter]]] = None) -> None:
         self.config = config
+        self.__shared_filters = shared_filters
         self._assert_all_rule_fields(rule_template)
         self.rule_name: Optional[str] = rule_template.get("name")
         _rule_template_type = rule_template.get("type")
@@ -99,10 +105,15 @@ class Rule:
         if filter_type == "" or filter_type is None:
             self.__filters = []
         else:
+            if self.__shared_filters is not None and filter_type in self.__shared_filters:
+                self.__filters = self.__shared_filters[filter_type]
+                return
             filter_group = getattr(group, filter_type, None)
             if filter_group is None:
                 raise ValueError(f'Malformed rule config file. Rule filter_type "{filter_type}" is invalid.')
             self.__filters = filter_group(self.config).filters
+            if self.__shared_filters is not None:
+                self.__shared_filters[filter_type] = self.__filters
 
     @staticmethod
     def _get_patterns(_rule_type: RuleType, _values: List[str]) -> List[regex.Pattern]:
@@ -0,0 +1,472 @@
+import atexit
+import logging
+import multiprocessing
+import os
+import time
+from multiprocessing.pool import Pool
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from credsweeper.config import Config
+from credsweeper.credentials import Candidate, LineData
+from credsweeper.file_handler.analysis_target import FileView
+from credsweeper.file_handler.diff_content_provider import DiffContentProvider
+from credsweeper.file_handler.file_path_extractor import FilePathExtractor
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.file_handler.text_lines import TextLines
+from credsweeper.rules import Rule
+from credsweeper.scanner.scan_type import MultiPattern, PemKeyPattern
+from credsweeper.utils import Util
+
+logger = logging.getLogger(__name__)
+
+# version of the result record of a file, the parent rejects records of another version
+RECORD_VERSION = 1
+# rule id of dummy candidate for a file with suspicious extension
+DUMMY_RULE_ID = -1
+
+# estimated cost of a file besides its size in bytes: opening, reading and dispatching
+FILE_COST = 1024
+# containers are unpacked with deep scan and their content is scanned with all deep scanners
+CONTAINER_COST_FACTOR = 4
+# each chunk takes at most this part of the remaining cost per process, so chunks become smaller to the end
+CHUNKS_PER_PROCESS = 4
+
+# context lines of a chunk: the second part of multi pattern rules is searched around the line in both directions
+CONTEXT_BEFORE = MultiPattern.MAX_SEARCH_MARGIN
+# a key follows the start of PEM key after leading config lines, so the margin is twice the limit of key lines
+CONTEXT_AFTER = max(MultiPattern.MAX_SEARCH_MARGIN, 2 * PemKeyPattern.max_key_lines)
+
+
+class WorkerInfo(NamedTuple):
+    """Utilization of a process of the pool in the last scan"""
+    pid: int
+    files: int
+    busy: float
+    utilization: float
+
+
+class TextChunk(NamedTuple):
+    """Part of the text of a large file: lines from start to end of the text are scanned, other lines are context"""
+    file_path: str
+    file_type: str
+    info: str
+    text: str
+    first_line: int
+    start: int
+    end: int
+
+
+# scanning instance of CredSweeper in a process of the pool and ids of its rules
+_worker_sweeper: Any = None
+_worker_rule_ids: Dict[str, int] = {}
+
+
+def get_rule_table(cred_sweeper: Any) -> List[Rule]:
+    """Rules of all scanners of CredSweeper instance, the index of a rule is the rule id in result records.
+
+    The table is the same in the processes and in the parent because it is built from the same scan spec.
+
+    """
+    rules = {x.rule_name: x for x in cred_sweeper.scanner.rules}
+    for rule in cred_sweeper.doc_scanner.rules:
+        rules.setdefault(rule.rule_name, rule)
+    return list(rules.values())
+
+
+def _encode_substring(line: str, substring: Optional[str]) -> Union[None, str, Tuple[int, int]]:
+    """Span of the substring in the line or the string itself when it is not a part of the line"""
+    if substring:
+        start = line.find(substring)
+        if 0 <= start:
+            return start, start + len(substring)
+    return substring
+
+
+def _decode_substring(line: str, item: Union[None, str, Tuple[int, int]]) -> Optional[str]:
+    """Restores the string from the span in the line"""
+    if isinstance(item, tuple):
+        return line[item[0]:item[1]]
+    return item
+
+
+def encode_candidates(index: int, candidates: List[Candidate], rule_ids: Dict[str, int]) -> Tuple[Any, ...]:
+    """Compact record of candidates of a file which is sent from a process of the pool.
+
+    Objects which are shared with rules and config are replaced with the rule id and the index of the pattern. Key,
+    value and variable are stored as spans in the line.
+
+    Args:
+        index: index of the file in the scanned sequence
+        candidates: candidates of the file found by a scanner
+        rule_ids: index of each rule in the rule table
+
+    Return:
+        tuple of the record version, the file index and records of the candidates
+
+    """
+    candidate_records: List[Tuple[Any, ...]] = []
+    for candidate in candidates:
+        if candidate.rule_name not in rule_ids:
+            # only a dummy candidate has no rule
+            line_data = candidate.line_data_list[0]
+            candidate_records.append((DUMMY_RULE_ID, line_data.path, line_data.file_type, line_data.info))
+            continue
+        line_data_records = []
+        for line_data in candidate.line_data_list:
+            line = line_data.line
+            line_data_records.append(
+                (line, line_data.line_num, line_data.path, line_data.file_type, line_data.info,
+                 candidate.patterns.index(line_data.pattern), _encode_substring(line, line_data.key),
+                 line_data.separator, line_data.separator_span, _encode_substring(line, line_data.value),
+                 _encode_substring(line, line_data.variable), line_data.value_leftquote, line_data.value_rightquote))
+        candidate_records.append((rule_ids[candidate.rule_name], tuple(line_data_records)))
+    return RECORD_VERSION, index, tuple(candidate_records)
+
+
+def decode_candidates(record: Tuple[Any, ...], rules: List[Rule], config: Config) -> Tuple[int, List[Candidate]]:
+    """Rehydrates candidates of a file from the record in the parent process
+
+    Args:
+        record: result record of a file from encode_candidates
+        rules: the rule table of the same scan spec
+        config: config of the parent which is shared by the candidates
+
+    Return:
+        index of the file and its candidates
+
+    """
+    version, index, candidate_records = record
+    if RECORD_VERSION != version:
+        raise ValueError(f"Unsupported version {version} of scan result record")
+    candidates: List[Candidate] = []
+    for candidate_record in candidate_records:
+        rule_id = candidate_record[0]
+        if DUMMY_RULE_ID == rule_id:
+            _, path, file_type, info = candidate_record
+            candidates.append(Candidate.get_dummy_candidate(config, path, file_type, info))
+            continue
+        rule = rules[rule_id]
+        line_data_list: List[LineData] = []
+        for (line, line_num, path, file_type, info, pattern_index, key, separator, separator_span, value, variable,
+             value_leftquote, value_rightquote) in candidate_record[1]:
+            # the state is set directly to avoid repeated search of the pattern
+            line_data = LineData.__new__(LineData)
+            line_data.__setstate__(
+                (config, _decode_substring(line, key), line, line_num, path, file_type, info,
+                 rule.patterns[pattern_index], separator, separator_span, _decode_substring(line, value),
+                 _decode_substring(line, variable), value_leftquote, value_rightquote))
+            line_data_list.append(line_data)
+        candidates.append(
+            Candidate(line_data_list, rule.patterns, rule.rule_name, rule.severity, config, rule.validations,
+                      rule.use_ml))
+    return index, candidates
+
+
+def estimate_cost(content_provider: Union[DiffContentProvider, TextContentProvider], config: Config) -> int:
+    """Estimated time of file_scan for the file in relative units which are close to bytes
+
+    Args:
+        content_provider: file object to scan
+        config: config of the scan
+
+    """
+    if FilePathExtractor.is_find_by_ext_file(config, content_provider.file_type):
+        # the file is not read
+        return FILE_COST
+    if content_provider.file_type in config.exclude_containers:
+        if config.depth or config.doc:
+            return FILE_COST + CONTAINER_COST_FACTOR * content_provider.size
+        # the file is skipped
+        return FILE_COST
+    return FILE_COST + content_provider.size
+
+
+def get_chunks(costs: Sequence[int], processes: int) -> List[List[int]]:
+    """Splits the tasks to chunks which are dispatched to free processes: the largest tasks go first and a chunk takes
+    tasks until its cost reaches the part of the remaining cost, so large files are sent one by one and small files are
+    gathered in chunks which become smaller to the end of the scan.
+
+    Args:
+        costs: estimated cost of each task
+        processes: number of processes
+
+    Return:
+        list of chunks with indices of the tasks
+
+    """
+    order = sorted(range(len(costs)), key=lambda x: costs[x], reverse=True)
+    remaining = sum(costs)
+    chunks: List[List[int]] = []
+    chunk: List[int] = []
+    chunk_cost = limit = 0
+    for index in order:
+        if chunk and limit <= chunk_cost:
+            chunks.append(chunk)
+            chunk = []
+            chunk_cost = 0
+        if not chunk:
+            limit = remaining // (CHUNKS_PER_PROCESS * processes)
+        chunk.append(index)
+        chunk_cost += costs[index]
+        remaining -= costs[index]
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def split_text(text: str, chunk_size: int, file_path: str, file_type: str, info: str) -> List[TextChunk]:
+    """Splits the text on line boundaries to chunks of about chunk_size characters.
+
+    Each chunk has context lines before and after the scanned lines, so multi pattern and PEM key rules find the same
+    lines as in whole text.
+
+    Args:
+        text: whole text of a file with LF line endings
+        chunk_size: minimal number of characters of scanned lines of a chunk except the last one
+        file_path: path to the file
+        file_type: type of the file in extension format '.txt'
+        info: extended info
+
+    Return:
+        list of the chunks in order of the lines
+
+    """
+    # positions of the first characters of scanned lines of the chunks and the end of the text as for a newline after
+    bounds = [0]
+    while 0 <= (newline := text.find('\n', bounds[-1] + chunk_size)):
+        bounds.append(newline + 1)
+    bounds.append(len(text) + 1)
+    chunks: List[TextChunk] = []
+    line_index = 0
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        context_start = start
+        before = 0
+        while before < CONTEXT_BEFORE and 0 < context_start:
+            context_start = text.rfind('\n', 0, context_start - 1) + 1
+            before += 1
+        context_end = end - 1
+        for _ in range(CONTEXT_AFTER):
+            if len(text) <= context_end:
+                break
+            newline = text.find('\n', context_end + 1)
+            context_end = newline if 0 <= newline else len(text)
+        lines_number = text.count('\n', start, end - 1) + 1
+        chunks.append(
+            TextChunk(file_path, file_type, info, text[context_start:context_end], line_index - before + 1, before,
+                      before + lines_number))
+        line_index += lines_number
+    return chunks
+
+
+def split_file(content_provider: Union[DiffContentProvider, TextContentProvider], config: Config,
+               chunk_size: int) -> List[TextChunk]:
+    """Splits a text file larger than chunk_size to chunks which are scanned in parallel
+
+    Args:
+        content_provider: file object to scan
+        config: config of the scan
+        chunk_size: size of a chunk in bytes
+
+    Return:
+        chunks of the file or empty list if the file is scanned entirely
+
+    """
+    if not isinstance(content_provider, TextContentProvider) or content_provider.size <= chunk_size:
+        return []
+    # deep scan, containers and xml are processed by file_scan only
+    if config.depth or config.doc or FilePathExtractor.is_find_by_ext_file(config, content_provider.file_type) \
+            or content_provider.file_type in config.exclude_containers \
+            or ".xml" == Util.get_extension(content_provider.file_path):
+        return []
+    text = content_provider.get_text()
+    # the text is kept in the chunks only
+    content_provider.data = None
+    if text is None:
+        return []
+    chunks = split_text(text, chunk_size, content_provider.file_path, content_provider.file_type, content_provider.info)
+    return chunks if 1 < len(chunks) else []
+
+
+def scan_chunk(cred_sweeper: Any, chunk: TextChunk) -> List[Candidate]:
+    """Scans the scanned lines of the chunk as file_scan does for whole text.
+
+    Context lines are not scanned because they belong to neighbour chunks. Line numbers are set as in the file.
+
+    Args:
+        cred_sweeper: CredSweeper instance with scanners
+        chunk: part of a file
+
+    Return:
+        candidates of the scanned lines
+
+    """
+    candidates: List[Candidate]
+    if cred_sweeper.config.buffer_scan:
+        candidates = cred_sweeper.scanner.scan_text(chunk.text, chunk.file_path, chunk.file_type, chunk.info,
+                                                    chunk.first_line, chunk.start, chunk.end)
+    else:
+        file_view = FileView(TextLines(chunk.text), None, chunk.file_path, chunk.file_type, chunk.info)
+        candidates = cred_sweeper.scanner.scan(file_view[chunk.start:chunk.end], chunk.first_line)
+    line_offset = chunk.first_line - 1
+    for candidate in candidates:
+        for line_data in candidate.line_data_list:
+            line_data.line_num += line_offset
+    return candidates
+
+
+def _init_worker(rule_path: Optional[str], config_dict: Dict[str, Any]) -> None:
+    """Ignores SIGINT and creates scanners of the process from the scan spec"""
+    from credsweeper.app import CredSweeper
+    CredSweeper.pool_initializer()
+    global _worker_sweeper, _worker_rule_ids
+    _worker_sweeper = CredSweeper.from_scan_spec(rule_path, config_dict)
+    _worker_rule_ids = {rule.rule_name: i for i, rule in enumerate(get_rule_table(_worker_sweeper))}
+
+
+def _scan_files(
+    chunk: List[Tuple[int, Union[DiffContentProvider, TextContentProvider, TextChunk]]]
+) -> Tuple[int, float, List[Tuple[Any, ...]]]:
+    """Scans files and text chunks in a process of the pool and returns the process id, the busy time and records"""
+    start_time = time.perf_counter()
+    records = []
+    for index, item in chunk:
+        if isinstance(item, TextChunk):
+            candidates = scan_chunk(_worker_sweeper, item)
+        else:
+            candidates = _worker_sweeper.file_scan(item)
+        records.append(encode_candidates(index, candidates, _worker_rule_ids))
+    return os.getpid(), time.perf_counter() - start_time, records
+
+
+class ScanPool:
+    """Pool of spawned processes which create scanners once from the scan spec: rule path and config dictionary.
+
+    A task carries only content providers, so CredSweeper is not pickled for each file. The files are dispatched in
+    chunks by estimated cost, the largest first. Text of a large file may be split to chunks which are scanned in
+    parallel, then their candidates are merged in order of a sequential scan. A result is a compact record which is
+    rehydrated to candidates in the parent with its rule table and config. The pool is kept between scans and it is
+    shared by CredSweeper instances with the same spec, e.g. added and deleted rows of --diff_path.
+    Changes of config or scanners of an instance after its creation are not applied in the processes.
+
+    """
+
+    __shared: Optional["ScanPool"] = None
+
+    def __init__(self, processes: int, rule_path: Optional[str], config_dict: Dict[str, Any]) -> None:
+        """Starts the processes
+
+        Args:
+            processes: number of processes
+            rule_path: path of rules file or None for default
+            config_dict: dictionary of Config
+
+        """
+        self.processes = processes
+        self.rule_path = rule_path
+        self.config_dict = config_dict
+        self.__workers_info: List[WorkerInfo] = []
+        self.pool: Pool = multiprocessing.get_context("spawn").Pool(processes,
+                                                                    initializer=_init_worker,
+                                                                    initargs=(rule_path, config_dict))
+        logger.info("Started scan pool of %d processes", processes)
+
+    @classmethod
+    def get(cls, processes: int, rule_path: Optional[str], config_dict: Dict[str, Any]) -> "ScanPool":
+        """Returns the shared pool for the spec, the pool with another spec is closed"""
+        shared = cls.__shared
+        if shared is not None:
+            if (processes, rule_path, config_dict) == (shared.processes, shared.rule_path, shared.config_dict):
+                return shared
+            shared.close()
+        cls.__shared = cls(processes, rule_path, config_dict)
+        return cls.__shared
+
+    def scan(self,
+             content_providers: Sequence[Union[DiffContentProvider, TextContentProvider]],
+             rules: List[Rule],
+             config: Config,
+             chunk_size: Optional[int] = None) -> Iterator[Tuple[int, List[Candidate]]]:
+        """Scans the files in the processes
+
+        Args:
+            content_providers: file objects to scan
+            rules: the rule table of the scan spec from get_rule_table
+            config: config of the parent for the rehydrated candidates
+            chunk_size: optional size in bytes - larger text files are split to chunks of the size
+
+        Return:
+            iterator of index of a file in content_providers and candidates of the file in order of completion
+
+        """
+        start_time = time.perf_counter()
+        tasks: List[Tuple[int, Union[DiffContentProvider, TextContentProvider, TextChunk]]] = []
+        costs: List[int] = []
+        # number of tasks of each file which are not completed yet
+        remaining = [1] * len(content_providers)
+        for index, content_provider in enumerate(content_providers):
+            text_chunks = split_file(content_provider, config, chunk_size) if chunk_size else []
+            if text_chunks:
+                logger.info("Split %s to %d chunks", content_provider.file_path, len(text_chunks))
+                remaining[index] = len(text_chunks)
+                tasks.extend((index, x) for x in text_chunks)
+                costs.extend(FILE_COST + len(x.text) for x in text_chunks)
+            else:
+                tasks.append((index, content_provider))
+                costs.append(estimate_cost(content_provider, config))
+        chunks = [[tasks[i] for i in x] for x in get_chunks(costs, self.processes)]
+        rule_order = {rule.rule_name: i for i, rule in enumerate(rules)}
+        file_candidates: Dict[int, List[Candidate]] = {}
+        workers: Dict[int, Tuple[int, float]] = {}
+        for pid, busy, records in self.pool.imap_unordered(_scan_files, chunks):
+            files, total_busy = workers.get(pid, (0, 0.0))
+            workers[pid] = (files + len(records), total_busy + busy)
+            for record in records:
+                index, candidates = decode_candidates(record, rules, config)
+                remaining[index] -= 1
+                if index in file_candidates or remaining[index]:
+                    file_candidates.setdefault(index, []).extend(candidates)
+                    if remaining[index]:
+                        continue
+                    # candidates of the chunks are ordered by rules and then by lines as in a sequential scan
+                    candidates = sorted(file_candidates.pop(index),
+                                        key=lambda x: (rule_order[x.rule_name], x.line_data_list[0].line_num))
+                yield index, candidates
+        elapsed = time.perf_counter() - start_time
+        self.__workers_info = [
+            WorkerInfo(pid, files, busy, busy / elapsed if elapsed else 0.0)
+            for pid, (files, busy) in sorted(workers.items())
+        ]
+        for info in self.__workers_info:
+            logger.info("Scan pool process %d: files %d, busy %.3fs, utilization %.1f%%", info.pid, info.files,
+                        info.busy, 100 * info.utilization)
+
+    def get_workers_info(self) -> List[WorkerInfo]:
+        """Utilization of the processes in the last complete scan, a process without tasks is not reported.
+
+        Number of files of a process includes chunks of split files.
+
+        """
+        return list(self.__workers_info)
+
+    def close(self) -> None:
+        """Stops the processes"""
+        if ScanPool.__shared is self:
+            ScanPool.__shared = None
+        self.pool.close()
+        self.pool.join()
+
+    def terminate(self) -> None:
+        """Stops the processes without waiting for tasks"""
+        if ScanPool.__shared is self:
+            ScanPool.__shared = None
+        self.pool.terminate()
+        self.pool.join()
+
+    @classmethod
+    def close_shared(cls) -> None:
+        """Stops the shared pool if it was started"""
+        if cls.__shared is not None:
+            cls.__shared.close()
+
+
+atexit.register(ScanPool.close_shared)
@@ -1,3 +1,4 @@
+from bisect import bisect_left, bisect_right
 from typing import Optional
 
 from credsweeper.config import Config
@@ -38,16 +39,17 @@ class MultiPattern(ScanType):
         if not isinstance(candidate, Candidate):
             return None
 
-        line_num_margin = 1
-
-        while line_num_margin <= cls.MAX_SEARCH_MARGIN:
-            if 1 <= candidate.line_data_list[0].line_num - line_num_margin <= len(target.lines):
-                if cls._scan(config, candidate, -line_num_margin, target, rule):
-                    break
-            if candidate.line_data_list[0].line_num + line_num_margin <= len(target.lines):
-                if cls._scan(config, candidate, line_num_margin, target, rule):
-                    break
-            line_num_margin += 1
+        # positions of lines with the second pattern are indexed once per file and the pattern
+        line_pos = candidate.line_data_list[0].line_num - 1
+        matched_positions = target.file_view.get_matched_positions(rule.patterns[1])
+        start = bisect_left(matched_positions, line_pos - cls.MAX_SEARCH_MARGIN)
+        end = bisect_right(matched_positions, line_pos + cls.MAX_SEARCH_MARGIN)
+        # the nearest lines are checked first, a preceding line goes before a following one at the same distance
+        line_num_margins = sorted((x - line_pos for x in matched_positions[start:end] if x != line_pos),
+                                  key=lambda x: (abs(x), 0 < x))
+        for line_num_margin in line_num_margins:
+            if cls._scan(config, candidate, line_num_margin, target, rule):
+                break
 
         # Check if found multi line
         if len(candidate.line_data_list) == 1:
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
+
+from regex import regex
 
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
@@ -12,15 +14,22 @@ from credsweeper.utils import Util
 class PemKeyPattern(ScanType):
     """Check if line is a start of a PEM key.
 
+    Lines of the key are processed one by one from the line after the start until `-----END`, so each key block is
+    read once and the rest of the file is not touched. A key embedded in a string with escaped newlines like
+    `"-----BEGIN ... KEY-----\\nMIIE...\\n-----END ... KEY-----"` is read from the parts of the start line.
 
     Parameters:
         ignore_starts: Leading lines in pem file that should be ignored
         remove_characters: This characters would be striped from PEM lines before entropy check
+        max_key_lines: Maximal number of lines of a key
+        pattern_check: Filter to check that the key has no substring with 5 same consecutive characters
 
     """
 
     ignore_starts = ["Proc-Type", "Version", "DEK-Info"]
     remove_characters = " '\";,[]\n\r\t\\+#*"
+    max_key_lines = 190
+    pattern_check = ValuePatternCheck(5)
 
     @classmethod
     def run(cls, config: Config, rule: Rule, target: AnalysisTarget) -> Optional[Candidate]:
@@ -39,15 +48,36 @@ class PemKeyPattern(ScanType):
         assert rule.pattern_type == rule.PEM_KEY_PATTERN, \
             "Rules provided to PemKeyPattern.run should have pattern_type equal to PEM_KEY_PATTERN"
 
-        if cls.is_pem_key(target.lines[target.line_num:]):
+        if cls.is_pem_key(cls.get_key_lines(target, rule.patterns[0])):
             return cls._get_candidate(config, rule, target)
 
         return None
 
+    @staticmethod
+    def get_key_lines(target: AnalysisTarget, pattern: regex.Pattern) -> Iterator[str]:
+        """Yields lines after the start of a key: parts of the line split by escaped newlines, then next lines.
+
+        Args:
+            target: Analysis target with the start of a key
+            pattern: pattern of the start of a key
+
+        Return:
+            Iterator over possible lines of the key, the lines are obtained on demand
+
+        """
+        if match_obj := pattern.search(target.line):
+            # a key in a string of JSON, YAML etc.: the first part is the start of the key
+            yield from target.line[match_obj.start():].split("\\n")[1:]
+        lines = target.lines
+        for line_pos in range(target.line_num, len(lines)):
+            yield lines[line_pos]
+
     @classmethod
-    def is_pem_key(cls, lines: List[str]) -> bool:
+    def is_pem_key(cls, lines: Iterable[str]) -> bool:
         """Check if provided lines is a PEM key.
 
+        Lines are processed until the end of the key, so an iterator over rest of a file may be used.
+
         Args:
             lines: Lines to be checked
 
@@ -55,31 +85,35 @@ class PemKeyPattern(ScanType):
             Boolean. True if PEM key, False otherwise
 
         """
-        lines = cls.strip_lines(lines)
-        lines = cls.remove_leading_config_lines(lines)
-        key_data = ""
-        for line_num, line in enumerate(lines):
-            if line_num >= 190:
+        key_data: List[str] = []
+        leading = True
+        for line in lines:
+            line = cls.strip_line(line)
+            if leading:
+                if cls.is_leading_config_line(line):
+                    continue
+                leading = False
+            if len(key_data) >= cls.max_key_lines:
                 return False
             if "-----END" in line:
+                key = ''.join(key_data)
                 # Check if entropy is high enough
-                removed_by_entropy = not Util.is_entropy_validate(key_data)
+                removed_by_entropy = not Util.is_entropy_validate(key)
                 # Check if have no substring with 5 same consecutive characters (like 'AAAAA')
-                pattern_check = ValuePatternCheck(5)
-                removed_by_filter = pattern_check.equal_pattern_check(key_data)
+                removed_by_filter = cls.pattern_check.equal_pattern_check(key)
                 not_removed = not (removed_by_entropy or removed_by_filter)
                 return not_removed
             # PEM key line should not contain spaces or . (and especially not ...)
             elif " " in line or "..." in line:
                 return False
             else:
-                key_data += line
+                key_data.append(line)
 
         return False  # Return false if no `-END` section in lines
 
     @classmethod
-    def strip_lines(cls, lines: List[str]) -> List[str]:
-        """Remove common symbols that can surround PEM keys inside code.
+    def strip_line(cls, line: str) -> str:
+        """Remove common symbols that can surround PEM keys inside code from a line.
 
         Examples::
 
@@ -87,24 +121,15 @@ class PemKeyPattern(ScanType):
             `* ZZAWarrA1`
             `  "ZZAWarrA1\\n" + `
 
-        Args:
-            lines: Lines to be striped
-
-        Return:
-            lines with special characters removed from both ends
-
         """
         # Note that this strip would remove `\n` but not `\\n`
-        stripped_lines = [line.strip(cls.remove_characters) for line in lines]
+        line = line.strip(cls.remove_characters)
         # If line still ends with "\n" - remove last 2 characters and strip again (case of `\\n` in the line)
-        stripped_lines = [
-            line[:-2].strip(cls.remove_characters) if line.endswith("\\n") else line for line in stripped_lines
-        ]
-        return stripped_lines
+        return line[:-2].strip(cls.remove_characters) if line.endswith("\\n") else line
 
     @classmethod
-    def remove_leading_config_lines(cls, lines: List[str]) -> List[str]:
-        """Remove non-key lines from the beginning of a list.
+    def is_leading_config_line(cls, line: str) -> bool:
+        """Check if the stripped line is empty or a config line before a key.
 
         Example lines with non-key leading lines:
 
@@ -115,24 +140,5 @@ class PemKeyPattern(ScanType):
 
             ZZAWarrA1...
 
-        Args:
-            lines: Lines to be checked
-
-        Return:
-            List of strings without leading non-key lines
-
         """
-        leading_lines = 0
-
-        for line in lines:
-            if len(line) == 0:
-                leading_lines += 1
-            else:
-                for ignore_string in cls.ignore_starts:
-                    if line.startswith(ignore_string):
-                        leading_lines += 1
-                        break
-                if not leading_lines:
-                    break
-
-        return lines[leading_lines:]
+        return 0 == len(line) or line.startswith(tuple(cls.ignore_starts))
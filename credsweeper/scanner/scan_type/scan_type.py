@@ -57,7 +57,7 @@ class ScanType(ABC):
         if not config.use_filters:
             return False
         for filter_ in filters:
-            if filter_.run(line_data):
+            if filter_.check(line_data):
                 logger.debug("Filtered line with filter: %s in file: %s:%d  in line: %s", filter_.__class__.__name__,
                              line_data.path, line_data.line_num, line_data.line)
                 return True
@@ -90,49 +90,19 @@ class ScanType(ABC):
             LineData object if pattern a line and filters do not remove current line. None otherwise
 
         """
-        if not cls.is_valid_line(line, pattern, line_num, file_path):
+        if not cls.is_valid_line_length(line, line_num, file_path):
+            return None
+        # the match is handed to LineData to avoid the second search of the pattern
+        match_obj = pattern.search(line)
+        if match_obj is None:
             return None
         logger.debug("Valid line for pattern: %s in file: %s:%d in line: %s", pattern, file_path, line_num, line)
-        line_data = LineData(config, line, line_num, file_path, file_type, info, pattern)
+        line_data = LineData(config, line, line_num, file_path, file_type, info, pattern, match_obj)
 
         if cls.filtering(config, line_data, filters):
             return None
         return line_data
 
-    @classmethod
-    def is_pattern_detected_line(cls, line: str, pattern: regex.Pattern) -> bool:
-        """Check if pattern present in the line.
-
-        Args:
-            line: Line to check
-            pattern: Compiled regex object
-
-        Return:
-            Boolean. True if pattern is present. False otherwise
-
-        """
-        if pattern.search(line):
-            return True
-        return False
-
-    @classmethod
-    def is_valid_line(cls, line: str, pattern: regex.Pattern, line_num: int = -1, file_path: str = None) -> bool:
-        """Check if line is not too long and pattern present in the line.
-
-        Args:
-            line: Line to check
-            pattern: Compiled regex object to be searched in line
-            line_num: Number of line in the file
-            file_path: Path to the file
-
-        Return:
-            Boolean. True if pattern is present and line is not too long. False otherwise
-
-        """
-        if cls.is_valid_line_length(line, line_num, file_path) and cls.is_pattern_detected_line(line, pattern):
-            return True
-        return False
-
     @classmethod
     def is_valid_line_length(cls, line: str, line_num: int = -1, file_path: str = None) -> bool:
         """Check if line is not too long for the scanner.
@@ -164,7 +134,7 @@ class ScanType(ABC):
             remove current line. None otherwise
 
         """
-        if len(config.exclude_lines) > 0 and target.line.strip() in config.exclude_lines:
+        if len(config.exclude_lines) > 0 and target.line_strip in config.exclude_lines:
             return None
 
         line_data = cls.get_line_data(config=config,
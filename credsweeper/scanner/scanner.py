@@ -1,15 +1,20 @@
 import logging
 from pathlib import Path
-from typing import List, Optional, Type, Tuple, Dict, Union
+from typing import Any, List, Optional, Type, Tuple, Dict, Union, Sequence
 
 from credsweeper.app import APP_PATH
 from credsweeper.common.constants import RuleType, MIN_VARIABLE_LENGTH, MIN_SEPARATOR_LENGTH, MIN_VALUE_LENGTH, \
     MAX_LINE_LENGTH, Separator
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
-from credsweeper.file_handler.analysis_target import AnalysisTarget
+from credsweeper.file_handler.analysis_target import AnalysisTarget, FileView
+from credsweeper.file_handler.text_lines import TextLines
+from credsweeper.filters import Filter
+from credsweeper.filters.filter import FilterCacheInfo, FilterStats
+from credsweeper.filters.filter_planner import FilterPlanner
 from credsweeper.rules import Rule
 from credsweeper.scanner.scan_type import MultiPattern, PemKeyPattern, ScanType, SinglePattern
+from credsweeper.scanner.text_locator import TextLocator
 from credsweeper.utils import Util
 
 logger = logging.getLogger(__name__)
@@ -23,20 +28,29 @@ class Scanner:
         min_pattern_len: minimal length specified in all pattern rules
         min_keyword_len: minimal possible length for a string to be matched by any keyword rule
         min_len: Smallest between min_pattern_len and min_keyword_len
-        TargetGroup: Type for List[Tuple[AnalysisTarget, str, int]]
 
     """
 
-    TargetGroup = List[Tuple[AnalysisTarget, str, int]]
+    MIN_TEXT_SCAN_SIZE = 2048
 
     def __init__(self, config: Config, rule_path: Optional[str], usage_list: Optional[List[str]] = None) -> None:
         self.config = config
-        self.__scanner_for_rule: Dict[str, Type[ScanType]] = {}
-        self.rules: List[Rule] = []
+        # prefilter data: each rule is represented with a bit of integer mask according to index in self.rules
+        self.__rule_dispatch: List[Tuple[Rule, int, Type[ScanType]]] = []
+        self.__substring_masks: List[Tuple[str, int]] = []
+        self.__always_mask = 0
+        self.__keyword_mask = 0
+        self.__pem_key_mask = 0
+        # created on demand for whole text scanning
+        self.__text_locator: Optional[TextLocator] = None
+        # distinct filter chains of the rules are reordered with runtime statistics of the filters
+        self.__filter_chains: List[List[Filter]] = []
+        self.__filter_planner = FilterPlanner(config.filter_profile)
+        self.__rules: List[Rule] = []
         # init with MAX_LINE_LENGTH before _set_rules
         self.min_pattern_len = MAX_LINE_LENGTH
+        self.min_len = MAX_LINE_LENGTH
         self._set_rules(rule_path, usage_list if isinstance(usage_list, list) else ["src", "doc"])
-        self.min_len = min(self.min_pattern_len, MIN_VARIABLE_LENGTH + MIN_SEPARATOR_LENGTH + MIN_VALUE_LENGTH)
 
     def _set_rules(self, rule_path: Union[None, str, Path], usage_list: List[str]) -> None:
         """Auxiliary method to fill rules, determine min_pattern_len and set scanners"""
@@ -44,57 +58,113 @@ class Scanner:
             rule_path = APP_PATH / "rules" / "config.yaml"
         rule_templates = Util.yaml_load(rule_path)
         if rule_templates and isinstance(rule_templates, list):
+            rules = []
+            # rules with the same filter group use the same filter instances to share memoized verdicts
+            shared_filters: Dict[str, List[Filter]] = {}
             for rule_template in rule_templates:
-                rule = Rule(self.config, rule_template)
+                rule = Rule(self.config, rule_template, shared_filters)
                 if not self._is_available(usage_list, rule):
                     continue
-                self.rules.append(rule)
-                if rule.rule_type == RuleType.PATTERN:
-                    self.min_pattern_len = min(self.min_pattern_len, rule.min_line_len)
-                self.__scanner_for_rule[rule.rule_name] = self.get_scanner(rule)
+                rules.append(rule)
+            self.rules = rules
         else:
             raise RuntimeError(f"Wrong rules '{rule_templates}' were read from '{rule_path}'")
 
-    def _select_and_group_targets(self, targets: List[AnalysisTarget]) -> Tuple[TargetGroup, TargetGroup, TargetGroup]:
-        """Group targets into 3 lists based on loaded rules.
+    @property
+    def rules(self) -> List[Rule]:
+        """rules getter"""
+        return self.__rules
 
-        Args:
-            targets: List of AnalysisTarget to analyze
+    @rules.setter
+    def rules(self, rules: List[Rule]) -> None:
+        """rules setter - builds the prefilter, determines min_pattern_len and sets scanners for the rules"""
+        self.__rules = rules
+        self.__rule_dispatch = []
+        self.__always_mask = 0
+        self.__keyword_mask = 0
+        self.__pem_key_mask = 0
+        self.min_pattern_len = MAX_LINE_LENGTH
+        substring_masks: Dict[str, int] = {}
+        for rule_index, rule in enumerate(rules):
+            rule_bit = 1 << rule_index
+            self.__rule_dispatch.append((rule, rule.min_line_len, self.get_scanner(rule)))
+            if rule.rule_type == RuleType.PATTERN:
+                self.min_pattern_len = min(self.min_pattern_len, rule.min_line_len)
+            elif rule.rule_type == RuleType.KEYWORD:
+                self.__keyword_mask |= rule_bit
+            elif rule.rule_type == RuleType.PEM_KEY:
+                self.__pem_key_mask |= rule_bit
+            else:
+                raise ValueError(f"Unknown RuleType {rule.rule_type}")
+            if not rule.required_substrings or "" in rule.required_substrings:
+                # empty substring is present in any line, so the rule cannot be skipped
+                self.__always_mask |= rule_bit
+            else:
+                for substring in rule.required_substrings:
+                    substring_masks[substring] = substring_masks.get(substring, 0) | rule_bit
+        # Each distinct substring is checked once per line for all rules. Python `in` runs in C, so for few dozen
+        # short substrings it outperforms a multi-pattern automaton implemented in pure Python
+        self.__substring_masks = list(substring_masks.items())
+        self.__text_locator = None
+        self.__filter_chains = list({id(x.filters): x.filters for x in rules if x.filters}.values())
+        for chain in self.__filter_chains:
+            self.__filter_planner.plan(chain)
+        self.min_len = min(self.min_pattern_len, MIN_VARIABLE_LENGTH + MIN_SEPARATOR_LENGTH + MIN_VALUE_LENGTH)
 
-        Return:
-            Three TargetGroup objects: one for keywords, one for patterns, and one for PEM keys
+    def get_filters_cache_info(self) -> Dict[str, FilterCacheInfo]:
+        """Returns counters of verdict caches of the filters summed up by filter class over distinct instances"""
+        cache_info: Dict[str, FilterCacheInfo] = {}
+        seen_filters = set()
+        for rule in self.__rules:
+            for filter_ in rule.filters:
+                if id(filter_) in seen_filters:
+                    continue
+                seen_filters.add(id(filter_))
+                filter_name = type(filter_).__name__
+                info = filter_.cache_info()
+                if filter_name in cache_info:
+                    info = FilterCacheInfo(*(x + y for x, y in zip(cache_info[filter_name], info)))
+                cache_info[filter_name] = info
+        return cache_info
 
-        """
-        keyword_targets = []
-        pattern_targets = []
-        pem_targets = []
+    def get_filters_report(self) -> Dict[str, Any]:
+        """Returns runtime statistics of the filters summed up by filter class and current order of filter chains.
 
-        for target in targets:
-            # Ignore target if it's too long
-            line_len = len(target.line)
-            if line_len > MAX_LINE_LENGTH:
-                logger.warning(f"Skipped oversize({line_len}) line in {target.file_path}:{target.line_num}", )
-                continue
-            # Trim string from outer spaces to make future `a in str` checks faster
-            target_line_trimmed = target.line.strip()
-            target_line_trimmed_len = len(target_line_trimmed)
-            # Ignore target if trimmed part is too short
-            if target_line_trimmed_len < self.min_len:
-                continue
-            target_line_trimmed_lower = target_line_trimmed.lower()
-            # Check if have at least one separator character. Otherwise cannot be matched by a keyword
-            for x in Separator.common_as_set:
-                if x in target_line_trimmed:
-                    keyword_targets.append((target, target_line_trimmed_lower, target_line_trimmed_len))
-                    break
-            # Check if have length not smaller than smallest `min_line_len` in all pattern rules
-            if target_line_trimmed_len >= self.min_pattern_len:
-                pattern_targets.append((target, target_line_trimmed_lower, target_line_trimmed_len))
-            # Check if have "BEGIN" substring. Cannot otherwise ba matched as a PEM key
-            if "BEGIN" in target_line_trimmed:
-                pem_targets.append((target, target_line_trimmed_lower, target_line_trimmed_len))
+        The filters part of the report may be used as a profile of FilterPlanner.
 
-        return keyword_targets, pattern_targets, pem_targets
+        """
+        filters_stats: Dict[str, FilterStats] = {}
+        seen_filters = set()
+        for chain in self.__filter_chains:
+            for filter_ in chain:
+                if id(filter_) in seen_filters:
+                    continue
+                seen_filters.add(id(filter_))
+                filter_name = type(filter_).__name__
+                stats = filter_.stats()
+                if prev_stats := filters_stats.get(filter_name):
+                    stats = FilterStats(prev_stats.calls + stats.calls, prev_stats.rejections + stats.rejections,
+                                        prev_stats.elapsed + stats.elapsed)
+                filters_stats[filter_name] = stats
+        cache_info = self.get_filters_cache_info()
+        filters: Dict[str, Any] = {}
+        for filter_name, stats in sorted(filters_stats.items()):
+            filters[filter_name] = {
+                "calls": stats.calls,
+                "rejections": stats.rejections,
+                "elapsed": stats.elapsed,
+                "rejection_rate": stats.rejections / stats.calls if stats.calls else None,
+                "average_cost": stats.elapsed / stats.calls if stats.calls else None,
+                "cache_hits": cache_info[filter_name].hits,
+                "cache_misses": cache_info[filter_name].misses,
+            }
+        chains = []
+        for chain in self.__filter_chains:
+            chains.append({
+                "rules": [x.rule_name for x in self.__rules if x.filters is chain],
+                "filters": [type(x).__name__ for x in chain]
+            })
+        return {"filters": filters, "chains": chains}
 
     def _is_available(self, usage_list: List[str], rule: Rule) -> bool:
         """separate the method to reduce complexity"""
@@ -105,45 +175,137 @@ class Scanner:
                 return True
         return False
 
-    @staticmethod
-    def _required_substrings_not_present(required_substrings: List[str], line: str):
-        """ returns True if required substring absent in line """
-        for substring in required_substrings:
-            if substring in line:
-                return False
-        return True
-
-    def scan(self, targets: List[AnalysisTarget]) -> List[Candidate]:
+    def get_rules_mask(self, line_trimmed: str, line_trimmed_lower: str) -> int:
+        """Selects rules which can match the line.
+
+        Args:
+            line_trimmed: line without outer spaces
+            line_trimmed_lower: the trimmed line in lower case
+
+        Return:
+            integer mask where bit N is set when rule self.rules[N] has to be applied to the line
+
+        """
+        rules_mask = self.__always_mask
+        for substring, substring_mask in self.__substring_masks:
+            if substring in line_trimmed_lower:
+                rules_mask |= substring_mask
+        # Check if have at least one separator character. Otherwise cannot be matched by a keyword
+        if self.__keyword_mask & rules_mask:
+            for x in Separator.common_as_set:
+                if x in line_trimmed:
+                    break
+            else:
+                rules_mask &= ~self.__keyword_mask
+        # Check if have "BEGIN" substring. Cannot otherwise ba matched as a PEM key
+        if self.__pem_key_mask & rules_mask and "BEGIN" not in line_trimmed:
+            rules_mask &= ~self.__pem_key_mask
+        return rules_mask
+
+    def scan(self, targets: Sequence[AnalysisTarget], first_line: int = 1) -> List[Candidate]:
         """Run scanning of list of target lines from 'targets' with set of rule from 'self.rules'.
 
+        Targets are processed line by line: the prefilter selects only rules which may match the line.
+        Result is ordered by rules as well as the rules were applied to all targets one by one.
+
         Args:
             targets: objects with data to analyze: line, line number,
               filepath and all lines in file
+            first_line: number in the file of the first line of the targets, it is used in log messages only
 
         Return:
             list of all detected credential candidates in analyzed targets
 
         """
+        return self.__scan_targets(targets, None, first_line)
+
+    def scan_text(self,
+                  text: str,
+                  file_path: str,
+                  file_type: str,
+                  info: str,
+                  first_line: int = 1,
+                  start: int = 0,
+                  end: Optional[int] = None) -> List[Candidate]:
+        """Run scanning of whole text of a file with set of rule from 'self.rules'.
+
+        Rules are searched over whole text at first, and analysis targets are created only for lines with hits.
+        Result is the same as for scan() of targets for all lines of the text.
+
+        Args:
+            text: whole text of a file with LF line endings
+            file_path: path to the file
+            file_type: type of the file in extension format '.txt'
+            info: extended info
+            first_line: number in the file of the first line of the text, it is used in log messages only
+            start: index of the first scanned line, lines before it are context
+            end: index after the last scanned line, lines from it are context, all lines to the end are scanned if None
+
+        Return:
+            list of all detected credential candidates in the scanned lines of the text
+
+        """
+        if self.__text_locator is None:
+            self.__text_locator = TextLocator(self.__rules)
+        # fixed cost of the searches over whole text is higher than line by line scanning of small text
+        text_lines = TextLines(text) if self.MIN_TEXT_SCAN_SIZE <= len(text) else None
+        located = self.__text_locator.locate(text_lines) if text_lines is not None else None
+        if text_lines is None or located is None:
+            lines = text_lines if text_lines is not None else text.split('\n')
+            return self.scan(FileView(lines, None, file_path, file_type, info)[start:end], first_line)
+        if end is None:
+            end = len(text_lines)
+        for line_index in text_lines.get_oversize_lines(MAX_LINE_LENGTH):
+            located.pop(line_index, None)
+            if start <= line_index < end:
+                line_len = text_lines.get_line_end(line_index) - text_lines.get_line_start(line_index)
+                logger.warning(f"Skipped oversize({line_len}) line in {file_path}:{first_line + line_index}", )
+        line_indexes = sorted(x for x in located if start <= x < end)
+        file_view = FileView(text_lines, None, file_path, file_type, info)
+        targets = [file_view[i] for i in line_indexes]
+        return self.__scan_targets(targets, [located[i] for i in line_indexes], first_line)
+
+    def __scan_targets(self, targets: Sequence[AnalysisTarget], located_masks: Optional[List[int]],
+                       first_line: int) -> List[Candidate]:
+        """Applies rules to the targets. located_masks limit the rules for each target if given"""
         credentials: List[Candidate] = []
         if not targets:
             # optimization for empty list
             return credentials
-        keyword_targets, pattern_targets, pem_targets = self._select_and_group_targets(targets)
-        for rule in self.rules:
-            min_line_len = rule.min_line_len
-            required_substrings = rule.required_substrings
-            scanner = self.__scanner_for_rule[rule.rule_name]
-            to_check = self.get_targets_to_check(keyword_targets, pattern_targets, pem_targets, rule)
-            # It is almost two times faster to pre-compute values related to target_line than to compute them in
-            # each iteration
-            for target, target_line_trimmed_lower, target_line_trimmed_len in to_check:
-                if target_line_trimmed_len < min_line_len or required_substrings \
-                        and self._required_substrings_not_present(required_substrings, target_line_trimmed_lower):
+        self.__filter_planner.update(self.__filter_chains)
+        rule_dispatch = self.__rule_dispatch
+        rules_credentials: List[List[Candidate]] = [[] for _ in rule_dispatch]
+        for target_index, target in enumerate(targets):
+            # Ignore target if it's too long
+            line_len = len(target.line)
+            if line_len > MAX_LINE_LENGTH:
+                logger.warning(
+                    f"Skipped oversize({line_len}) line in {target.file_path}:"
+                    f"{first_line - 1 + target.line_num}", )
+                continue
+            # Trim string from outer spaces to make future `a in str` checks faster
+            target_line_trimmed = target.line_strip
+            target_line_trimmed_len = len(target_line_trimmed)
+            # Ignore target if trimmed part is too short
+            if target_line_trimmed_len < self.min_len:
+                continue
+            rules_mask = self.get_rules_mask(target_line_trimmed, target.line_lower_strip)
+            if located_masks is not None:
+                rules_mask &= located_masks[target_index]
+            while rules_mask:
+                # take the lowest bit to keep order of rules
+                rule_bit = rules_mask & -rules_mask
+                rules_mask ^= rule_bit
+                rule_index = rule_bit.bit_length() - 1
+                rule, min_line_len, scanner = rule_dispatch[rule_index]
+                if target_line_trimmed_len < min_line_len:
                     continue
                 if new_credential := scanner.run(self.config, rule, target):
                     logger.debug("Credential for rule: %s in file: %s:%d in line: %s", rule.rule_name, target.file_path,
-                                 target.line_num, target.line)
-                    credentials.append(new_credential)
+                                 first_line - 1 + target.line_num, target.line)
+                    rules_credentials[rule_index].append(new_credential)
+        for rule_credentials in rules_credentials:
+            credentials.extend(rule_credentials)
         return credentials
 
     @staticmethod
@@ -164,27 +326,3 @@ class Scanner:
         elif rule.pattern_type == Rule.PEM_KEY_PATTERN:
             return PemKeyPattern
         raise ValueError(f"Unknown pattern_type in rule: {rule.pattern_type}")
-
-    @staticmethod
-    def get_targets_to_check(keyword_targets: TargetGroup, pattern_targets: TargetGroup, pem_targets: TargetGroup,
-                             rule: Rule) -> TargetGroup:
-        """Choose target subset based on a rule.
-
-        Args:
-            keyword_targets: TargetGroup with targets relevant to a keyword based rules
-            pattern_targets: TargetGroup with targets relevant to a pattern based rules
-            pem_targets: TargetGroup with targets relevant to a pem key rules
-            rule: rule object used to scanning
-
-        Return:
-            depending on the rule type, returns one of the other arguments
-
-        """
-        if rule.rule_type == RuleType.KEYWORD:
-            return keyword_targets
-        elif rule.rule_type == RuleType.PATTERN:
-            return pattern_targets
-        elif rule.rule_type == RuleType.PEM_KEY:
-            return pem_targets
-        else:
-            raise ValueError(f"Unknown RuleType {rule.rule_type}")
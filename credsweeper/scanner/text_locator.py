@@ -0,0 +1,243 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from regex import regex
+
+from credsweeper.common.constants import RuleType
+from credsweeper.file_handler.text_lines import TextLines
+from credsweeper.rules import Rule
+
+logger = logging.getLogger(__name__)
+
+
+class TextLocator:
+    """Selects lines of whole text which may be matched by rules.
+
+    Pattern and PEM rules are searched over whole text with line-bound copies of their first patterns: the copies
+    cannot match LF character, so a match never crosses a line and lookarounds see a line start or end as in a line
+    alone. Keyword rules and pattern rules which start with a character class are located with their required
+    substrings in lowered text. Each search is restarted from the next line after a hit, so every line where a rule
+    may match is selected.
+
+    Parameters:
+        always_mask: integer mask of the rules which cannot be located and have to be applied to every line
+
+    """
+
+    # escapes which cannot match LF (digits are not here due octal codes and backreferences)
+    SAFE_ESCAPES = "dwbBS"
+    # escapes which may match LF are replaced with classes without LF
+    LINE_BOUND_ESCAPES = {'s': r"[^\S\n]", 'W': r"[^\w\n]", 'D': r"[^\d\n]"}
+    UNSAFE_FLAGS = regex.DOTALL | regex.VERBOSE  # pylint: disable=no-member
+    # leading context of a pattern which does not select the position of a match
+    CONTEXT_PREFIXES = ("(?<!", "(?<=", "(^|")
+    QUANTIFIERS = ("?", "*", "+", "{")
+
+    def __init__(self, rules: List[Rule]) -> None:
+        self.always_mask = 0
+        self.__patterns: List[Tuple[int, regex.Pattern]] = []
+        substring_masks: Dict[str, int] = {}
+        for rule_index, rule in enumerate(rules):
+            rule_bit = 1 << rule_index
+            has_substrings = bool(rule.required_substrings) and "" not in rule.required_substrings
+            # regex search over whole text is fast for a pattern started with a literal, otherwise
+            # str.find of required substrings is much faster
+            if rule.rule_type in (RuleType.PATTERN, RuleType.PEM_KEY) and (not has_substrings or self.is_literal_led(
+                    self.strip_context(rule.patterns[0].pattern))):
+                line_bound_pattern = self.get_line_bound_pattern(rule.patterns[0])
+                if line_bound_pattern is not None:
+                    self.__patterns.append((rule_bit, line_bound_pattern))
+                    continue
+            if has_substrings:
+                for substring in rule.required_substrings:
+                    substring_masks[substring] = substring_masks.get(substring, 0) | rule_bit
+            else:
+                logger.info(f"Rule '{rule.rule_name}' cannot be located in whole text")
+                self.always_mask |= rule_bit
+        self.__substring_masks = list(substring_masks.items())
+
+    def locate(self, text_lines: TextLines) -> Optional[Dict[int, int]]:
+        """Finds lines of the text where the rules may match.
+
+        Args:
+            text_lines: lines of whole text
+
+        Return:
+            dictionary of line index with integer mask of rules which may match the line
+            or None if the lines cannot be located and all lines have to be scanned
+
+        """
+        if self.always_mask:
+            return None
+        text = text_lines.text
+        text_lower = text.lower() if self.__substring_masks else text
+        if len(text_lower) != len(text):
+            # some characters are lowered to several ones, so positions are different
+            return None
+        located: Dict[int, int] = {}
+        for rule_bit, pattern in self.__patterns:
+            position = 0
+            while match := pattern.search(text, position):
+                position = self.__add_hit(located, text_lines, match.start(), rule_bit)
+        for substring, substring_mask in self.__substring_masks:
+            position = text_lower.find(substring)
+            while 0 <= position:
+                position = text_lower.find(substring, self.__add_hit(located, text_lines, position, substring_mask))
+        return located
+
+    @staticmethod
+    def __add_hit(located: Dict[int, int], text_lines: TextLines, position: int, rules_mask: int) -> int:
+        """Marks the line with the rules mask and returns start of the next line to continue search"""
+        line_index = text_lines.get_line_index(position)
+        located[line_index] = located.get(line_index, 0) | rules_mask
+        return text_lines.get_line_end(line_index) + 1
+
+    @classmethod
+    def get_line_bound_pattern(cls, pattern: regex.Pattern) -> Optional[regex.Pattern]:
+        """Makes copy of the pattern which cannot match LF and has to be applied to whole text in multiline mode.
+
+        Args:
+            pattern: compiled pattern of a rule
+
+        Return:
+            compiled pattern or None if the pattern has unsupported constructions
+
+        """
+        if pattern.flags & cls.UNSAFE_FLAGS:
+            return None
+        result = []
+        source = pattern.pattern
+        pos = 0
+        while pos < len(source):
+            char = source[pos]
+            if '\\' == char:
+                escape = source[pos + 1:pos + 2]
+                if escape in cls.LINE_BOUND_ESCAPES:
+                    result.append(cls.LINE_BOUND_ESCAPES[escape])
+                elif escape and (escape in cls.SAFE_ESCAPES or not escape.isalnum()):
+                    result.append(source[pos:pos + 2])
+                else:
+                    # \n, \x0A, \A, \Z, \p{...}, backreferences etc. are not supported
+                    return None
+                pos += 2
+            elif '[' == char:
+                class_end = cls.get_class_end(source, pos)
+                if class_end < 0:
+                    return None
+                char_class = source[pos:class_end]
+                if "[:" in char_class or not cls.is_safe_class_escapes(char_class):
+                    # POSIX classes and escapes like \n, \x0A are not supported
+                    return None
+                if char_class.startswith("[^"):
+                    result.append(f"[^\\n{char_class[2:]}")
+                elif any(f"\\{x}" in char_class for x in cls.LINE_BOUND_ESCAPES):
+                    result.append(f"(?:(?!\\n){char_class})")
+                else:
+                    result.append(char_class)
+                pos = class_end
+            elif source.startswith("(?", pos) and source[pos + 2:pos + 3].isalpha() and 'P' != source[pos + 2]:
+                # inline flags like (?i) or (?i:...)
+                flags_end = pos + 2
+                while flags_end < len(source) and (source[flags_end].isalpha() or '-' == source[flags_end]):
+                    flags_end += 1
+                if 's' in source[pos + 2:flags_end] or 'x' in source[pos + 2:flags_end]:
+                    return None
+                result.append(source[pos:flags_end])
+                pos = flags_end
+            else:
+                result.append(char)
+                pos += 1
+        try:
+            return regex.compile(''.join(result), flags=pattern.flags | regex.MULTILINE)  # pylint: disable=no-member
+        except regex.error as exc:
+            logger.warning(f"Line bound pattern was not compiled for {pattern.pattern}: {exc}")
+            return None
+
+    @staticmethod
+    def get_class_end(source: str, start: int) -> int:
+        """Returns position after closing bracket of the character class which opens at start or -1"""
+        pos = start + 1
+        if source.startswith('^', pos):
+            pos += 1
+        if source.startswith(']', pos):
+            # the first ']' in a class is a literal
+            pos += 1
+        while pos < len(source):
+            if '\\' == source[pos]:
+                pos += 2
+            elif ']' == source[pos]:
+                return pos + 1
+            else:
+                pos += 1
+        return -1
+
+    @classmethod
+    def is_safe_class_escapes(cls, char_class: str) -> bool:
+        """Checks that escapes in the character class do not match LF except ones which are replaced"""
+        pos = char_class.find('\\')
+        while 0 <= pos:
+            escape = char_class[pos + 1:pos + 2]
+            if escape.isalnum() and escape not in cls.SAFE_ESCAPES and escape not in cls.LINE_BOUND_ESCAPES:
+                return False
+            pos = char_class.find('\\', pos + 2)
+        return True
+
+    @classmethod
+    def strip_context(cls, pattern: str) -> str:
+        """Cuts leading lookbehinds and `(^|...)` groups off the pattern"""
+        while pattern.startswith(cls.CONTEXT_PREFIXES):
+            group_end = cls.get_group_end(pattern)
+            if group_end < 0 or pattern[group_end:group_end + 1] in cls.QUANTIFIERS:
+                # the context group is optional or repeated - keep it as is
+                break
+            pattern = pattern[group_end:]
+        return pattern
+
+    @staticmethod
+    def get_group_end(pattern: str, start: int = 0) -> int:
+        """Returns position after closing parenthesis of the group which opens at start or -1 for unbalanced"""
+        depth = 0
+        in_class = False
+        pos = start
+        while pos < len(pattern):
+            char = pattern[pos]
+            if '\\' == char:
+                pos += 2
+                continue
+            if in_class:
+                if ']' == char:
+                    in_class = False
+            elif '[' == char:
+                in_class = True
+                # the first ']' in a class is a literal
+                if pattern[pos + 1:pos + 2] == '^':
+                    pos += 1
+                if pattern[pos + 1:pos + 2] == ']':
+                    pos += 1
+            elif '(' == char:
+                depth += 1
+            elif ')' == char:
+                depth -= 1
+                if 0 == depth:
+                    return pos + 1
+            pos += 1
+        return -1
+
+    @staticmethod
+    def is_literal_led(pattern: str) -> bool:
+        """Checks whether the first symbol to match is an alphanumeric literal"""
+        pos = 0
+        while pattern.startswith('(', pos):
+            if pattern.startswith("(?P<", pos):
+                pos = pattern.find('>', pos) + 1
+            elif pattern.startswith("(?:", pos):
+                pos += 3
+            elif pattern.startswith("(?", pos):
+                # lookaround or other special group
+                return False
+            else:
+                pos += 1
+        if pos >= len(pattern) or not pattern[pos].isalnum():
+            return False
+        # the literal must not be optional
+        return pattern[pos + 1:pos + 2] not in TextLocator.QUANTIFIERS
@@ -1,7 +1,6 @@
 import ast
 import json
 import logging
-import math
 import os
 import tarfile
 from dataclasses import dataclass
@@ -14,8 +13,9 @@ from lxml import etree
 from regex import regex
 from typing_extensions import TypedDict
 
-from credsweeper.common.constants import Chars, DiffRowType, KeywordPattern, Separator, AVAILABLE_ENCODINGS, \
+from credsweeper.common.constants import DiffRowType, KeywordPattern, Separator, AVAILABLE_ENCODINGS, \
     DEFAULT_ENCODING, LATIN_1
+from credsweeper.common.entropy import Entropy
 
 logger = logging.getLogger(__name__)
 
@@ -71,29 +71,12 @@ class Util:
     @staticmethod
     def is_entropy_validate(data: str) -> bool:
         """Verifies data entropy with base64, base36 and base16(hex)"""
-        # Replaced to the steps due: 1 - coverage 2 - YAPF
-        if Util.get_shannon_entropy(data, Chars.BASE64_CHARS.value) > 4.5:
-            return True
-        elif Util.get_shannon_entropy(data, Chars.BASE36_CHARS.value) > 3:
-            return True
-        elif Util.get_shannon_entropy(data, Chars.HEX_CHARS.value) > 3:
-            return True
-        else:
-            return False
+        return Entropy.is_entropy_validate(data)
 
     @staticmethod
     def get_shannon_entropy(data: str, iterator: str) -> float:
         """Borrowed from http://blog.dkbza.org/2007/05/scanning-data-for-entropy-anomalies.html."""
-        if not data:
-            return 0
-
-        entropy = 0.
-        for x in iterator:
-            p_x = float(data.count(x)) / len(data)
-            if p_x > 0:
-                entropy += -p_x * math.log(p_x, 2)
-
-        return entropy
+        return Entropy.get_shannon_entropy(data, iterator)
 
     @staticmethod
     def is_binary(data: bytes) -> bool:
@@ -149,7 +132,21 @@ class Util:
             Also empty list will be returned after last encoding and 0 symbol is present in lines not at end
 
         """
-        lines = []
+        text = Util.decode_text(content, encodings)
+        return text.split("\n") if text is not None else []
+
+    @staticmethod
+    def decode_text(content: bytes, encodings: Optional[List[str]] = None) -> Optional[str]:
+        """Decode content using different encodings like decode_bytes, but keeps the text entire.
+
+        Args:
+            content: raw data that might be text
+            encodings: supported encodings
+
+        Return:
+            text with LF line endings or None if none of the encodings match
+
+        """
         binary_suggest = False
         if encodings is None:
             encodings = AVAILABLE_ENCODINGS
@@ -159,19 +156,18 @@ class Util:
                     # LATIN_1 may convert data (bytes in range 0x80:0xFF are transformed)
                     # so skip this encoding when checking binaries
                     logger.warning("Binary file detected")
-                    return []
+                    return None
                 text = content.decode(encoding, errors="strict")
                 if content != text.encode(encoding, errors="strict"):
                     raise UnicodeError
                 # windows style workaround
-                lines = text.replace('\r\n', '\n').replace('\r', '\n').split("\n")
-                break
+                return text.replace('\r\n', '\n').replace('\r', '\n')
             except UnicodeError:
                 binary_suggest = True
                 logger.info(f"UnicodeError: Can't decode content as {encoding}.")
             except Exception as exc:
                 logger.error(f"Unexpected Error: Can't read content as {encoding}. Error message: {exc}")
-        return lines
+        return None
 
     @staticmethod
     def patch2files_diff(raw_patch: List[str], change_type: DiffRowType) -> Dict[str, List[DiffDict]]:
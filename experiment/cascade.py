@@ -0,0 +1,115 @@
+import json
+import logging
+import time
+from argparse import ArgumentParser
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import ThresholdPreset
+from credsweeper.credentials import Candidate
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.ml_model import MlValidator
+from credsweeper.ml_model.cascade_classifier import CascadeClassifier
+
+
+def get_groups(paths: List[str]) -> List[Tuple[str, List[Candidate]]]:
+    """Scans the paths without ML and returns groups which are validated with ML model"""
+    cred_sweeper = CredSweeper(ml_threshold=0.0, depth=3)
+    cred_sweeper.scan(TextProvider(paths).get_scannable_files(cred_sweeper.config))
+    return [(key.value, group) for key, group in cred_sweeper.credential_manager.group_credentials().items()
+            if all(candidate.use_ml for candidate in group)]
+
+
+def train(feature_input: np.ndarray, probability: np.ndarray, margin: float) -> CascadeClassifier:
+    """Distills logistic regression from probabilities of the model and chooses the band.
+
+    The lower limit is below the regression probability of every group accepted by the model at the lowest threshold
+    and the upper limit is above every group rejected at the highest threshold, both with the margin.
+
+    """
+    lowest = MlValidator(ThresholdPreset.lowest).threshold
+    highest = MlValidator(ThresholdPreset.highest).threshold
+    regression = LogisticRegression(max_iter=1000)
+    # the regression is fitted to the medium decisions of the model
+    regression.fit(feature_input, probability > MlValidator(ThresholdPreset.medium).threshold)
+    cascade = CascadeClassifier(regression.coef_[0], regression.intercept_[0], (0.0, 1.0))
+    cascade_probability = cascade.predict(feature_input)
+    lower = cascade_probability[lowest < probability].min(initial=1.0) * (1.0 - margin)
+    upper = 1.0 - (1.0 - cascade_probability[probability <= highest].max(initial=0.0)) * (1.0 - margin)
+    return CascadeClassifier(cascade.coef, cascade.intercept, (lower, upper))
+
+
+def get_metrics(title: str, reference: np.ndarray, decision: np.ndarray) -> str:
+    """Metrics of decisions against reference ones in format of cicd/benchmark.txt"""
+    tp = int(np.count_nonzero(reference & decision))
+    fp = int(np.count_nonzero(~reference & decision))
+    tn = int(np.count_nonzero(~reference & ~decision))
+    fn = int(np.count_nonzero(reference & ~decision))
+
+    def ratio(numerator: int, denominator: int) -> Optional[float]:
+        return numerator / denominator if denominator else None
+
+    precision, recall = ratio(tp, tp + fp), ratio(tp, tp + fn)
+    f1 = ratio(2 * tp, 2 * tp + fp + fn)
+    values = [("FPR", ratio(fp, fp + tn)), ("FNR", ratio(fn, fn + tp)), ("ACC", ratio(tp + tn, len(reference))),
+              ("PRC", precision), ("RCL", recall), ("F1", f1)]
+    metrics = ", ".join(f"{name} : {'None' if value is None else f'{value:.10f}'}" for name, value in values)
+    return f"{title} -> TP : {tp}, FP : {fp}, TN : {tn}, FN : {fn}, {metrics}"
+
+
+def evaluate(ml_validator: MlValidator, cascade: CascadeClassifier, line_input: np.ndarray,
+             feature_input: np.ndarray) -> None:
+    """Reports time and decisions of the cascade against decisions of the model for each threshold preset"""
+    # warming up
+    ml_validator.predict(line_input[:1], feature_input[:1])
+    start_time = time.perf_counter()
+    probability = ml_validator.predict(line_input, feature_input)
+    model_time = time.perf_counter() - start_time
+    start_time = time.perf_counter()
+    cascade_probability = cascade.predict(feature_input)
+    uncertain = cascade.get_uncertain(cascade_probability)
+    cascade_probability[uncertain] = ml_validator.predict(line_input[uncertain], feature_input[uncertain])
+    cascade_time = time.perf_counter() - start_time
+    print(f"groups: {len(probability)} sent to the model: {np.count_nonzero(uncertain)}"
+          f" band: [{cascade.lower:.5f}, {cascade.upper:.5f}]")
+    print(f"model time: {model_time:.3f}s cascade time: {cascade_time:.3f}s")
+    for preset in ThresholdPreset:
+        threshold = MlValidator(preset).threshold
+        print(get_metrics(f"cascade {preset.value}", probability > threshold, cascade_probability > threshold))
+
+
+def main(paths: List[str], output: Optional[str], band: Optional[Tuple[float, float]], margin: float) -> None:
+    """Distills the cascade classifier on the paths or evaluates the classifier of model config"""
+    group_list = get_groups(paths)
+    ml_validator = MlValidator(ThresholdPreset.medium)
+    line_input = ml_validator.encode_batch([x[0] for x in group_list])
+    feature_input = ml_validator.extract_features(group_list)
+    if output:
+        probability = ml_validator.predict(line_input, feature_input)
+        cascade = train(feature_input, probability, margin)
+        cascade_details = {
+            "coef": [round(float(x), 6) for x in cascade.coef],
+            "intercept": round(cascade.intercept, 6),
+            "band": [round(cascade.lower, 6), round(cascade.upper, 6)]
+        }
+        with open(output, "w") as f:
+            json.dump(cascade_details, f)
+        print(f"Cascade classifier is saved to {output}, copy it to cascade section of model_config.json")
+        cascade = CascadeClassifier(cascade.coef, cascade.intercept, band or (cascade.lower, cascade.upper))
+    else:
+        cascade = MlValidator(ThresholdPreset.medium, cascade=True, cascade_band=band).cascade
+    evaluate(ml_validator, cascade, line_input, feature_input)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog="python -m experiment.cascade")
+    parser.add_argument("--path", help="directories or files with candidates", nargs="+", required=True)
+    parser.add_argument("--output", help="distill the classifier from the model and save it to the json file")
+    parser.add_argument("--band", help="lower and upper limits instead of the chosen ones", nargs=2, type=float)
+    parser.add_argument("--margin", help="relative margin of the chosen band (default: 0.1)", type=float, default=0.1)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    main(args.path, args.output, args.band, args.margin)
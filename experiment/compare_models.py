@@ -0,0 +1,133 @@
+import logging
+import random
+import sys
+import time
+from argparse import ArgumentParser
+from typing import List, Tuple
+
+import numpy as np
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import ThresholdPreset
+from credsweeper.credentials import Candidate
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.ml_model import MlValidator
+
+
+def get_ml_groups(path: str) -> List[Tuple[str, List[Candidate]]]:
+    """Scans the path and returns groups for ML model in the same order as post processing of CredSweeper sends them
+
+    Only groups where all candidates require ML are validated by the model in a real scan, so other groups do not
+    share batches with them.
+
+    """
+    cred_sweeper = CredSweeper()
+    cred_sweeper.scan(TextProvider([path]).get_scannable_files(cred_sweeper.config))
+    return [(key.value, group) for key, group in cred_sweeper.credential_manager.group_credentials().items()
+            if all(x.use_ml for x in group)]
+
+
+def get_probability(ml_validator: MlValidator, line_input: np.ndarray, feature_input: np.ndarray, batch_size: int,
+                    repeat: int) -> Tuple[np.ndarray, float]:
+    """Predicts probabilities of the inputs by batches
+
+    Return:
+        probabilities and inference time of the batches repeated the number of times in seconds
+
+    """
+    probability = np.zeros(len(line_input))
+    # warming up
+    ml_validator.predict(line_input[:batch_size], feature_input[:batch_size])
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        for head in range(0, len(line_input), batch_size):
+            probability[head:head + batch_size] = ml_validator.predict(line_input[head:head + batch_size],
+                                                                       feature_input[head:head + batch_size])
+    return probability, time.perf_counter() - start_time
+
+
+def main(path: str, batch_size: int, repeat: int, shuffles: int, max_flips: int) -> int:
+    """Scores ML groups of the path with the default and the quantized models and reports decision changes
+
+    The quantized model is checked with the batches of a real scan with the batch size and with batches of each
+    ML tuning batch size for the shuffled groups. The worst case of the compositions is reported.
+
+    Args:
+        path: directory or file to scan
+        batch_size: number of groups for a model call in a real scan
+        repeat: number of inference runs over the batches to measure time
+        shuffles: number of random orders of the groups for each batch size
+        max_flips: maximal number of changed decisions for a threshold preset which is accepted
+
+    Return:
+        0 if changes of decisions for each threshold preset are in the limit, 1 otherwise
+
+    """
+    group_list = get_ml_groups(path)
+    default_validator = MlValidator(ThresholdPreset.medium)
+    quantized_validator = MlValidator(ThresholdPreset.medium, quantized=True)
+    # both models score the same inputs
+    line_input = default_validator.encode_batch([x[0] for x in group_list])
+    feature_input = default_validator.extract_features(group_list)
+    default_probability, default_time = get_probability(default_validator, line_input, feature_input, batch_size,
+                                                        repeat)
+    _, quantized_time = get_probability(quantized_validator, line_input, feature_input, batch_size, repeat)
+    print(f"groups: {len(group_list)} batch size: {batch_size} repeat: {repeat}")
+    print(f"inference default: {default_time:.3f}s quantized: {quantized_time:.3f}s"
+          f" speedup: {default_time / quantized_time:.2f}")
+
+    # the batches of a real scan go first, then shuffled groups with each tuning batch size
+    rnd = random.Random(len(group_list))
+    compositions: List[Tuple[int, List[int]]] = [(batch_size, list(range(len(group_list))))]
+    for size in MlValidator.TUNE_BATCH_SIZES:
+        for _ in range(shuffles):
+            compositions.append((size, rnd.sample(range(len(group_list)), len(group_list))))
+    thresholds = {preset: MlValidator(preset).threshold for preset in ThresholdPreset}
+    worst_flips = {preset: (0, 0) for preset in ThresholdPreset}
+    max_drift = 0.0
+    for number, (size, order) in enumerate(compositions):
+        _, probability = quantized_validator.validate_groups([group_list[i] for i in order], size)
+        quantized_probability = np.zeros(len(group_list))
+        quantized_probability[order] = probability
+        drift = np.abs(quantized_probability - default_probability)
+        max_drift = max(max_drift, float(drift.max(initial=0)))
+        if 0 == number:
+            print(f"scan batches drift max: {drift.max(initial=0):.5f} mean: {drift.mean() if len(drift) else 0:.5f}")
+        for preset, threshold in thresholds.items():
+            default_decision = default_probability > threshold
+            quantized_decision = quantized_probability > threshold
+            lost = int(np.sum(default_decision & ~quantized_decision))
+            gained = int(np.sum(~default_decision & quantized_decision))
+            if 0 == number:
+                print(f"{preset.value:<8} threshold: {threshold:.5f} scan batches flips: {lost + gained}"
+                      f" (lost: {lost} gained: {gained})")
+            if sum(worst_flips[preset]) < lost + gained:
+                worst_flips[preset] = (lost, gained)
+    print(f"worst of {len(compositions)} batch compositions drift max: {max_drift:.5f}")
+    result = 0
+    for preset, (lost, gained) in worst_flips.items():
+        print(f"{preset.value:<8} threshold: {thresholds[preset]:.5f} worst flips: {lost + gained}"
+              f" (lost: {lost} gained: {gained})")
+        if max_flips < lost + gained:
+            result = 1
+    return result
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog="python -m experiment.compare_models")
+    parser.add_argument("--path",
+                        help="directory or file with candidates (default: tests/samples)",
+                        default="tests/samples")
+    parser.add_argument("--batch_size", help="ML batch size of a real scan (default: 16)", type=int, default=16)
+    parser.add_argument("--repeat", help="inference runs to measure time (default: 100)", type=int, default=100)
+    parser.add_argument("--shuffles",
+                        help="random orders of the groups for each ML tuning batch size (default: 10)",
+                        type=int,
+                        default=10)
+    parser.add_argument("--max_flips",
+                        help="accepted changes of decisions per threshold (default: 0)",
+                        type=int,
+                        default=0)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    sys.exit(main(args.path, args.batch_size, args.repeat, args.shuffles, args.max_flips))
@@ -0,0 +1,34 @@
+import os
+from argparse import ArgumentParser
+
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+ML_MODEL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "credsweeper", "ml_model")
+
+
+def main(model_path: str, quantized_path: str, op_types: list) -> None:
+    """Quantizes weights of the model to int8 with dynamic quantization of ONNX runtime
+
+    Args:
+        model_path: path of float32 ONNX model
+        quantized_path: path of the quantized model to be written
+        op_types: types of ONNX operators which weights are quantized
+
+    """
+    quantize_dynamic(model_path, quantized_path, op_types_to_quantize=op_types, weight_type=QuantType.QInt8)
+    print(f"Quantized {op_types} of {model_path} ({os.path.getsize(model_path)} bytes)"
+          f" to {quantized_path} ({os.path.getsize(quantized_path)} bytes)")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(prog="python -m experiment.quantize")
+    parser.add_argument("--model",
+                        help="float32 model (default: credsweeper/ml_model/ml_model.onnx)",
+                        default=os.path.join(ML_MODEL_DIR, "ml_model.onnx"))
+    parser.add_argument("--output",
+                        help="quantized model (default: credsweeper/ml_model/ml_model_int8.onnx)",
+                        default=os.path.join(ML_MODEL_DIR, "ml_model_int8.onnx"))
+    # quantized MatMul of dense layers changes decisions at thresholds, so only LSTM weights are quantized by default
+    parser.add_argument("--op_types", help="operators to quantize (default: LSTM)", nargs="+", default=["LSTM"])
+    args = parser.parse_args()
+    main(args.model, args.output, args.op_types)
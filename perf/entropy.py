@@ -0,0 +1,99 @@
+"""Measures entropy of values with count loops over alphabets vs histograms of the entropy module"""
+import argparse
+import logging
+import math
+import timeit
+from typing import List
+
+import numpy as np
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import Chars
+from credsweeper.common.entropy import Entropy
+from perf.keyword_filters import collect_values
+from tests import SAMPLES_PATH
+
+
+def get_shannon_entropy(data: str, iterator: str) -> float:
+    """Previous implementation of Util.get_shannon_entropy"""
+    entropy = 0.
+    for x in iterator:
+        p_x = float(data.count(x)) / len(data)
+        if p_x > 0:
+            entropy += -p_x * math.log(p_x, 2)
+    return entropy
+
+
+def is_entropy_validate(data: str) -> bool:
+    """Previous implementation of Util.is_entropy_validate"""
+    return 4.5 < get_shannon_entropy(data, Chars.BASE64_CHARS.value) \
+        or 3 < get_shannon_entropy(data, Chars.BASE36_CHARS.value) \
+        or 3 < get_shannon_entropy(data, Chars.HEX_CHARS.value)
+
+
+def get_renyi_entropy(data: str, alphabet: str, alpha: float) -> float:
+    """Previous implementation of RenyiEntropy feature"""
+    unique_elements = [x for x in alphabet if data.count(x) > 0]
+    p_x = np.array([float(data.count(x)) / len(data) for x in unique_elements])
+    p_x = p_x[p_x > 0]
+    if 0 == len(p_x):
+        return 0
+    if np.abs(0.0 - alpha) < np.finfo(np.float32).eps:
+        return np.log2(p_x.size)
+    if np.abs(1.0 - alpha) < np.finfo(np.float32).eps:
+        return np.sum(-p_x * np.log2(p_x))
+    return np.log2((p_x**alpha).sum()) / (1.0 - alpha)
+
+
+# alphabets and parameters of entropy features of the ML model
+FEATURES = [(x.value, alpha) for alpha in (1.0, 0.0, 0.5, 2.0)
+            for x in (Chars.HEX_CHARS, Chars.BASE36_CHARS, Chars.BASE64_CHARS)]
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.entropy")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--repeat", type=int, default=5, help="best of the repeats is reported")
+    parser.add_argument("--batch", type=int, default=128, help="number of values per batch of ML features")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    values: List[str] = collect_values(CredSweeper(), args.path, lower=False)["values"]
+    print(f"values: {len(values)} distinct: {len(set(values))}"
+          f" average length: {sum(len(x) for x in values) / len(values):.1f}")
+
+    assert [is_entropy_validate(x) for x in values] == [Entropy.is_entropy_validate(x) for x in values]
+
+    def run_cached() -> None:
+        Entropy.is_entropy_validate.cache_clear()
+        for value in values:
+            Entropy.is_entropy_validate(value)
+
+    old_time = min(timeit.repeat(lambda: [is_entropy_validate(x) for x in values], number=1, repeat=args.repeat))
+    new_time = min(timeit.repeat(run_cached, number=1, repeat=args.repeat))
+    print(f"{'validation per value':<32} loop: {old_time / len(values) * 1e6:8.2f}us"
+          f" histogram: {new_time / len(values) * 1e6:8.2f}us speedup: {old_time / new_time:6.2f}")
+
+    batches = [tuple(values[i:i + args.batch]) for i in range(0, len(values), args.batch)]
+
+    def run_batches() -> None:
+        Entropy.get_probability_matrix.cache_clear()
+        for batch in batches:
+            for alphabet, alpha in FEATURES:
+                Entropy.get_renyi_entropy(batch, alphabet, alpha)
+
+    for alphabet, alpha in FEATURES:
+        expected = np.array([get_renyi_entropy(x, alphabet, alpha) for x in values])
+        assert np.allclose(expected, Entropy.get_renyi_entropy(tuple(values), alphabet, alpha), rtol=0, atol=1e-12)
+    old_time = min(
+        timeit.repeat(lambda: [get_renyi_entropy(x, a, alpha) for x in values for a, alpha in FEATURES],
+                      number=1,
+                      repeat=args.repeat))
+    new_time = min(timeit.repeat(run_batches, number=1, repeat=args.repeat))
+    print(f"{len(FEATURES)} ML features per value{'':<9} loop: {old_time / len(values) * 1e6:8.2f}us"
+          f" batch: {new_time / len(values) * 1e6:8.2f}us speedup: {old_time / new_time:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
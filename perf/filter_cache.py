@@ -0,0 +1,49 @@
+"""Reports hit rates of filter verdict caches and scan time with and without the caches on tests/samples corpus"""
+import argparse
+import logging
+import time
+
+from credsweeper.app import CredSweeper
+from credsweeper.filters import Filter
+from perf.scan_throughput import load_texts
+from tests import SAMPLES_PATH
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.filter_cache")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=10, help="how many times the corpus is repeated")
+    parser.add_argument("--cache_size", type=int, default=Filter.CACHE_SIZE, help="verdicts per filter instance")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    for cache_size in (0, args.cache_size):
+        Filter.CACHE_SIZE = cache_size
+        credsweeper = CredSweeper()
+        file_texts = load_texts(credsweeper, args.path)
+        # warm-up pass is not measured and the verdicts are not kept
+        for provider, text in file_texts:
+            credsweeper.scanner.scan(provider.lines_to_targets(text.split('\n')))
+        for rule in credsweeper.scanner.rules:
+            for filter_ in rule.filters:
+                filter_.cache_clear()
+        file_texts *= args.scale
+        start_time = time.perf_counter()
+        for provider, text in file_texts:
+            credsweeper.scanner.scan(provider.lines_to_targets(text.split('\n')))
+        elapsed = time.perf_counter() - start_time
+        print(f"cache size: {cache_size} time: {elapsed:.3f}s")
+    hits = misses = 0
+    for filter_name, cache_info in sorted(credsweeper.scanner.get_filters_cache_info().items()):
+        if cache_info.hits or cache_info.misses:
+            hit_rate = cache_info.hits / (cache_info.hits + cache_info.misses)
+            print(f"{filter_name:<35} hits: {cache_info.hits:7} misses: {cache_info.misses:7}"
+                  f" size: {cache_info.currsize:6}/{cache_info.maxsize} hit rate: {hit_rate:.3f}")
+            hits += cache_info.hits
+            misses += cache_info.misses
+    print(f"total hits: {hits} misses: {misses} hit rate: {hits / max(1, hits + misses):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Measures dictionary filters and word features with substring loops vs Aho-Corasick automaton"""
+import argparse
+import logging
+import timeit
+from typing import Callable, Dict, List
+
+from credsweeper.app import CredSweeper
+from credsweeper.common import static_keyword_checklist
+from credsweeper.common.keyword_automaton import KeywordAutomaton
+from credsweeper.config import Config
+from credsweeper.credentials import LineData
+from credsweeper.filters import Filter, ValueCoupleKeywordCheck, ValueDictionaryKeywordCheck
+from credsweeper.scanner.scan_type import ScanType
+from perf.scan_throughput import load_texts
+from tests import SAMPLES_PATH
+
+
+def collect_values(credsweeper: CredSweeper, path: str, lower: bool = True) -> Dict[str, List[str]]:
+    """Scans the corpus and records values, lines and paths of all line data which reach the filters"""
+    samples: Dict[str, List[str]] = {"values": [], "lines": [], "paths": []}
+    original_filtering = ScanType.filtering
+
+    def recording_filtering(config: Config, line_data: LineData, filters: List[Filter]) -> bool:
+        if line_data.value:
+            samples["values"].append(line_data.value.lower() if lower else line_data.value)
+            samples["lines"].append(line_data.line.lower() if lower else line_data.line)
+            samples["paths"].append(line_data.path.lower() if lower else line_data.path)
+        return original_filtering(config, line_data, filters)
+
+    ScanType.filtering = recording_filtering  # type: ignore
+    try:
+        for provider, text in load_texts(credsweeper, path):
+            credsweeper.scanner.scan(provider.lines_to_targets(text.split('\n')))
+    finally:
+        ScanType.filtering = original_filtering  # type: ignore
+    return samples
+
+
+def any_word_loop(words: List[str]) -> Callable[[str], bool]:
+    """Previous implementation of the checks: substring test of each word"""
+
+    def check(text: str) -> bool:
+        for word in words:
+            if word in text:
+                return True
+        return False
+
+    return check
+
+
+def couple_word_loop(words: List[str]) -> Callable[[str], bool]:
+    """Previous implementation of ValueCoupleKeywordCheck"""
+
+    def check(text: str) -> bool:
+        matches = 0
+        for word in words:
+            if word in text:
+                matches += 1
+                if 1 < matches:
+                    return True
+        return False
+
+    return check
+
+
+def measure(name: str, texts: List[str], old: Callable[[str], bool], new: Callable[[str], bool], repeat: int) -> None:
+    """Checks equality of results and prints best time per text of both implementations"""
+    assert [old(x) for x in texts] == [new(x) for x in texts], name
+    old_time = min(timeit.repeat(lambda: [old(x) for x in texts], number=1, repeat=repeat)) / len(texts)
+    new_time = min(timeit.repeat(lambda: [new(x) for x in texts], number=1, repeat=repeat)) / len(texts)
+    print(f"{name:<40} loop: {old_time * 1e6:8.2f}us automaton: {new_time * 1e6:8.2f}us"
+          f" speedup: {old_time / new_time:6.2f}")
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.keyword_filters")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--repeat", type=int, default=5, help="best of the repeats is reported")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    samples = collect_values(CredSweeper(), args.path)
+    values, lines, paths = samples["values"], samples["lines"], samples["paths"]
+    print(f"values: {len(values)} average length: {sum(len(x) for x in values) / len(values):.1f}")
+
+    keywords = sorted(static_keyword_checklist.keyword_set)
+    morphemes = sorted(static_keyword_checklist.morpheme_set)
+    keyword_automaton = static_keyword_checklist.keyword_automaton
+    morpheme_automaton = static_keyword_checklist.morpheme_automaton
+    measure(ValueDictionaryKeywordCheck.__name__, values, any_word_loop(keywords), keyword_automaton.has_any,
+            args.repeat)
+    measure(ValueCoupleKeywordCheck.__name__, values, couple_word_loop(morphemes),
+            lambda x: 1 < len(morpheme_automaton.find_words(x, limit=2)), args.repeat)
+
+    # word features of ML model have short lists, so the crossover size of the lists is measured
+    for words_number in (1, 8, 64, 256):
+        words = keywords[::len(keywords) // words_number][:words_number]
+        automaton = KeywordAutomaton(words)
+        for kind, texts in (("WordInSecret", values), ("WordInLine", lines), ("WordInPath", paths)):
+            measure(f"{kind} of {words_number} words", texts, any_word_loop(words), automaton.has_any, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Measures ML validation throughput for batch sizes, the size chosen by --ml_batch_size auto and session options"""
+import argparse
+import logging
+import time
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import ThresholdPreset
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.ml_model import MlValidator
+from tests import SAMPLES_PATH
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.ml_batch")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=20, help="how many times the groups are repeated")
+    parser.add_argument("--threads", type=int, default=0, help="intra_op_num_threads (default: ONNX runtime choice)")
+    parser.add_argument("--optimization", default="ORT_ENABLE_ALL", help="name of GraphOptimizationLevel member")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    cred_sweeper.scan(TextProvider([args.path]).get_scannable_files(cred_sweeper.config))
+    group_list = [(key.value, group) for key, group in cred_sweeper.credential_manager.group_credentials().items()]
+    group_list *= args.scale
+    session_options = {"intra_op_num_threads": args.threads, "graph_optimization_level": args.optimization}
+    ml_validator = MlValidator(ThresholdPreset.medium, session_options=session_options)
+    print(f"groups: {len(group_list)} session options: {session_options}")
+    # warm up
+    ml_validator.validate_groups(group_list, 16)
+    for batch_size in (1, *MlValidator.TUNE_BATCH_SIZES):
+        start_time = time.perf_counter()
+        ml_validator.validate_groups(group_list, batch_size)
+        elapsed = time.perf_counter() - start_time
+        print(f"batch size: {batch_size:>10} {len(group_list) / elapsed:8.0f} groups/s")
+    start_time = time.perf_counter()
+    ml_validator.validate_groups(group_list, None)
+    elapsed = time.perf_counter() - start_time
+    title = f"auto ({ml_validator.tuned_batch_size})"
+    print(f"batch size: {title:>10} {len(group_list) / elapsed:8.0f} groups/s including the tuning")
+
+
+if __name__ == "__main__":
+    main()
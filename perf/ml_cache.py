@@ -0,0 +1,48 @@
+"""Measures ML validation time without the prediction cache, with an empty cache file and with the filled one"""
+import argparse
+import logging
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_provider import TextProvider
+from tests import SAMPLES_PATH
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.ml_cache")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=100, help="how many copies of the corpus are scanned")
+    parser.add_argument("--batch", type=int, default=16, help="ML batch size")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # copies have different paths, so the groups are the same as in a scan of many repositories
+        for i in range(args.scale):
+            shutil.copytree(args.path, Path(tmp_dir) / "corpus" / str(i))
+        cache_path = Path(tmp_dir) / "ml_cache.sqlite"
+        expected = None
+        for title, ml_cache in [("no cache", None), ("empty cache", cache_path), ("filled cache", cache_path)]:
+            cred_sweeper = CredSweeper(ml_batch_size=args.batch, ml_cache=ml_cache)
+            # the model is loaded before the measurement
+            ml_validator = cred_sweeper.ml_validator
+            cred_sweeper.scan(TextProvider([Path(tmp_dir) / "corpus"]).get_scannable_files(cred_sweeper.config))
+            groups_number = len(cred_sweeper.credential_manager.group_credentials())
+            start_time = time.perf_counter()
+            cred_sweeper.post_processing()
+            elapsed = time.perf_counter() - start_time
+            credentials = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+            expected = expected or credentials
+            assert expected == credentials
+            info = ml_validator.prediction_cache.cache_info() if ml_validator.prediction_cache else ""
+            print(f"{title:<13} groups: {groups_number} post processing: {elapsed:.3f}s {info}")
+            if ml_validator.prediction_cache:
+                ml_validator.prediction_cache.close()
+
+
+if __name__ == "__main__":
+    main()
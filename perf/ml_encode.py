@@ -0,0 +1,51 @@
+"""Measures one-hot encoding of candidate values for ML model: per value loop vs batch lookup table"""
+import argparse
+import logging
+import random
+import timeit
+from typing import List
+
+import numpy as np
+
+from credsweeper.app import CredSweeper
+from credsweeper.ml_model import MlValidator
+from perf.keyword_filters import collect_values
+from tests import SAMPLES_PATH
+
+
+def encode_each(ml_validator: MlValidator, values: List[str]) -> np.ndarray:
+    """Previous encoding of a batch: float64 matrix per value, stacked and cast before the model call"""
+    return np.vstack([ml_validator.encode(x, ml_validator.char_to_index)[np.newaxis]
+                      for x in values]).astype(np.float32)
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.ml_encode")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--repeat", type=int, default=3, help="best of the repeats is reported")
+    parser.add_argument("--batch", type=int, default=16, help="ML batch size which splits the candidates")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000], help="numbers of candidates")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    credsweeper = CredSweeper()
+    ml_validator = MlValidator(0.5)
+    corpus = collect_values(credsweeper, args.path, lower=False)["values"]
+    random.seed(42)
+    for size in args.sizes:
+        values = random.choices(corpus, k=size)
+        batches = [values[i:i + args.batch] for i in range(0, size, args.batch)]
+        for batch in batches[:10]:
+            assert np.array_equal(encode_each(ml_validator, batch), ml_validator.encode_batch(batch))
+        old_time = min(
+            timeit.repeat(lambda: [encode_each(ml_validator, x) for x in batches], number=1, repeat=args.repeat))
+        new_time = min(
+            timeit.repeat(lambda: [ml_validator.encode_batch(x) for x in batches], number=1, repeat=args.repeat))
+        print(f"candidates: {size:>7} batch: {args.batch:>4}"
+              f" per value: {size / old_time:10.0f}/s batch table: {size / new_time:10.0f}/s"
+              f" speedup: {old_time / new_time:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
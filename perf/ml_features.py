@@ -0,0 +1,84 @@
+"""Measures feature extraction of ML model: group by group with growing arrays vs columns of the whole batch"""
+import argparse
+import logging
+import random
+import timeit
+from typing import List, Tuple
+
+import numpy as np
+from sklearn.preprocessing import LabelBinarizer
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import ThresholdPreset
+from credsweeper.credentials import Candidate
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.ml_model import MlValidator
+from credsweeper.ml_model.features import Feature, FileExtension, RuleName
+from tests import SAMPLES_PATH
+
+
+def get_feature(feature: Feature, candidate: Candidate) -> np.ndarray:
+    """Previous call of a feature for a candidate, a categorical feature fitted LabelBinarizer on each call"""
+    if isinstance(feature, (FileExtension, RuleName)):
+        enc = LabelBinarizer()
+        enc.fit(feature.extensions if isinstance(feature, FileExtension) else feature.rule_names)
+        label = candidate.line_data_list[0].file_type if isinstance(feature, FileExtension) else candidate.rule_name
+        return enc.transform([label])[0]
+    new_feature = feature([candidate])[0]
+    if not isinstance(new_feature, np.ndarray):
+        new_feature = np.array([new_feature])
+    return new_feature
+
+
+def get_group_features(ml_validator: MlValidator, candidates: List[Candidate]) -> np.ndarray:
+    """Previous feature extraction of a group with np.append"""
+    common_features = np.array([], dtype=float)
+    for feature in ml_validator.common_feature_list:
+        common_features = np.append(common_features, get_feature(feature, candidates[0]))
+    unique_features = np.array([], dtype=bool)
+    for feature in ml_validator.unique_feature_list:
+        unique_features = np.append(unique_features, get_feature(feature, candidates[0]))
+    for candidate in candidates[1:]:
+        for feature in ml_validator.unique_feature_list:
+            unique_features = unique_features | get_feature(feature, candidate)
+    return np.array([np.hstack([common_features, unique_features])])
+
+
+def extract_each(ml_validator: MlValidator, group_list: List[Tuple[str, List[Candidate]]]) -> np.ndarray:
+    """Previous batch of features: a row per group, stacked and cast before the model call"""
+    return np.vstack([get_group_features(ml_validator, x[1]) for x in group_list]).astype(np.float32)
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.ml_features")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--repeat", type=int, default=3, help="best of the repeats is reported")
+    parser.add_argument("--batch", type=int, default=16, help="ML batch size")
+    parser.add_argument("--size", type=int, default=10000, help="number of groups")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    cred_sweeper.scan(TextProvider([args.path]).get_scannable_files(cred_sweeper.config))
+    cred_sweeper.post_processing()
+    corpus = [(key.value, group) for key, group in cred_sweeper.credential_manager.group_credentials().items()]
+    random.seed(42)
+    group_list = random.choices(corpus, k=args.size)
+    batches = [group_list[i:i + args.batch] for i in range(0, len(group_list), args.batch)]
+    candidates_number = sum(len(x[1]) for x in group_list)
+    print(f"groups: {len(group_list)} candidates: {candidates_number} batch: {args.batch}")
+
+    ml_validator = MlValidator(ThresholdPreset.medium)
+    for batch in batches[:10]:
+        assert np.array_equal(extract_each(ml_validator, batch), ml_validator.extract_features(batch))
+    old_time = min(timeit.repeat(lambda: [extract_each(ml_validator, x) for x in batches], number=1,
+                                 repeat=args.repeat))
+    new_time = min(
+        timeit.repeat(lambda: [ml_validator.extract_features(x) for x in batches], number=1, repeat=args.repeat))
+    print(f"per group: {len(group_list) / old_time:8.0f} groups/s"
+          f" columns: {len(group_list) / new_time:8.0f} groups/s speedup: {old_time / new_time:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
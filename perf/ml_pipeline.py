@@ -0,0 +1,54 @@
+"""Measures scan and ML validation time: ML after the scan vs ML in a worker thread during the scan"""
+import argparse
+import logging
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_provider import TextProvider
+from tests import SAMPLES_PATH
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.ml_pipeline")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=100, help="how many copies of the corpus are scanned")
+    parser.add_argument("--batch", type=int, default=16, help="ML batch size")
+    parser.add_argument("--jobs", type=int, default=1, help="number of scanning processes")
+    parser.add_argument("--repeat", type=int, default=2, help="best of the repeats is reported")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # copies have different paths, so candidates are not grouped across them
+        for i in range(args.scale):
+            shutil.copytree(args.path, Path(tmp_dir) / str(i))
+        results = {}
+        for ml_pipeline in [False, True] * args.repeat:
+            cred_sweeper = CredSweeper(pool_count=args.jobs, ml_batch_size=args.batch, ml_pipeline=ml_pipeline)
+            # the model is loaded before the measurement
+            ml_validator = cred_sweeper.ml_validator
+            content_providers = TextProvider([tmp_dir]).get_scannable_files(cred_sweeper.config)
+            start_time = time.perf_counter()
+            cred_sweeper.scan(content_providers)
+            scan_time = time.perf_counter()
+            cred_sweeper.post_processing()
+            end_time = time.perf_counter()
+            assert ml_validator is cred_sweeper.ml_validator
+            credentials = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+            assert results.setdefault("credentials", credentials) == credentials
+            if end_time - start_time < results.get(ml_pipeline, (float("inf"), ))[0]:
+                results[ml_pipeline] = (end_time - start_time, scan_time - start_time, end_time - scan_time)
+    print(f"files: {len(content_providers)} credentials: {len(results['credentials'])}"
+          f" batch: {args.batch} jobs: {args.jobs}")
+    for ml_pipeline, title in [(False, "ML after scan"), (True, "ML during scan")]:
+        total, scan, post = results[ml_pipeline]
+        print(f"{title:<15} total: {total:.3f}s scan: {scan:.3f}s post processing: {post:.3f}s")
+    print(f"speedup: {results[False][0] / results[True][0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Counts regex calls per scanned line of Scanner on tests/samples corpus"""
+import argparse
+import logging
+from collections import Counter
+from typing import Any, Callable
+
+from regex import regex
+
+from credsweeper.app import CredSweeper
+from perf.scan_throughput import load_texts
+from tests import SAMPLES_PATH
+
+COUNTER: Counter = Counter()
+
+
+class CountingPattern:
+    """Proxy of compiled pattern which counts calls of its matching methods"""
+
+    METHODS = ("search", "match", "fullmatch", "findall", "finditer", "split", "sub")
+
+    def __init__(self, pattern: regex.Pattern, kind: str) -> None:
+        self.__pattern = pattern
+        self.__kind = kind
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.__pattern, name)
+        if name in self.METHODS:
+            COUNTER[self.__kind] += 1
+        return attr
+
+
+def counting_function(function: Callable, kind: str) -> Callable:
+    """Wraps module level function of regex which compiles or looks up pattern string on each call"""
+
+    def wrapper(*args, **kwargs) -> Any:
+        COUNTER[kind] += 1
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+def instrument(credsweeper: CredSweeper) -> None:
+    """Replaces patterns of the rules and their filters with counting proxies"""
+    for name in ("search", "match", "findall", "split", "sub"):
+        setattr(regex, name, counting_function(getattr(regex, name), "regex module functions"))
+    for rule in credsweeper.scanner.rules:
+        rule.patterns = [CountingPattern(x, "rule patterns") for x in rule.patterns]  # type: ignore
+        for filter_ in rule.filters:
+            for attr in dir(filter_):
+                if isinstance(getattr(filter_, attr, None), regex.Pattern):
+                    setattr(filter_, attr, CountingPattern(getattr(filter_, attr), "filter patterns"))
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.regex_calls")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    credsweeper = CredSweeper()
+    file_texts = load_texts(credsweeper, args.path)
+    instrument(credsweeper)
+    lines_count = sum(1 + text.count('\n') for _, text in file_texts)
+    candidates_count = 0
+    for provider, text in file_texts:
+        candidates_count += len(credsweeper.scanner.scan(provider.lines_to_targets(text.split('\n'))))
+    print(f"lines: {lines_count} candidates: {candidates_count}")
+    for kind, count in sorted(COUNTER.items()):
+        print(f"{kind}: {count} ({count / lines_count:.3f} per line)")
+    total = sum(COUNTER.values())
+    print(f"total: {total} ({total / lines_count:.3f} per line)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Measures scanning of one huge text file split to chunks: time of each chunk, simulated time for each number of
+processes and time of the pool in comparison with a sequential scan."""
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.scan_pool import ScanPool, scan_chunk, split_file
+from perf.scan_schedule import make_huge_file, simulate
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.scan_chunk")
+    parser.add_argument("--size", type=int, default=8 << 20, help="size of the file in bytes")
+    parser.add_argument("--chunk_size", type=int, default=1 << 20, help="size of a chunk in bytes")
+    parser.add_argument("--jobs", type=int, default=4, help="maximal number of processes")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = Path(tmp_dir) / "huge.txt"
+        make_huge_file(file_path, args.size)
+        cred_sweeper = CredSweeper(ml_threshold=0.0)
+        start_time = time.perf_counter()
+        expected = cred_sweeper.file_scan(TextContentProvider(file_path))
+        sequential_time = time.perf_counter() - start_time
+        chunks = split_file(TextContentProvider(file_path), cred_sweeper.config, args.chunk_size)
+        durations = []
+        candidates = 0
+        for chunk in chunks:
+            start_time = time.perf_counter()
+            candidates += len(scan_chunk(cred_sweeper, chunk))
+            durations.append(time.perf_counter() - start_time)
+        print(f"size: {args.size} sequential time: {sequential_time:.3f}s candidates: {len(expected)}")
+        print(f"chunks: {len(chunks)} time of chunks: {sum(durations):.3f}s candidates: {candidates}")
+        for processes in range(1, 1 + args.jobs):
+            chunk_time = simulate([[i] for i in range(len(chunks))], durations, processes)
+            print(f"jobs {processes}: simulated time {chunk_time:.3f}s speedup {sequential_time / chunk_time:.2f}")
+
+        cred_sweeper = CredSweeper(pool_count=args.jobs, ml_threshold=0.0, chunk_size=args.chunk_size)
+        content_providers = TextProvider([file_path]).get_scannable_files(cred_sweeper.config)
+        # the first scan starts the processes
+        cred_sweeper.scan(content_providers)
+        start_time = time.perf_counter()
+        cred_sweeper.scan(content_providers)
+        print(f"pool of {args.jobs} processes: {time.perf_counter() - start_time:.3f}s"
+              f" candidates: {len(cred_sweeper.credential_manager.get_credentials())}")
+        ScanPool.close_shared()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Measures pickled size of a scan task and of results per finding and time of multi job runs: the first one starts
+the pool, next ones reuse it"""
+import argparse
+import logging
+import pickle
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.scan_pool import ScanPool, encode_candidates, get_rule_table
+from tests import SAMPLES_PATH
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.scan_pool")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=10, help="how many copies of the corpus are scanned")
+    parser.add_argument("--jobs", type=int, default=2, help="number of scanning processes")
+    parser.add_argument("--runs", type=int, default=3, help="number of runs with the same pool")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i in range(args.scale):
+            shutil.copytree(args.path, Path(tmp_dir) / str(i))
+        cred_sweeper = CredSweeper(pool_count=args.jobs, ml_threshold=0.0)
+        content_providers = TextProvider([tmp_dir]).get_scannable_files(cred_sweeper.config)
+        # a task of the pool carries only the content provider instead of the bound method with the whole instance
+        method_size = len(pickle.dumps(cred_sweeper.file_scan))
+        task_size = len(pickle.dumps((0, content_providers[0])))
+        print(f"files: {len(content_providers)} jobs: {args.jobs}")
+        print(f"pickled bound method: {method_size} bytes, pickled task: {task_size} bytes")
+        # results of a file were pickled candidates with config and rule objects, now they are compact records
+        rule_ids = {rule.rule_name: i for i, rule in enumerate(get_rule_table(cred_sweeper))}
+        findings = candidates_size = record_size = 0
+        for index, content_provider in enumerate(content_providers[:len(content_providers) // args.scale]):
+            candidates = cred_sweeper.file_scan(content_provider)
+            findings += len(candidates)
+            candidates_size += len(pickle.dumps((index, candidates)))
+            record_size += len(pickle.dumps(encode_candidates(index, candidates, rule_ids)))
+        if findings:
+            print(f"findings: {findings} pickled candidates: {candidates_size / findings:.0f} bytes per finding,"
+                  f" records: {record_size / findings:.0f} bytes per finding")
+        for run in range(args.runs):
+            # the same arguments give the same scan spec, so the next instances share the pool
+            cred_sweeper = CredSweeper(pool_count=args.jobs, ml_threshold=0.0)
+            start_time = time.perf_counter()
+            cred_sweeper.scan(content_providers)
+            elapsed = time.perf_counter() - start_time
+            print(f"run {run}: {elapsed:.3f}s candidates: {len(cred_sweeper.credential_manager.get_credentials())}")
+        ScanPool.close_shared()
+
+
+if __name__ == "__main__":
+    main()
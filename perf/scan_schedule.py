@@ -0,0 +1,91 @@
+"""Compares dispatching of files to the scan pool in walk order with fixed chunks and by estimated cost on skewed tree.
+
+Scan time of each file is measured in one process, then dispatching of chunks to the first free process is simulated
+for each number of processes. Finally, the tree is scanned with the pool and utilization of the processes is reported.
+"""
+import argparse
+import heapq
+import logging
+import math
+import random
+import shutil
+import string
+import tempfile
+import time
+from pathlib import Path
+from typing import List, Sequence
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.scan_pool import ScanPool, estimate_cost, get_chunks
+from tests import SAMPLES_PATH
+
+
+def simulate(chunks: Sequence[Sequence[int]], durations: Sequence[float], processes: int) -> float:
+    """Time of the scan when each chunk is taken by the first free process"""
+    free_at: List[float] = [0.0] * processes
+    for chunk in chunks:
+        start = heapq.heappop(free_at)
+        heapq.heappush(free_at, start + sum(durations[x] for x in chunk))
+    return max(free_at)
+
+
+def make_huge_file(path: Path, size: int) -> None:
+    """Writes text with random assignments, some of them look like credentials"""
+    rnd = random.Random(size)
+    with open(path, "w") as f:
+        written = 0
+        while written < size:
+            value = ''.join(rnd.choices(string.ascii_letters + string.digits, k=16))
+            line = f"password = '{value}'\n" if rnd.random() < 0.01 else f"var_{written} = '{value}';\n"
+            written += f.write(line)
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.scan_schedule")
+    parser.add_argument("--scale", type=int, default=10, help="how many copies of tests/samples are scanned")
+    parser.add_argument("--huge", type=int, default=3, help="number of huge files at the end of walk order")
+    parser.add_argument("--huge_size", type=int, default=2 << 20, help="size of a huge file in bytes")
+    parser.add_argument("--jobs", type=int, default=8, help="maximal number of processes")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for i in range(args.scale):
+            shutil.copytree(SAMPLES_PATH, Path(tmp_dir) / str(i))
+        (Path(tmp_dir) / "zz").mkdir()
+        for i in range(args.huge):
+            make_huge_file(Path(tmp_dir) / "zz" / f"huge_{i}.txt", args.huge_size)
+        cred_sweeper = CredSweeper(ml_threshold=0.0)
+        content_providers = TextProvider([tmp_dir]).get_scannable_files(cred_sweeper.config)
+        durations: List[float] = []
+        for content_provider in content_providers:
+            start_time = time.perf_counter()
+            cred_sweeper.file_scan(content_provider)
+            durations.append(time.perf_counter() - start_time)
+        total = sum(durations)
+        costs = [estimate_cost(x, cred_sweeper.config) for x in content_providers]
+        print(f"files: {len(content_providers)} huge: {args.huge} sequential time: {total:.3f}s"
+              f" the longest file: {max(durations):.3f}s")
+        print("jobs  walk order: time efficiency  by cost: time efficiency")
+        for processes in range(1, 1 + args.jobs):
+            chunk_size = max(1, math.ceil(len(content_providers) / (4 * processes)))
+            walk_chunks = [range(i, min(i + chunk_size, len(durations))) for i in range(0, len(durations), chunk_size)]
+            walk_time = simulate(walk_chunks, durations, processes)
+            cost_time = simulate(get_chunks(costs, processes), durations, processes)
+            print(f"{processes:4d}  {walk_time:16.3f}s {total / processes / walk_time:10.1%}"
+                  f"  {cost_time:13.3f}s {total / processes / cost_time:10.1%}")
+
+        cred_sweeper = CredSweeper(pool_count=args.jobs, ml_threshold=0.0)
+        # the first scan starts the processes
+        cred_sweeper.scan(content_providers)
+        cred_sweeper.scan(content_providers)
+        scan_pool = ScanPool.get(args.jobs, cred_sweeper.rule_path, cred_sweeper.config_dict)
+        for info in scan_pool.get_workers_info():
+            print(f"process {info.pid}: files {info.files} busy {info.busy:.3f}s utilization {info.utilization:.1%}")
+        ScanPool.close_shared()
+
+
+if __name__ == "__main__":
+    main()
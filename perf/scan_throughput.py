@@ -0,0 +1,52 @@
+"""Measures lines per second of Scanner on tests/samples corpus scaled up"""
+import argparse
+import logging
+import time
+from typing import List, Tuple
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.file_handler.text_provider import TextProvider
+from tests import SAMPLES_PATH
+
+
+def load_texts(credsweeper: CredSweeper, path: str) -> List[Tuple[TextContentProvider, str]]:
+    """Reads all files once and returns decoded texts with their providers"""
+    result = []
+    for provider in TextProvider([path]).get_scannable_files(credsweeper.config):
+        if isinstance(provider, TextContentProvider):
+            text = provider.get_text()
+            if text is not None:
+                result.append((provider, text))
+    return result
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.scan_throughput")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=100, help="how many times the corpus is repeated")
+    parser.add_argument("--repeat", type=int, default=3, help="best of the repeats is reported")
+    parser.add_argument("--buffer_scan", action="store_true", help="search rules in whole text of files")
+    args = parser.parse_args()
+    # oversize lines and broken samples are reported on each pass
+    logging.disable(logging.CRITICAL)
+
+    credsweeper = CredSweeper()
+    file_texts = load_texts(credsweeper, args.path) * args.scale
+    lines_count = sum(1 + text.count('\n') for _, text in file_texts)
+    best = None
+    for _ in range(args.repeat):
+        start_time = time.perf_counter()
+        for provider, text in file_texts:
+            if args.buffer_scan:
+                credsweeper.scanner.scan_text(text, provider.file_path, provider.file_type, provider.info)
+            else:
+                credsweeper.scanner.scan(provider.lines_to_targets(text.split('\n')))
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"files: {len(file_texts)} lines: {lines_count} time: {best:.3f}s lines/sec: {lines_count / best:.0f}")
+
+
+if __name__ == "__main__":
+    main()
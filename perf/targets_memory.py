@@ -0,0 +1,61 @@
+"""Measures peak memory of analysis targets of a large text: eager list of targets vs lazy file view"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+from typing import Callable, Sequence, Tuple
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.analysis_target import AnalysisTarget, FileView
+from credsweeper.file_handler.text_lines import TextLines
+from perf.scan_throughput import load_texts
+from tests import SAMPLES_PATH
+
+
+def eager_targets(text: str) -> Sequence[AnalysisTarget]:
+    """Targets as they were created before the file view: split of the text and an object per line"""
+    lines = text.split('\n')
+    return [AnalysisTarget(line, i + 1, lines, "big.txt", ".txt", "") for i, line in enumerate(lines)]
+
+
+def lazy_targets(text: str) -> Sequence[AnalysisTarget]:
+    """Targets provided on demand by the file view over the text"""
+    return FileView(TextLines(text), None, "big.txt", ".txt", "")
+
+
+def measure(text: str, make_targets: Callable[[str], Sequence[AnalysisTarget]],
+            credsweeper: CredSweeper) -> Tuple[int, int, float]:
+    """Returns peak of traced memory after targets creation, peak during scan and time of the scan"""
+    gc.collect()
+    tracemalloc.start()
+    targets = make_targets(text)
+    targets_peak = tracemalloc.get_traced_memory()[1]
+    start_time = time.perf_counter()
+    credsweeper.scanner.scan(targets)
+    elapsed = time.perf_counter() - start_time
+    scan_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return targets_peak, scan_peak, elapsed
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.targets_memory")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--scale", type=int, default=50, help="how many times the corpus is repeated in the text")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    credsweeper = CredSweeper()
+    text = '\n'.join(x[1] for x in load_texts(credsweeper, args.path)) * args.scale
+    mib = 1 << 20
+    print(f"text: {len(text) / mib:.1f} MiB, lines: {1 + text.count(chr(10))}")
+    for name, make_targets in (("list", eager_targets), ("view", lazy_targets)):
+        targets_peak, scan_peak, elapsed = measure(text, make_targets, credsweeper)
+        print(f"{name}: targets peak: {targets_peak / mib:.1f} MiB scan peak: {scan_peak / mib:.1f} MiB"
+              f" scan time: {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
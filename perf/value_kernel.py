@@ -0,0 +1,124 @@
+"""Measures value filters with separate regexes and loops vs the fused value kernel"""
+import argparse
+import logging
+import timeit
+from typing import Callable, Dict, List
+
+from regex import regex
+
+from credsweeper.app import CredSweeper
+from credsweeper.credentials import LineData
+from credsweeper.filters import Filter, ValueArrayDictionaryCheck, ValueCamelCaseCheck, ValueFilePathCheck, \
+    ValueFirstWordCheck, ValueLastWordCheck, ValueMethodCheck, ValueNotAllowedPatternCheck, ValuePatternCheck, \
+    ValueTokenCheck
+from credsweeper.filters.value_kernel import get_value_kernel
+from credsweeper.utils import Util
+from perf.keyword_filters import collect_values
+from tests import SAMPLES_PATH
+
+FIRST_WORD_PATTERN = regex.compile(
+    "^" + Util.get_regex_combine_or([
+        "\\=", "\\{", "\\)", "\\<", "\\>", "\\#", "\\:", "\\\\", "\\/\\/", "\\_", "\\\\[u]", "\\/\\*", "\\%[deflspuvxz]"
+    ]), regex.IGNORECASE)
+LAST_WORD_PATTERN = regex.compile(".*:$", regex.IGNORECASE)
+CAMEL_CASE_PATTERN = regex.compile(
+    Util.get_regex_combine_or(["^([a-z]+([A-Z][a-z]+)+)$", "^([A-Z][a-z]+([A-Z][a-z]+)+)$"]))
+ARRAY_DICTIONARY_PATTERN = regex.compile("\\[('|\")?.+('|\")?\\]")
+METHOD_PATTERN = regex.compile(".*\\(.*\\).*")
+NOT_ALLOWED_PATTERN = regex.compile(
+    Util.get_regex_combine_or(["[,<>{};\\]\\[](\\s)*", "(\\s)+[\\\\]", "(\\\\n)(\\s)*"]) + "$", regex.IGNORECASE)
+SPLIT_PATTERN = regex.compile(" |;|\\)|\\(|{|}|<|>|\\[|\\]|`")
+EQUAL_PATTERN = regex.compile("(.)\\1{3,}")
+
+
+def is_sequence(value: str, step: int) -> bool:
+    """Previous loop of ascending (step 1) and descending (step -1) checks of ValuePatternCheck"""
+    count = 1
+    for key in range(len(value) - 1):
+        if ord(value[key + 1]) - ord(value[key]) == step:
+            count += 1
+        else:
+            count = 1
+            continue
+        if 4 == count:
+            return True
+    return False
+
+
+def is_file_path(value: str) -> bool:
+    """Previous implementation of ValueFilePathCheck"""
+    contains_special_characters = False
+    for i in " !$`&*()+":
+        if i in value:
+            contains_special_characters = True
+            break
+    return (('/' in value) ^ (':\\' in value)) and not contains_special_characters
+
+
+# previous verdicts of the filters for a non-empty value
+SEPARATE_CHECKS: Dict[str, Callable[[str], bool]] = {
+    ValueArrayDictionaryCheck.__name__: lambda x: bool(ARRAY_DICTIONARY_PATTERN.search(x)),
+    ValueCamelCaseCheck.__name__: lambda x: bool(CAMEL_CASE_PATTERN.match(x)),
+    ValueFilePathCheck.__name__: is_file_path,
+    ValueFirstWordCheck.__name__: lambda x: bool(FIRST_WORD_PATTERN.match(x)),
+    ValueLastWordCheck.__name__: lambda x: len(x) < 16 and bool(LAST_WORD_PATTERN.search(x)),
+    ValueMethodCheck.__name__: lambda x: "function" in x or bool(METHOD_PATTERN.search(x)),
+    ValueNotAllowedPatternCheck.__name__: lambda x: bool(NOT_ALLOWED_PATTERN.search(x)),
+    ValueTokenCheck.__name__: lambda x: 2 == len(tokens := SPLIT_PATTERN.split(x, maxsplit=1)) and len(tokens[0]) < 5,
+    ValuePatternCheck.__name__: lambda x: len(x) < 4 or bool(EQUAL_PATTERN.search(x)) or is_sequence(x, 1) or
+    is_sequence(x, -1),
+}
+
+FUSED_FILTERS: List[Filter] = [
+    ValueArrayDictionaryCheck(),
+    ValueCamelCaseCheck(),
+    ValueFilePathCheck(),
+    ValueFirstWordCheck(),
+    ValueLastWordCheck(),
+    ValueMethodCheck(),
+    ValueNotAllowedPatternCheck(),
+    ValueTokenCheck(),
+    ValuePatternCheck(),
+]
+
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(prog="python -m perf.value_kernel")
+    parser.add_argument("--path", default=str(SAMPLES_PATH), help="corpus directory (default: tests/samples)")
+    parser.add_argument("--repeat", type=int, default=5, help="best of the repeats is reported")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    credsweeper = CredSweeper()
+    values = sorted(set(collect_values(credsweeper, args.path, lower=False)["values"]))
+    line_data_list = []
+    for value in values:
+        line_data = LineData(credsweeper.config, f"x = {value}", 1, "", "", "", regex.compile("(?P<value>.*)"))
+        line_data.value = value
+        line_data_list.append(line_data)
+    print(f"values: {len(values)} average length: {sum(len(x) for x in values) / len(values):.1f}")
+
+    for filter_ in FUSED_FILTERS:
+        separate = SEPARATE_CHECKS[type(filter_).__name__]
+        assert [separate(x.value) for x in line_data_list] == [filter_.run(x) for x in line_data_list], filter_
+
+    def run_separate() -> None:
+        for value in values:
+            for check in SEPARATE_CHECKS.values():
+                check(value)
+
+    def run_fused() -> None:
+        get_value_kernel.cache_clear()
+        for line_data in line_data_list:
+            for filter_ in FUSED_FILTERS:
+                filter_.run(line_data)
+
+    separate_time = min(timeit.repeat(run_separate, number=1, repeat=args.repeat)) / len(values)
+    fused_time = min(timeit.repeat(run_fused, number=1, repeat=args.repeat)) / len(values)
+    print(f"{len(FUSED_FILTERS)} filters per value  separate: {separate_time * 1e6:8.2f}us"
+          f" fused: {fused_time * 1e6:8.2f}us speedup: {separate_time / fused_time:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import math
+import random
+import string
+from unittest import TestCase
+
+import numpy as np
+
+from credsweeper.common.constants import Chars
+from credsweeper.common.entropy import Entropy, BINCOUNT_MIN_VALUES
+from tests import AZ_STRING
+
+
+class TestEntropy(TestCase):
+
+    def test_shannon_entropy_p(self):
+        for data in [AZ_STRING, "9e107d9d372bb6826bd81d3542a419d6", "qrstuvwxyz0123456789+/=", "аbcа"]:
+            for chars in Chars:
+                # the same sum in the same order as count of each character of the alphabet
+                expected = 0.
+                for x in chars.value:
+                    p_x = float(data.count(x)) / len(data)
+                    if p_x > 0:
+                        expected += -p_x * math.log(p_x, 2)
+                self.assertEqual(expected, Entropy.get_shannon_entropy(data, chars.value))
+
+    def test_is_entropy_validate_n(self):
+        self.assertFalse(Entropy.is_entropy_validate(""))
+        Entropy.is_entropy_validate.cache_clear()
+        self.assertFalse(Entropy.is_entropy_validate("efABCDEF"))
+        self.assertFalse(Entropy.is_entropy_validate("efABCDEF"))
+        # the value is evaluated once
+        self.assertEqual(1, Entropy.is_entropy_validate.cache_info().hits)
+
+    def test_count_matrix_p(self):
+        random.seed(42)
+        values = tuple("".join(random.choices(string.printable + "аб", k=random.randint(0, 40)))
+                       for _ in range(BINCOUNT_MIN_VALUES + 3))
+        counts, lengths = Entropy.get_count_matrix(values, Chars.BASE64_CHARS.value)
+        self.assertEqual((len(values), len(Chars.BASE64_CHARS.value)), counts.shape)
+        self.assertListEqual([len(x) for x in values], lengths.tolist())
+        # vectorized count of the batch and histograms of separate values are the same
+        for value, row in zip(values, counts):
+            self.assertListEqual([value.count(x) for x in Chars.BASE64_CHARS.value], row.tolist())
+
+    def test_renyi_entropy_p(self):
+        random.seed(42)
+        values = tuple("".join(random.choices(string.printable, k=random.randint(0, 60))) for _ in range(100))
+        for alpha in [0.0, 0.5, 1.0, 2.0]:
+            for norm in [False, True]:
+                batch = Entropy.get_renyi_entropy(values, Chars.BASE36_CHARS.value, alpha, norm)
+                # a value has the same entropy in a batch and alone
+                single = [Entropy.get_renyi_entropy((x, ), Chars.BASE36_CHARS.value, alpha, norm)[0] for x in values]
+                self.assertListEqual(single, batch.tolist())
+        self.assertListEqual([0.0, 0.0], Entropy.get_renyi_entropy(("", "+/"), Chars.HEX_CHARS.value, 2.0).tolist())
+        self.assertEqual(np.log2(6), Entropy.get_renyi_entropy(("abcdef", ), Chars.HEX_CHARS.value, 0.0)[0])
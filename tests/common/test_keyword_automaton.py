@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from credsweeper.common import static_keyword_checklist
+from credsweeper.common.keyword_automaton import KeywordAutomaton
+
+
+class TestKeywordAutomaton(TestCase):
+
+    def test_find_words_p(self):
+        automaton = KeywordAutomaton(["he", "she", "his", "hers", ""])
+        self.assertSetEqual({"he", "she", "hers"}, automaton.find_words("ushers"))
+        self.assertSetEqual({"his"}, automaton.find_words("this"))
+        # overlapped words with common suffix are found via failure links
+        self.assertSetEqual({"he", "she"}, automaton.find_words("ushe", limit=2))
+        self.assertTrue(automaton.has_any("ahishers"))
+        self.assertEqual(10, automaton.size)
+
+    def test_find_words_n(self):
+        automaton = KeywordAutomaton(["he", "she", "his", "hers"])
+        self.assertSetEqual(set(), automaton.find_words(""))
+        self.assertSetEqual(set(), automaton.find_words("HERS h-e s_h_e"))
+        self.assertFalse(automaton.has_any("xyzhixhs"))
+        self.assertFalse(KeywordAutomaton([]).has_any("any text"))
+
+    def test_checklist_p(self):
+        # the automata give the same results as substring checks of each word
+        checklist = static_keyword_checklist
+        for text in ["", "0123456789", "dummy_password", "myaccesstokenforapi", "Зовнішній ключ", "ixujztcvqq"]:
+            keywords = set(x for x in checklist.keyword_set if x in text)
+            self.assertSetEqual(keywords, checklist.keyword_automaton.find_words(text))
+            morphemes = set(x for x in checklist.morpheme_set if x in text)
+            self.assertSetEqual(morphemes, checklist.morpheme_automaton.find_words(text))
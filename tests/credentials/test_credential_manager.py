@@ -1,3 +1,6 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from credsweeper.app import CredSweeper
@@ -29,3 +32,18 @@ class TestCredentialManager:
         groups = cred_sweeper.credential_manager.group_credentials()
         # Assert that no credentials can be grouped in tested cases
         assert len(groups) == len(detections)
+
+    def test_add_credential_threads_p(self):
+        cred_sweeper = CredSweeper()
+        line = "password = 'Xdj@jcN834b'"
+        detections = cred_sweeper.scanner.scan([AnalysisTarget(line, 1, [line], "", "", "")])
+        assert detections
+        credential_manager = cred_sweeper.credential_manager
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for _ in range(4):
+                executor.submit(lambda: [credential_manager.add_credential(x) for x in detections * 1000])
+        assert 4000 * len(detections) == len(credential_manager.get_credentials())
+        # the manager is pickled without the lock and works after unpickling
+        restored = pickle.loads(pickle.dumps(credential_manager))
+        restored.remove_credential(restored.get_credentials()[0])
+        assert 4000 * len(detections) - 1 == len(restored.get_credentials())
@@ -1,7 +1,9 @@
+import pickle
+
 import pytest
 
 from credsweeper.config import Config
-from credsweeper.credentials import LineData
+from credsweeper.credentials import Candidate, LineData
 from credsweeper.utils import Util
 
 
@@ -96,3 +98,31 @@ class TestLineData:
                              rule.patterns[0])
         assert line_data.value == "ngh679x"
         assert line_data.variable == var_name
+
+    @pytest.mark.parametrize("var_name, rule_name", [("password", "Password")])
+    def test_pickle_p(self, file_path: pytest.fixture, rule: pytest.fixture, var_name: str, rule_name: str,
+                      config: Config) -> None:
+        """Check that slotted objects keep their data after pickling and derived fields are computed on demand"""
+        line_data = LineData(config, f'{var_name} = "ngh679x"', 1, file_path, ".py", "test_info", rule.patterns[0])
+        assert not hasattr(line_data, "__dict__")
+        assert line_data.entropy_validation is False
+        line_data.value = "Vs9PGWJcZCBOsSrNwmbPhxCIyJUbIC5sp2Vj4UeS"
+        assert line_data.entropy_validation is True
+        candidate = Candidate([line_data], rule.patterns, rule.rule_name, rule.severity, config, rule.validations,
+                              rule.use_ml)
+        assert not hasattr(candidate, "__dict__")
+        restored = pickle.loads(pickle.dumps(candidate))
+        assert candidate.to_json() == restored.to_json()
+        assert line_data.to_json() == restored.line_data_list[0].to_json()
+
+    @pytest.mark.parametrize("var_name, rule_name", [("password", "Password")])
+    def test_match_obj_p(self, file_path: pytest.fixture, rule: pytest.fixture, var_name: str, rule_name: str,
+                         config: Config) -> None:
+        """Check that given match object is used instead of the second search of the pattern"""
+        line = f'{var_name} = "ngh679x"; {var_name} = "other"'
+        pattern = rule.patterns[0]
+        match_obj = pattern.search(line, pos=line.index(";"))
+        line_data = LineData(config, line, 1, file_path, ".py", "test_info", pattern, match_obj)
+        assert line_data.value == "other"
+        line_data = LineData(config, line, 1, file_path, ".py", "test_info", pattern)
+        assert line_data.value == "ngh679x"
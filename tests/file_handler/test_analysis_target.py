@@ -0,0 +1,38 @@
+import pytest
+
+from credsweeper.file_handler.analysis_target import AnalysisTarget, FileView
+from credsweeper.file_handler.text_lines import TextLines
+
+
+class TestAnalysisTarget:
+
+    def test_file_view_p(self) -> None:
+        lines = ["first", "  Second = 'Value'  ", ""]
+        file_view = FileView(TextLines('\n'.join(lines)), None, "file.py", ".py", "info")
+        assert 3 == len(file_view)
+        expected = [AnalysisTarget(line, i + 1, lines, "file.py", ".py", "info") for i, line in enumerate(lines)]
+        assert expected == file_view
+        assert expected == list(file_view)
+        assert expected[1:] == file_view[1:]
+        target = file_view[-2]
+        assert "  Second = 'Value'  " == target.line
+        assert 2 == target.line_num
+        assert "Second = 'Value'" == target.line_strip
+        assert "second = 'value'" == target.line_lower_strip
+        assert ("file.py", ".py", "info") == (target.file_path, target.file_type, target.info)
+
+    def test_file_view_line_nums_p(self) -> None:
+        file_view = FileView(["a", "b"], [42, 7], "", "", "")
+        assert [42, 7] == [x.line_num for x in file_view]
+        assert 7 == file_view[1].line_num
+        assert file_view[0].lines is file_view[1].lines
+
+    def test_file_view_n(self) -> None:
+        file_view = FileView(["a", "b"], None, "", "", "")
+        assert file_view != []
+        assert file_view != [AnalysisTarget("a", 1, ["a", "b"], "", "", "")]
+        assert file_view[0] != AnalysisTarget("a", 1, ["a", "b"], "", ".txt", "")
+        with pytest.raises(IndexError):
+            _ = file_view[2]
+        with pytest.raises(IndexError):
+            _ = file_view[-3]
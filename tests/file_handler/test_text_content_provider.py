@@ -58,3 +58,18 @@ class TestTextContentProvider:
 
             target = analysis_targets[0]
             assert target == expected_target
+
+    def test_get_text_p(self) -> None:
+        target_path = SAMPLES_PATH / "password.gradle"
+        content_provider = TextContentProvider(target_path)
+        assert 'password = "cackle!"\n' == content_provider.get_text()
+        assert ['password = "cackle!"', ''] == content_provider.lines
+
+    def test_get_text_n(self) -> None:
+        # xml data are converted to lines
+        assert TextContentProvider(SAMPLES_PATH / "xml_password.xml").get_text() is None
+        # undecodable data
+        content_provider = TextContentProvider(SAMPLES_PATH / "password.gradle")
+        content_provider.data = b"\x00\x00\xff" * 64
+        assert content_provider.get_text() is None
+        assert [] == content_provider.lines
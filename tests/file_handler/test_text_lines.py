@@ -0,0 +1,40 @@
+import pytest
+
+from credsweeper.file_handler.text_lines import TextLines
+
+
+class TestTextLines:
+
+    @pytest.mark.parametrize("text", ["", "\n", "a", "a\nb", "a\n\nb\n", "пароль = 'Ключ'\n\nkey = 'значение'"])
+    def test_text_lines_p(self, text: str) -> None:
+        lines = text.split('\n')
+        text_lines = TextLines(text)
+        assert len(lines) == len(text_lines)
+        assert lines == list(text_lines)
+        assert lines[1:] == text_lines[1:]
+        assert lines[:-1] == text_lines[:-1]
+        assert lines[::2] == text_lines[::2]
+        assert lines == text_lines
+        assert lines[-1] == text_lines[-1]
+        for i, line in enumerate(lines):
+            start = text_lines.get_line_start(i)
+            assert i == text_lines.get_line_index(start)
+            assert line == text[start:text_lines.get_line_end(i)]
+
+    def test_text_lines_n(self) -> None:
+        text_lines = TextLines("a\nb")
+        with pytest.raises(IndexError):
+            _ = text_lines[2]
+        with pytest.raises(IndexError):
+            _ = text_lines[-3]
+
+    def test_get_oversize_lines_p(self) -> None:
+        text_lines = TextLines("abc\n\nabcd\nab")
+        assert [2] == text_lines.get_oversize_lines(3)
+        assert [0, 2] == text_lines.get_oversize_lines(2)
+        assert [] == text_lines.get_oversize_lines(4)
+
+    def test_text_lines_chunks_p(self, monkeypatch) -> None:
+        monkeypatch.setattr(TextLines, "CHUNK_SIZE", 3)
+        text = "ab\ncd\nя\n\nxyz\n"
+        assert text.split('\n') == list(TextLines(text))
@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+from credsweeper.filters import ValueLengthCheck, ValuePatternCheck
+from credsweeper.filters.filter import FilterCacheInfo
+from tests.filters.conftest import LINE_VALUE_PATTERN
+from tests.test_utils.dummy_line_data import get_line_data
+
+
+class TestFilter:
+
+    def test_check_cache_p(self, file_path: str, monkeypatch) -> None:
+        monkeypatch.setattr(ValuePatternCheck, "CACHE_SIZE", 2)
+        value_pattern_check = ValuePatternCheck()
+        lines = ["AAAAAAA123", "Crackle4421", "AAAAAAA123", "Crackle4421", "Crackle123", "AAAAAAA123"]
+        line_data_list = [get_line_data(file_path=file_path, line=x, pattern=LINE_VALUE_PATTERN) for x in lines]
+        with patch.object(ValuePatternCheck,
+                          ValuePatternCheck.run.__name__,
+                          autospec=True,
+                          side_effect=ValuePatternCheck.run) as mock_run:
+            verdicts = [value_pattern_check.check(x) for x in line_data_list]
+        assert [value_pattern_check.run(x) for x in line_data_list] == verdicts
+        # the oldest value is evicted when a new value is added to full cache
+        assert 4 == mock_run.call_count
+        assert FilterCacheInfo(hits=2, misses=4, maxsize=2, currsize=2) == value_pattern_check.cache_info()
+        value_pattern_check.cache_clear()
+        assert FilterCacheInfo(hits=0, misses=0, maxsize=2, currsize=0) == value_pattern_check.cache_info()
+
+    def test_check_cache_n(self, file_path: str) -> None:
+        # a filter without cache key is run each time
+        value_length_check = ValueLengthCheck(5)
+        line_data = get_line_data(file_path=file_path, line="Crackle4421", pattern=LINE_VALUE_PATTERN)
+        assert not value_length_check.check(line_data)
+        assert not value_length_check.check(line_data)
+        assert FilterCacheInfo(hits=0, misses=0, maxsize=ValueLengthCheck.CACHE_SIZE,
+                               currsize=0) == value_length_check.cache_info()
@@ -0,0 +1,57 @@
+from credsweeper.filters import ValueLengthCheck, ValuePatternCheck, ValueTokenCheck
+from credsweeper.filters.filter_planner import FilterPlanner
+from tests.filters.conftest import LINE_VALUE_PATTERN
+from tests.test_utils.dummy_line_data import get_line_data
+
+
+class TestFilterPlanner:
+
+    def test_plan_p(self, file_path: str) -> None:
+        chain = [ValueTokenCheck(), ValuePatternCheck(), ValueLengthCheck(8)]
+        expected = list(chain)
+        planner = FilterPlanner()
+        # no statistics - the order is kept
+        planner.plan(chain)
+        assert expected == chain
+        for line in ["AAAAAAA123", "Crackle", "Crackle4421", "BBBBBBB123", "12345678"]:
+            line_data = get_line_data(file_path=file_path, line=line, pattern=LINE_VALUE_PATTERN)
+            for filter_ in chain:
+                if filter_.check(line_data):
+                    break
+        # ValueTokenCheck never rejects the values, so it is the last
+        planner.plan(chain)
+        assert ValueTokenCheck is type(chain[-1])
+
+    def test_plan_profile_p(self) -> None:
+        chain = [ValueTokenCheck(), ValuePatternCheck(), ValueLengthCheck(8)]
+        profile = {
+            "ValueTokenCheck": {
+                "calls": 100,
+                "rejections": 1,
+                "elapsed": 0.01
+            },
+            "ValuePatternCheck": {
+                "calls": 100,
+                "rejections": 50,
+                "elapsed": 0.01
+            },
+            "ValueLengthCheck": {
+                "calls": 100,
+                "rejections": 50,
+                "elapsed": 0.001
+            },
+        }
+        planner = FilterPlanner(profile)
+        planner.update([chain])
+        assert [ValueLengthCheck, ValuePatternCheck, ValueTokenCheck] == [type(x) for x in chain]
+
+    def test_update_n(self) -> None:
+        chain = [ValueTokenCheck(), ValueLengthCheck(8)]
+        planner = FilterPlanner({"ValueTokenCheck": {"calls": 10, "rejections": 0, "elapsed": 1.0}})
+        planner.update([])
+        # the chains are reordered on each PLAN_INTERVAL update only
+        for _ in range(FilterPlanner.PLAN_INTERVAL - 1):
+            planner.update([chain])
+        assert ValueTokenCheck is type(chain[0])
+        planner.update([chain])
+        assert ValueLengthCheck is type(chain[0])
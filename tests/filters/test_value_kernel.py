@@ -0,0 +1,67 @@
+import random
+from typing import List
+
+import pytest
+from regex import regex
+
+from credsweeper.filters.value_kernel import get_sequence_steps, get_value_kernel
+from credsweeper.utils import Util
+
+# characters of all predicates, sequences and a few non-ASCII ones
+ALPHABET = "aAbBcCdDnNuUzZ0123:/\\_%#=<>{}[]();,`!$&*+ '\"\t\n\x00\x7f\x80\u0430\u0431\u0432"
+
+
+def get_random_values(count: int, seed: int) -> List[str]:
+    random.seed(seed)
+    return ["".join(random.choices(ALPHABET, k=random.randint(1, 24))) for _ in range(count)]
+
+
+class TestValueKernel:
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_value_kernel_regex_p(self, seed: int) -> None:
+        # predicates are the same as the separate regular expressions which were used before
+        first_word = regex.compile(
+            "^" + Util.get_regex_combine_or([
+                "\\=", "\\{", "\\)", "\\<", "\\>", "\\#", "\\:", "\\\\", "\\/\\/", "\\_", "\\\\[u]", "\\/\\*",
+                "\\%[deflspuvxz]"
+            ]), regex.IGNORECASE)
+        last_colon = regex.compile(".*:$", regex.IGNORECASE)
+        camel_case = regex.compile(
+            Util.get_regex_combine_or(["^([a-z]+([A-Z][a-z]+)+)$", "^([A-Z][a-z]+([A-Z][a-z]+)+)$"]))
+        array_dictionary = regex.compile("\\[('|\")?.+('|\")?\\]")
+        method = regex.compile(".*\\(.*\\).*")
+        not_allowed = regex.compile(
+            Util.get_regex_combine_or(["[,<>{};\\]\\[](\\s)*", "(\\s)+[\\\\]", "(\\\\n)(\\s)*"]) + "$",
+            regex.IGNORECASE)
+        split = regex.compile(" |;|\\)|\\(|{|}|<|>|\\[|\\]|`")
+        for value in get_random_values(5000, seed):
+            value_kernel = get_value_kernel(value)
+            assert bool(first_word.match(value)) == value_kernel.first_word, value
+            assert bool(last_colon.search(value)) == value_kernel.last_colon, value
+            assert bool(camel_case.match(value)) == value_kernel.camel_case, value
+            assert bool(array_dictionary.search(value)) == value_kernel.array_dictionary, value
+            assert ("function" in value or bool(method.search(value))) == value_kernel.method, value
+            assert bool(not_allowed.search(value)) == value_kernel.not_allowed, value
+            tokens = split.split(value, maxsplit=1)
+            assert (len(tokens[0]) if 2 == len(tokens) else -1) == value_kernel.token_separator, value
+            assert ('/' in value) == value_kernel.unix_separator, value
+            assert (':\\' in value) == value_kernel.windows_separator, value
+            assert any(x in value for x in " !$`&*()+") == value_kernel.special_character, value
+
+    @pytest.mark.parametrize("seed", [3, 4])
+    def test_value_kernel_sequence_p(self, seed: int) -> None:
+        equal = regex.compile("(.)\\1{2,}")
+        for value in get_random_values(5000, seed) + ["abcd", "DCBA", "a\n\n\nb", "\u0430\u0431\u0432"]:
+            equal_steps, ascending_steps, descending_steps = get_sequence_steps(value)
+            assert bool(equal.search(value)) == (b"\x00\x00" in equal_steps), value
+            codes = [ord(x) for x in value]
+            for steps, step in ((ascending_steps, 1), (descending_steps, -1)):
+                expected = any(codes[i + 1] - codes[i] == step and codes[i + 2] - codes[i + 1] == step
+                               for i in range(len(codes) - 2))
+                assert expected == (b"\x00\x00" in steps), value
+
+    def test_value_kernel_short_n(self) -> None:
+        assert (b"", b"", b"") == get_sequence_steps("")
+        assert (b"", b"", b"") == get_sequence_steps("x")
+        assert -1 == get_value_kernel("x").token_separator
@@ -0,0 +1,47 @@
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import pytest
+
+from credsweeper.app import APP_PATH, CredSweeper
+from credsweeper.credentials import Candidate, CredentialManager
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.utils import Util
+from tests import SAMPLES_PATH
+
+
+@pytest.fixture(scope="session")
+def samples_candidates() -> List[Candidate]:
+    """All candidates of the samples without ML validation, the samples are scanned once for the session"""
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    cred_sweeper.scan(TextProvider([SAMPLES_PATH]).get_scannable_files(cred_sweeper.config))
+    return cred_sweeper.credential_manager.get_credentials()
+
+
+@pytest.fixture(scope="session")
+def samples_groups(samples_candidates: List[Candidate]) -> List[Tuple[str, List[Candidate]]]:
+    """Groups of the candidates of the samples by CandidateKey"""
+    credential_manager = CredentialManager()
+    credential_manager.set_credentials(samples_candidates)
+    return [(key.value, group) for key, group in credential_manager.group_credentials().items()]
+
+
+@pytest.fixture(scope="session")
+def samples_ml_groups(samples_groups: List[Tuple[str, List[Candidate]]]) -> List[Tuple[str, List[Candidate]]]:
+    """Groups of the samples which are validated with ML model in a scan"""
+    return [x for x in samples_groups if all(y.use_ml for y in x[1])]
+
+
+@pytest.fixture(scope="session")
+def quantized_model() -> Iterator[Path]:
+    """The quantized model is not shipped, so it is generated for the session if it is absent"""
+    pytest.importorskip("onnxruntime.quantization")
+    from experiment import quantize
+    ml_model_dir = APP_PATH / "ml_model"
+    model_path = ml_model_dir / Util.json_load(ml_model_dir / "model_config.json")["quantized_model_file"]
+    if model_path.exists():
+        yield model_path
+        return
+    quantize.main(str(ml_model_dir / "ml_model.onnx"), str(model_path), ["LSTM"])
+    yield model_path
+    model_path.unlink()
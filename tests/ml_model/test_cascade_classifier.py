@@ -0,0 +1,56 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from credsweeper import ThresholdPreset
+from credsweeper.ml_model import MlValidator
+from credsweeper.ml_model.cascade_classifier import CascadeClassifier, CascadeInfo
+
+
+def test_cascade_classifier_p():
+    cascade = CascadeClassifier.from_config({"coef": [2.0, -1.0], "intercept": 0.0, "band": [0.0, 1.0]}, (0.3, 0.7))
+    probability = cascade.predict(np.array([[0, 0], [1, 0], [0, 1], [0, 0]], dtype=np.float32))
+    assert np.allclose([0.5, 0.880797, 0.268941, 0.5], probability)
+    assert [True, False, False, True] == cascade.get_uncertain(probability).tolist()
+    assert CascadeInfo(2, 2, 0.3, 0.7) == cascade.cascade_info()
+
+
+def test_cascade_classifier_n():
+    with pytest.raises(ValueError):
+        CascadeClassifier([1.0], 0.0, (0.7, 0.3))
+    with pytest.raises(ValueError):
+        CascadeClassifier([1.0], 0.0, (-0.1, 0.3))
+
+
+def test_ml_cascade_p(samples_groups):
+    group_list = samples_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+    # the whole band requires the model for all groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium, cascade=True, cascade_band=(0.0, 1.0))
+    is_cred, probability = ml_validator.validate_groups(group_list, 16)
+    assert np.array_equal(expected_probability, probability)
+    assert CascadeInfo(0, len(group_list), 0.0, 1.0) == ml_validator.cascade.cascade_info()
+    assert np.array_equal(expected_is_cred, is_cred)
+    # the band of model config resolves groups with the regression and the model scores only uncertain ones
+    with patch("logging.Logger.warning") as mocked_logger:
+        ml_validator = MlValidator(threshold=ThresholdPreset.medium, cascade=True)
+        mocked_logger.assert_called_with(
+            "ML cascade classifier is experimental, its decisions may differ from ML model")
+    cascade = ml_validator.cascade
+    regression_probability = cascade.predict(ml_validator.extract_features(group_list))
+    resolved = (regression_probability < cascade.lower) | (cascade.upper < regression_probability)
+    _, probability = ml_validator.validate_groups(group_list, 16)
+    assert 0 < np.count_nonzero(resolved) < len(group_list)
+    assert np.allclose(regression_probability[resolved], probability[resolved])
+    assert not np.any((cascade.lower <= probability[resolved]) & (probability[resolved] <= cascade.upper))
+    assert np.allclose(expected_probability[~resolved], probability[~resolved])
+    assert CascadeInfo(int(np.count_nonzero(resolved)), int(np.count_nonzero(~resolved)), cascade.lower,
+                       cascade.upper) == cascade.cascade_info()
+    # the empty band decides all groups without the model
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium, cascade=True, cascade_band=(0.5, 0.5))
+    ml_validator.model_session = None
+    _, probability = ml_validator.validate_groups(group_list, 16)
+    assert len(group_list) == ml_validator.cascade.cascade_info().resolved
+    assert np.allclose(ml_validator.cascade.predict(ml_validator.extract_features(group_list)), probability)
@@ -126,3 +126,19 @@ def test_is_secret_numeric_n():
                   pattern=Util.get_keyword_pattern("password"))
     ld.value = 'dummy'
     assert not test.extract(Candidate([ld], [], "rule", Severity.MEDIUM, [], True))
+
+
+def test_word_in_line_automaton_p():
+    words = [f"word{i:03}" for i in range(WordInLine.AUTOMATON_MIN_WORDS)]
+    ld = LineData(config=None,
+                  line="the_WORD127 = secret",
+                  line_num=1,
+                  path="path",
+                  file_type="type",
+                  info="info",
+                  pattern=Util.get_keyword_pattern("password"))
+    candidate = Candidate([ld], [], "rule", Severity.MEDIUM, [], True)
+    assert WordInLine(words).extract(candidate)
+    # the longer word is not found with the automaton as well as with substring checks of fewer words
+    assert not WordInLine(words[:-1] + ["word1270"]).extract(candidate)
+    assert not WordInLine(words[:-1]).extract(candidate)
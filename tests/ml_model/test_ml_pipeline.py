@@ -0,0 +1,77 @@
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from credsweeper import ThresholdPreset
+from credsweeper.ml_model import MlPipeline, MlValidator
+
+
+def test_ml_pipeline_p(samples_candidates, samples_ml_groups):
+    candidates = samples_candidates
+    group_list = samples_ml_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+
+    ml_pipeline = MlPipeline(ml_validator, 5)
+    # candidates of a group come in separate parts, so the group is predicted again on join
+    group = next(x[1] for x in group_list if 1 < len(x[1]))
+    split = next(i for i, x in enumerate(candidates) if x is group[1])
+    ml_pipeline.put(candidates[:split])
+    ml_pipeline.put(candidates[split:])
+    ml_pipeline.join()
+    # all groups were predicted in the worker
+    with patch.object(ml_validator, "validate_groups", side_effect=AssertionError):
+        is_cred, probability = ml_pipeline.validate_groups(group_list, 16)
+    assert np.array_equal(expected_is_cred, is_cred)
+    assert np.array_equal(expected_probability, probability)
+
+
+def test_ml_pipeline_n(samples_groups):
+    group_list = samples_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    ml_pipeline = MlPipeline(ml_validator, 16)
+    ml_pipeline.join()
+    # nothing was predicted during the scan - all groups are validated now
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+    is_cred, probability = ml_pipeline.validate_groups(group_list, 16)
+    assert np.array_equal(expected_is_cred, is_cred)
+    assert np.array_equal(expected_probability, probability)
+
+
+def test_ml_pipeline_tune_p(samples_candidates, samples_ml_groups):
+    group_list = samples_ml_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+    ml_validator.TUNE_GROUPS = len(group_list) // 2
+    # the batch size is chosen on first groups during the scan
+    ml_pipeline = MlPipeline(ml_validator, None)
+    ml_pipeline.put(samples_candidates)
+    assert ml_pipeline.batch_size in ml_validator.TUNE_BATCH_SIZES
+    ml_pipeline.join()
+    with patch.object(ml_validator, "validate_groups", side_effect=AssertionError):
+        is_cred, probability = ml_pipeline.validate_groups(group_list, None)
+    assert np.array_equal(expected_is_cred, is_cred)
+    assert np.array_equal(expected_probability, probability)
+
+
+def test_ml_pipeline_error_n(samples_candidates):
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    failed = threading.Event()
+
+    def predict(*_):
+        failed.set()
+        raise RuntimeError("model failed")
+
+    with patch.object(ml_validator, "predict", side_effect=predict):
+        ml_pipeline = MlPipeline(ml_validator, 1)
+        # the scan is stopped with the error of the worker: batches of the file overfill the queue or next file comes
+        with pytest.raises(RuntimeError):
+            ml_pipeline.put(samples_candidates)
+            assert failed.wait(10)
+            for _ in range(1000):
+                ml_pipeline.put([])
+                time.sleep(0.01)
+        assert failed.is_set()
@@ -1,9 +1,18 @@
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+import onnxruntime as ort
+import pytest
+from sklearn.preprocessing import LabelBinarizer
+
 from credsweeper import ThresholdPreset
-from credsweeper.app import APP_PATH
+from credsweeper.app import APP_PATH, CredSweeper
 
 from credsweeper.config import Config
 from credsweeper.credentials import Candidate
 from credsweeper.ml_model import MlValidator
+from credsweeper.ml_model.features import FileExtension, RuleName
 from credsweeper.utils import Util
 
 
@@ -47,3 +56,117 @@ def test_ml_validator_simple_p():
     decision, probability = ml_validator.validate(candidate)
     assert 0.919577 < probability < 0.919578
     assert decision
+
+
+def test_encode_batch_p():
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    values = ["", "  Jhd2gH5634  ", "\u0436\u0438\u0437\u043d\u044c \t+/=", "x" * 2 * ml_validator.maxlen, "\ud800"]
+    batch = ml_validator.encode_batch(values)
+    assert np.float32 == batch.dtype
+    assert (len(values), ml_validator.maxlen, ml_validator.num_classes) == batch.shape
+    for value, line_input in zip(values, batch):
+        assert np.array_equal(ml_validator.encode(value, ml_validator.char_to_index), line_input)
+
+
+def get_group_features_by_candidate(ml_validator: MlValidator, candidates: List[Candidate]) -> np.ndarray:
+    """Features of a group which are computed for each candidate with appending to arrays and a fitted binarizer"""
+
+    def get_feature(feature, candidate: Candidate) -> np.ndarray:
+        if isinstance(feature, (FileExtension, RuleName)):
+            enc = LabelBinarizer()
+            enc.fit(feature.extensions if isinstance(feature, FileExtension) else feature.rule_names)
+            label = candidate.line_data_list[0].file_type if isinstance(feature, FileExtension) else candidate.rule_name
+            return enc.transform([label])[0]
+        return np.array([feature([candidate])[0]]).flatten()
+
+    common_features = np.array([], dtype=float)
+    for feature in ml_validator.common_feature_list:
+        common_features = np.append(common_features, get_feature(feature, candidates[0]))
+    unique_features = np.array([], dtype=bool)
+    for feature in ml_validator.unique_feature_list:
+        unique_features = np.append(unique_features, get_feature(feature, candidates[0]))
+    for candidate in candidates[1:]:
+        for feature in ml_validator.unique_feature_list:
+            unique_features = unique_features | get_feature(feature, candidate)
+    return np.hstack([common_features, unique_features]).astype(np.float32)
+
+
+def test_extract_features_p(samples_groups):
+    group_list = samples_groups
+    # some values are found by several rules
+    assert any(1 < len(x[1]) for x in group_list)
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    feature_array = ml_validator.extract_features(group_list)
+    assert np.float32 == feature_array.dtype
+    assert len(group_list) == feature_array.shape[0]
+    # columns of the whole batch are the same as features of each group
+    for (_, candidates), features in zip(group_list, feature_array):
+        assert np.array_equal(get_group_features_by_candidate(ml_validator, candidates), features)
+
+
+def test_session_options_p():
+    options = {
+        "intra_op_num_threads": 2,
+        "graph_optimization_level": "ORT_ENABLE_BASIC",
+        "execution_mode": ort.ExecutionMode.ORT_PARALLEL
+    }
+    session_options = MlValidator.get_session_options(options)
+    assert 2 == session_options.intra_op_num_threads
+    assert ort.GraphOptimizationLevel.ORT_ENABLE_BASIC == session_options.graph_optimization_level
+    assert ort.ExecutionMode.ORT_PARALLEL == session_options.execution_mode
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium, session_options=options)
+    assert 2 == ml_validator.model_session.get_session_options().intra_op_num_threads
+    # the options do not change the prediction
+    candidate = Candidate.get_dummy_candidate(CredSweeper().config, "test.py", ".py", "test_info")
+    candidate.line_data_list[0].line = '"geheimnis" : "Jhd2gH5634"'
+    candidate.line_data_list[0].variable = "geheimnis"
+    candidate.line_data_list[0].value = "Jhd2gH5634"
+    decision, probability = ml_validator.validate(candidate)
+    assert 0.919577 < probability < 0.919578
+    assert decision
+
+
+def test_session_options_n():
+    with pytest.raises(ValueError):
+        MlValidator.get_session_options({"dummy_threads": 2})
+    with pytest.raises(ValueError):
+        MlValidator.get_session_options({"execution_mode": "ORT_DUMMY"})
+
+
+def test_tune_batch_size_p(samples_groups):
+    group_list = samples_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+    # too few groups to compare batch sizes
+    assert ml_validator.TUNE_GROUPS > len(group_list)
+    assert ml_validator.DEFAULT_BATCH_SIZE == ml_validator.get_batch_size(group_list)
+    assert ml_validator.tuned_batch_size is None
+    ml_validator.TUNE_GROUPS = len(group_list) // 2
+    is_cred, probability = ml_validator.validate_groups(group_list, None)
+    assert ml_validator.tuned_batch_size in ml_validator.TUNE_BATCH_SIZES
+    assert np.array_equal(expected_is_cred, is_cred)
+    assert np.array_equal(expected_probability, probability)
+
+
+def test_quantized_p(samples_groups, quantized_model):
+    group_list = samples_groups
+    ml_validator = MlValidator(threshold=ThresholdPreset.medium)
+    quantized_validator = MlValidator(threshold=ThresholdPreset.medium, quantized=True)
+    assert ml_validator.model_session._model_path != quantized_validator.model_session._model_path
+    expected_is_cred, expected_probability = ml_validator.validate_groups(group_list, 16)
+    is_cred, probability = quantized_validator.validate_groups(group_list, 16)
+    assert str(quantized_model) == quantized_validator.model_session._model_path
+    # int8 weights change probabilities, the model is lossy, so decisions near the threshold may change
+    assert not np.array_equal(expected_probability, probability)
+    assert np.allclose(expected_probability, probability, atol=0.05)
+    # the probabilities depend on other inputs of the batch, so they are not cached
+    assert MlValidator(threshold=ThresholdPreset.medium, cache_path=":memory:", quantized=True).prediction_cache is None
+
+
+def test_quantized_n():
+    model_config = Util.json_load(APP_PATH / "ml_model" / "model_config.json")
+    model_config["quantized_model_file"] = "not_existed_model.onnx"
+    # the quantized model is not shipped and has to be generated
+    with patch.object(Util, "json_load", return_value=model_config):
+        with pytest.raises(ValueError):
+            MlValidator(threshold=ThresholdPreset.medium, quantized=True)
@@ -0,0 +1,63 @@
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from credsweeper.app import CredSweeper
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.ml_model.prediction_cache import PredictionCache, PredictionCacheInfo
+from tests import SAMPLES_PATH
+
+
+def test_prediction_cache_p():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "ml_cache.sqlite"
+        line_input = np.zeros((3, 4, 5), dtype=np.float32)
+        line_input[:, :, 0] = 1
+        line_input[1, 0] = [0, 0, 1, 0, 0]
+        feature_input = np.array([[0, 1], [0, 1], [0.5, 1]], dtype=np.float32)
+        cache = PredictionCache(path, b"model", 2)
+        keys = cache.get_keys(line_input, feature_input)
+        assert 3 == len(set(keys))
+        assert [None, None, None] == cache.get(keys)
+        cache.put(keys[:2], [0.25, 0.75])
+        assert [0.25, 0.75, None] == cache.get(keys)
+        assert PredictionCacheInfo(2, 4, 0, 2, 2) == cache.cache_info()
+        cache.close()
+        # the file is opened again after close
+        assert [0.25, 0.75, None] == cache.get(keys)
+        cache.close()
+        # predictions of the file are used by next run, the oldest are evicted
+        cache = PredictionCache(path, b"model", 2)
+        assert [0.75] == cache.get(keys[1:2])
+        cache.put(keys[2:], [0.5])
+        assert PredictionCacheInfo(1, 0, 1, 2, 2) == cache.cache_info()
+        assert [None, 0.75, 0.5] == cache.get(keys)
+        cache.close()
+        # keys depend on the model
+        cache = PredictionCache(path, b"other", 2)
+        assert not set(keys) & set(cache.get_keys(line_input, feature_input))
+        cache.close()
+
+
+def test_ml_cache_p():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "ml_cache.sqlite"
+        cred_sweeper = CredSweeper(json_filename=Path(tmp_dir) / "a.json", ml_batch_size=16)
+        cred_sweeper.run(content_provider=TextProvider([SAMPLES_PATH]))
+        expected = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        cred_sweeper = CredSweeper(json_filename=Path(tmp_dir) / "b.json", ml_batch_size=16, ml_cache=path)
+        cred_sweeper.run(content_provider=TextProvider([SAMPLES_PATH]))
+        info = cred_sweeper.ml_validator.prediction_cache.cache_info()
+        # some groups of the samples have the same inputs of the model, so they are predicted once
+        assert 0 < info.currsize <= info.misses
+        assert expected == [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        # next run takes all predictions from the file with any batch size
+        cred_sweeper = CredSweeper(json_filename=Path(tmp_dir) / "c.json", ml_batch_size=5, ml_cache=path)
+        cred_sweeper.run(content_provider=TextProvider([SAMPLES_PATH]))
+        assert PredictionCacheInfo(info.hits + info.misses, 0, 0, PredictionCache.DEFAULT_SIZE, info.currsize) \
+               == cred_sweeper.ml_validator.prediction_cache.cache_info()
+        assert expected == [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        # the file is closed after the run, so the next run of the instance opens it again
+        cred_sweeper.run(content_provider=TextProvider([SAMPLES_PATH]))
+        assert 2 * (info.hits + info.misses) == cred_sweeper.ml_validator.prediction_cache.cache_info().hits
@@ -209,15 +209,29 @@ class TestApp(TestCase):
                    " [--find-by-ext]" \
                    " [--depth POSITIVE_INT]" \
                    " [--doc]" \
+                   " [--buffer_scan]" \
                    " [--ml_threshold FLOAT_OR_STR]" \
-                   " [--ml_batch_size POSITIVE_INT]" \
+                   " [--ml_batch_size POSITIVE_INT_OR_AUTO]" \
+                   " [--ml_threads POSITIVE_INT]" \
+                   " [--ml_inter_threads POSITIVE_INT]" \
+                   " [--ml_optimization LEVEL]" \
+                   " [--ml_parallel]" \
+                   " [--ml_quantized]" \
+                   " [--ml_cascade]" \
+                   " [--ml_cascade_band LOWER UPPER]" \
+                   " [--ml_pipeline]" \
+                   " [--ml_cache [PATH]]" \
+                   " [--ml_cache_size POSITIVE_INT]" \
                    " [--api_validation]" \
                    " [--jobs POSITIVE_INT]" \
                    " [--skip_ignored]" \
                    " [--save-json [PATH]]" \
                    " [--save-xlsx [PATH]]" \
+                   " [--filter-stats [PATH]]" \
+                   " [--filter-profile PATH]" \
                    " [--log LOG_LEVEL]" \
                    " [--size_limit SIZE_LIMIT]" \
+                   " [--chunk_size SIZE]" \
                    " [--banner] " \
                    " [--version] " \
                    "python -m credsweeper: error: one of the arguments" \
@@ -499,6 +513,28 @@ class TestApp(TestCase):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def test_filter_stats_p(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_filename = os.path.join(tmp_dir, f"{__name__}.json")
+            stats_filename = os.path.join(tmp_dir, "filter_stats.json")
+            _stdout, _stderr = self._m_credsweeper([
+                "--log", "silence", "--ml_threshold", "0", "--path",
+                str(SAMPLES_PATH), "--save-json", json_filename, "--filter-stats", stats_filename
+            ])
+            report = Util.json_load(json_filename)
+            stats = Util.json_load(stats_filename)
+            self.assertLess(0, stats["filters"]["ValuePatternCheck"]["calls"])
+            self.assertLess(0, sum(x["rejections"] for x in stats["filters"].values()))
+            self.assertTrue(any("Password" in x["rules"] for x in stats["chains"]))
+            # the filters are ordered with the profile at start and the result is the same
+            _stdout, _stderr = self._m_credsweeper([
+                "--log", "silence", "--ml_threshold", "0", "--path",
+                str(SAMPLES_PATH), "--save-json", json_filename, "--filter-profile", stats_filename
+            ])
+            self.assertListEqual(report, Util.json_load(json_filename))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def test_denylist_value_p(self) -> None:
         target_path = str(SAMPLES_PATH / "password.gradle")
         with tempfile.TemporaryDirectory() as tmp_dir:
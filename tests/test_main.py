@@ -278,6 +278,31 @@ class TestMain(unittest.TestCase):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def test_positive_int_or_auto_p(self):
+        self.assertIsNone(app_main.positive_int_or_auto("Auto"))
+        self.assertEqual(32, app_main.positive_int_or_auto("32"))
+        with pytest.raises(ArgumentTypeError):
+            app_main.positive_int_or_auto("0")
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_positive_size_p(self):
+        self.assertEqual(1000, app_main.positive_size("1000"))
+        self.assertEqual(64 << 20, app_main.positive_size("64MiB"))
+        with pytest.raises(ArgumentTypeError):
+            app_main.positive_size("0")
+        with pytest.raises(ArgumentTypeError):
+            app_main.positive_size("big")
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_ml_optimization_level_p(self):
+        self.assertEqual("ORT_ENABLE_BASIC", app_main.ml_optimization_level("Basic"))
+        with pytest.raises(ArgumentTypeError):
+            app_main.ml_optimization_level("ORT_ENABLE_BASIC")
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def test_threshold_or_float_p(self):
         f = random.random()
         self.assertEqual(app_main.threshold_or_float(str(f)), f)
@@ -394,6 +419,50 @@ class TestMain(unittest.TestCase):
 
     # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
+    def test_ml_pipeline_p(self) -> None:
+        # ML validation during the scan gives the same result as after the scan
+        content_provider: FilesProvider = TextProvider([SAMPLES_PATH])
+        cred_sweeper = CredSweeper()
+        cred_sweeper.run(content_provider=content_provider)
+        expected = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        self.assertEqual(SAMPLES_POST_CRED_COUNT, len(expected))
+        for pool_count in [1, 3]:
+            cred_sweeper = CredSweeper(pool_count=pool_count, ml_pipeline=True)
+            cred_sweeper.run(content_provider=content_provider)
+            self.assertListEqual(expected, [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()])
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_ml_pipeline_quantized_n(self) -> None:
+        # probabilities of the quantized model depend on the batch, so the pipeline would not match ML validation
+        cred_sweeper = CredSweeper(ml_quantized=True, ml_pipeline=True)
+        with patch('logging.Logger.warning') as mocked_logger:
+            cred_sweeper.scan([])
+            mocked_logger.assert_called_with("ML pipeline is not used with the quantized model")
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_ml_cascade_p(self) -> None:
+        # weights of the experimental cascade classifier are distilled from the samples, so decisions on them are kept
+        content_provider: FilesProvider = TextProvider([SAMPLES_PATH])
+        for ml_pipeline in [False, True]:
+            cred_sweeper = CredSweeper(ml_cascade=True, ml_pipeline=ml_pipeline)
+            cred_sweeper.run(content_provider=content_provider)
+            self.assertEqual(SAMPLES_POST_CRED_COUNT, len(cred_sweeper.credential_manager.get_credentials()))
+            self.assertLess(0, cred_sweeper.ml_validator.cascade.cascade_info().resolved)
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
+    def test_buffer_scan_p(self) -> None:
+        # whole text scanning gives the same result
+        content_provider: FilesProvider = TextProvider([SAMPLES_PATH])
+        cred_sweeper = CredSweeper(buffer_scan=True)
+        cred_sweeper.scanner.MIN_TEXT_SCAN_SIZE = 0
+        cred_sweeper.run(content_provider=content_provider)
+        self.assertEqual(SAMPLES_POST_CRED_COUNT, len(cred_sweeper.credential_manager.get_credentials()))
+
+    # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
+
     def test_find_by_ext_p(self) -> None:
         # test for finding files by extension
         content_provider: FilesProvider = TextProvider([SAMPLES_PATH])
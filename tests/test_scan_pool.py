@@ -0,0 +1,192 @@
+import io
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from credsweeper.app import CredSweeper
+from credsweeper.common.constants import DiffRowType
+from credsweeper.file_handler.diff_content_provider import DiffContentProvider
+from credsweeper.file_handler.text_content_provider import TextContentProvider
+from credsweeper.file_handler.text_provider import TextProvider
+from credsweeper.scan_pool import FILE_COST, CONTAINER_COST_FACTOR, ScanPool, decode_candidates, encode_candidates, \
+    estimate_cost, get_chunks, get_rule_table, scan_chunk, split_file, split_text
+from tests import SAMPLES_PATH
+
+
+def test_scan_pool_p():
+    content_provider = TextProvider([SAMPLES_PATH])
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    cred_sweeper.run(content_provider=content_provider)
+    expected = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+    try:
+        cred_sweeper = CredSweeper(ml_threshold=0.0, pool_count=2)
+        cred_sweeper.run(content_provider=content_provider)
+        # candidates are in order of the files as in a single job
+        assert expected == [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        scan_pool = ScanPool.get(2, cred_sweeper.rule_path, cred_sweeper.config_dict)
+        workers_info = scan_pool.get_workers_info()
+        assert 1 <= len(workers_info) <= 2
+        assert len(content_provider.get_scannable_files(cred_sweeper.config)) == sum(x.files for x in workers_info)
+        assert all(0 < x.busy and 0 < x.utilization <= 1 for x in workers_info)
+        # the next run does not add the candidates to previous ones and uses the same processes
+        cred_sweeper.run(content_provider=content_provider)
+        assert len(expected) == len(cred_sweeper.credential_manager.get_credentials())
+        assert scan_pool is ScanPool.get(2, cred_sweeper.rule_path, cred_sweeper.config_dict)
+        # another instance with the same spec shares the pool
+        cred_sweeper = CredSweeper(ml_threshold=0.0, pool_count=2)
+        cred_sweeper.run(content_provider=content_provider)
+        assert scan_pool is ScanPool.get(2, cred_sweeper.rule_path, cred_sweeper.config_dict)
+        # the pool is replaced for another spec
+        cred_sweeper = CredSweeper(ml_threshold=0.0, pool_count=2, depth=1)
+        cred_sweeper.run(content_provider=content_provider)
+        assert scan_pool is not ScanPool.get(2, cred_sweeper.rule_path, cred_sweeper.config_dict)
+    finally:
+        ScanPool.close_shared()
+
+
+def test_from_scan_spec_p():
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    worker_sweeper = CredSweeper.from_scan_spec(cred_sweeper.rule_path, cred_sweeper.config_dict)
+    for content_provider in TextProvider([SAMPLES_PATH]).get_scannable_files(cred_sweeper.config):
+        expected = [x.to_json() for x in cred_sweeper.file_scan(content_provider)]
+        assert expected == [x.to_json() for x in worker_sweeper.file_scan(content_provider)]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"depth": 3}, {"doc": True}, {"find_by_ext": True}])
+def test_candidates_record_p(kwargs):
+    cred_sweeper = CredSweeper(ml_threshold=0.0, **kwargs)
+    worker_sweeper = CredSweeper.from_scan_spec(cred_sweeper.rule_path, cred_sweeper.config_dict)
+    rule_ids = {rule.rule_name: i for i, rule in enumerate(get_rule_table(worker_sweeper))}
+    rules = get_rule_table(cred_sweeper)
+    candidates_size = record_size = 0
+    for index, content_provider in enumerate(TextProvider([SAMPLES_PATH]).get_scannable_files(cred_sweeper.config)):
+        candidates = worker_sweeper.file_scan(content_provider)
+        record = pickle.dumps(encode_candidates(index, candidates, rule_ids))
+        candidates_size += len(pickle.dumps((index, candidates)))
+        record_size += len(record)
+        decoded_index, rehydrated_candidates = decode_candidates(pickle.loads(record), rules, cred_sweeper.config)
+        assert index == decoded_index
+        assert [x.to_json() for x in candidates] == [x.to_json() for x in rehydrated_candidates]
+        for candidate, rehydrated in zip(candidates, rehydrated_candidates):
+            # all fields of line data are restored, the config is the one of the parent
+            assert rehydrated.config is cred_sweeper.config
+            for line_data, rehydrated_line_data in zip(candidate.line_data_list, rehydrated.line_data_list):
+                assert line_data.__getstate__()[1:] == rehydrated_line_data.__getstate__()[1:]
+    assert record_size * 10 < candidates_size
+
+
+def test_candidates_record_n():
+    cred_sweeper = CredSweeper()
+    with pytest.raises(ValueError):
+        decode_candidates((0, 0, ()), get_rule_table(cred_sweeper), cred_sweeper.config)
+
+
+def test_get_chunks_p():
+    costs = [1, 100, 5000, 1, 100, 5000] + [100] * 60
+    chunks = get_chunks(costs, 2)
+    assert sorted(range(len(costs))) == sorted(x for chunk in chunks for x in chunk)
+    # the largest files go first one by one
+    assert [[2], [5]] == chunks[:2]
+    # chunks of small files become smaller to the end
+    assert len(chunks[2]) > len(chunks[-1]) == 1
+    assert [3] == chunks[-1] or [0] == chunks[-1]
+    assert [] == get_chunks([], 2)
+
+
+def test_estimate_cost_p():
+    config = CredSweeper().config
+    deep_config = CredSweeper(depth=3).config
+    text_provider = TextContentProvider(SAMPLES_PATH / "password.gradle")
+    size = (SAMPLES_PATH / "password.gradle").stat().st_size
+    assert size == text_provider.size
+    assert FILE_COST + size == estimate_cost(text_provider, config)
+    assert 3 == TextContentProvider(("memory.txt", io.BytesIO(b"abc"))).size
+    assert 0 == TextContentProvider(SAMPLES_PATH / "not_existed_file").size
+    zip_provider = TextContentProvider(SAMPLES_PATH / "pem_key.zip")
+    # a container is skipped without deep scan
+    assert FILE_COST == estimate_cost(zip_provider, config)
+    assert FILE_COST + CONTAINER_COST_FACTOR * zip_provider.size == estimate_cost(zip_provider, deep_config)
+    diff = [{"old": None, "new": 1, "line": "password = 'Xdj@jcN834b'", "hunk": None}]
+    assert FILE_COST + 24 == estimate_cost(DiffContentProvider("a.py", DiffRowType.ADDED, diff), config)
+
+
+def test_split_text_p():
+    lines = [str(x) for x in range(1000)]
+    chunks = split_text('\n'.join(lines), 100, "path", ".txt", "info")
+    assert 10 < len(chunks)
+    scanned_lines = []
+    for chunk in chunks:
+        chunk_lines = chunk.text.split('\n')
+        # line numbers of the chunk lines are the same as in the text
+        assert lines[chunk.first_line - 1:chunk.first_line - 1 + len(chunk_lines)] == chunk_lines
+        scanned_lines.extend(chunk_lines[chunk.start:chunk.end])
+    assert lines == scanned_lines
+    assert 0 == chunks[0].start and 10 == chunks[1].start
+    assert 1 == len(split_text("password = 'Xdj@jcN834b'", 100, "", "", ""))
+
+
+@pytest.mark.parametrize("buffer_scan", [False, True])
+def test_scan_chunk_p(buffer_scan):
+    cred_sweeper = CredSweeper(buffer_scan=buffer_scan)
+    rule_order = {rule.rule_name: i for i, rule in enumerate(get_rule_table(cred_sweeper))}
+    split_number = 0
+    for content_provider in TextProvider([SAMPLES_PATH]).get_scannable_files(cred_sweeper.config):
+        expected = [x.to_json() for x in cred_sweeper.file_scan(content_provider)]
+        for chunk_size in (1, 300):
+            text_provider = TextContentProvider(content_provider.file_path, content_provider.file_type,
+                                                content_provider.info)
+            chunks = split_file(text_provider, cred_sweeper.config, chunk_size)
+            if not chunks:
+                continue
+            split_number += 1
+            candidates = [x for chunk in chunks for x in scan_chunk(cred_sweeper, chunk)]
+            candidates.sort(key=lambda x: (rule_order[x.rule_name], x.line_data_list[0].line_num))
+            assert expected == [x.to_json() for x in candidates], content_provider.file_path
+    assert 50 < split_number
+
+
+@pytest.mark.parametrize("buffer_scan", [False, True])
+def test_scan_chunk_oversize_n(buffer_scan):
+    cred_sweeper = CredSweeper(buffer_scan=buffer_scan)
+    cred_sweeper.scanner.MIN_TEXT_SCAN_SIZE = 0
+    lines = [f"line = {x}" for x in range(60)]
+    lines[30] = 'x' * 1600
+    chunks = split_text('\n'.join(lines), 100, "oversize.txt", ".txt", "info")
+    assert 3 < len(chunks)
+    with patch("logging.Logger.warning") as mocked_logger:
+        for chunk in chunks:
+            scan_chunk(cred_sweeper, chunk)
+        # the line is context of neighbour chunks, the warning is logged once with the line number of the file
+        mocked_logger.assert_called_once_with("Skipped oversize(1600) line in oversize.txt:31")
+
+
+def test_split_file_n():
+    text_provider = TextContentProvider(SAMPLES_PATH / "password.gradle")
+    assert split_file(text_provider, CredSweeper().config, 1)
+    assert not split_file(text_provider, CredSweeper().config, text_provider.size)
+    # deep scan is not split
+    assert not split_file(text_provider, CredSweeper(depth=1).config, 1)
+    assert not split_file(TextContentProvider(SAMPLES_PATH / "pem_key.zip"), CredSweeper().config, 1)
+    assert not split_file(TextContentProvider(SAMPLES_PATH / "bad.xml"), CredSweeper().config, 1)
+
+
+def test_scan_pool_chunk_size_p(tmp_path):
+    # all text samples in one large file
+    text = '\n'.join(x.get_text() or "" for x in TextProvider([SAMPLES_PATH]).get_scannable_files(CredSweeper().config)
+                     if x.file_type not in (".xml", ".zip", ".gz", ".apk", ".docx", ".pdf", ".bz2"))
+    file_path = tmp_path / "large.txt"
+    file_path.write_text(text)
+    content_provider = TextProvider([file_path])
+    cred_sweeper = CredSweeper(ml_threshold=0.0)
+    cred_sweeper.run(content_provider=content_provider)
+    expected = [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+    assert 50 < len(expected)
+    try:
+        cred_sweeper = CredSweeper(ml_threshold=0.0, pool_count=2, chunk_size=len(text) // 7)
+        cred_sweeper.run(content_provider=content_provider)
+        assert expected == [x.to_json() for x in cred_sweeper.credential_manager.get_credentials()]
+        workers_info = ScanPool.get(2, cred_sweeper.rule_path, cred_sweeper.config_dict).get_workers_info()
+        assert 7 <= sum(x.files for x in workers_info)
+    finally:
+        ScanPool.close_shared()